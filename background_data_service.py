@@ -28,6 +28,8 @@ import queue
 from concurrent.futures import ThreadPoolExecutor, Future
 import weakref
 
+from espn_http import ESPN_REQUEST_HEADERS, json_loads
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -127,13 +129,7 @@ class BackgroundDataService:
         self.session.mount("https://", requests.adapters.HTTPAdapter(max_retries=3))
 
         # Default headers
-        self.default_headers = {
-            "User-Agent": "LEDMatrix/1.0 (https://github.com/yourusername/LEDMatrix)",
-            "Accept": "application/json",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-        }
+        self.default_headers = dict(ESPN_REQUEST_HEADERS)
 
         logger.info(f"BackgroundDataService initialized with {max_workers} workers")
 
@@ -266,7 +262,7 @@ class BackgroundDataService:
             response.raise_for_status()
 
             # Parse response
-            data = response.json()
+            data = json_loads(response.content)
 
             # Validate data structure
             if not isinstance(data, dict):
@@ -19,6 +19,8 @@ from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional, List
 import pytz
 
+from espn_http import json_loads
+
 # Import the API counter function from web interface
 try:
     from web_interface_v2 import increment_api_counter
@@ -41,16 +43,18 @@ class BaseOddsManager:
     Plugins can inherit from this class to get odds functionality.
     """
 
-    def __init__(self, cache_manager, config_manager=None):
+    def __init__(self, cache_manager, config_manager=None, session: Optional[requests.Session] = None):
         """
         Initialize the base odds manager.
 
         Args:
             cache_manager: Cache manager instance for data persistence
             config_manager: Configuration manager (optional)
+            session: HTTP session to reuse pooled connections (optional)
         """
         self.cache_manager = cache_manager
         self.config_manager = config_manager
+        self.session = session if session is not None else requests.Session()
         self.logger = logging.getLogger(__name__)
         self.base_url = "https://sports.core.api.espn.com/v2/sports"
 
@@ -137,15 +141,17 @@ class BaseOddsManager:
             url = f"{self.base_url}/{sport}/leagues/{espn_league}/events/{event_id}/competitions/{event_id}/odds"
             self.logger.info(f"Requesting odds from URL: {url}")
 
-            response = requests.get(url, timeout=self.request_timeout)
+            response = self.session.get(url, timeout=self.request_timeout)
             response.raise_for_status()
-            raw_data = response.json()
+            raw_data = json_loads(response.content)
 
             # Increment API counter for odds data
             increment_api_counter("odds", 1)
-            self.logger.debug(
-                f"Received raw odds data from ESPN: {json.dumps(raw_data, indent=2)}"
-            )
+            # Pretty-printing the full payload is costly; skip it unless debugging
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"Received raw odds data from ESPN: {json.dumps(raw_data, indent=2)}"
+                )
 
             odds_data = self._extract_espn_data(raw_data)
             if odds_data:
@@ -210,9 +216,10 @@ class BaseOddsManager:
                     .get("value"),
                 },
             }
-            self.logger.debug(
-                f"Returning extracted odds data: {json.dumps(extracted_data, indent=2)}"
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"Returning extracted odds data: {json.dumps(extracted_data, indent=2)}"
+                )
             return extracted_data
 
         # Check if this is a valid empty response or an unexpected structure
@@ -12,6 +12,8 @@ import logging
 from datetime import datetime, timedelta
 import time
 
+from espn_http import json_loads
+
 class DataSource(ABC):
     """Abstract base class for data sources."""
     
@@ -71,7 +73,7 @@ class ESPNDataSource(DataSource):
             response = self.session.get(url, params={"dates": formatted_date, "limit": 1000}, headers=self.get_headers(), timeout=15)
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             events = data.get('events', [])
             
             # Filter for live games
@@ -99,7 +101,7 @@ class ESPNDataSource(DataSource):
             response = self.session.get(url, headers=self.get_headers(), params=params, timeout=15)
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             events = data.get('events', [])
             
             self.logger.debug(f"Fetched {len(events)} scheduled games for {sport}/{league}")
@@ -117,7 +119,7 @@ class ESPNDataSource(DataSource):
             response = self.session.get(url, headers=self.get_headers(), timeout=15)
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             self.logger.debug(f"Fetched standings for {sport}/{league}")
             return data
         except Exception as e:
@@ -128,7 +130,7 @@ class ESPNDataSource(DataSource):
                     response = self.session.get(url, headers=self.get_headers(), timeout=15)
                     response.raise_for_status()
                     
-                    data = response.json()
+                    data = json_loads(response.content)
                     self.logger.debug(f"Fetched rankings for {sport}/{league} (fallback)")
                     return data
                 except Exception:
@@ -161,7 +163,7 @@ class MLBAPIDataSource(DataSource):
             response = self.session.get(url, headers=self.get_headers(), params=params, timeout=15)
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             games = data.get('dates', [{}])[0].get('games', [])
             
             # Filter for live games
@@ -191,7 +193,7 @@ class MLBAPIDataSource(DataSource):
             response = self.session.get(url, headers=self.get_headers(), params=params, timeout=15)
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             all_games = []
             for date_data in data.get('dates', []):
                 all_games.extend(date_data.get('games', []))
@@ -216,7 +218,7 @@ class MLBAPIDataSource(DataSource):
             response = self.session.get(url, headers=self.get_headers(), params=params, timeout=15)
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             self.logger.debug(f"Fetched standings from MLB API")
             return data
             
@@ -253,7 +255,7 @@ class SoccerAPIDataSource(DataSource):
             response = self.session.get(url, headers=self.get_headers(), params=params, timeout=15)
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             matches = data.get('matches', [])
             
             self.logger.debug(f"Fetched {len(matches)} live games from soccer API")
@@ -278,7 +280,7 @@ class SoccerAPIDataSource(DataSource):
             response = self.session.get(url, headers=self.get_headers(), params=params, timeout=15)
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             matches = data.get('matches', [])
             
             self.logger.debug(f"Fetched {len(matches)} scheduled games from soccer API")
@@ -295,7 +297,7 @@ class SoccerAPIDataSource(DataSource):
             response = self.session.get(url, headers=self.get_headers(), timeout=15)
             response.raise_for_status()
             
-            data = response.json()
+            data = json_loads(response.content)
             self.logger.debug(f"Fetched standings from soccer API")
             return data
             
@@ -28,15 +28,17 @@ class DynamicTeamResolver:
     # Cache duration in seconds (1 hour)
     CACHE_DURATION = 3600
     
-    def __init__(self, cache_manager=None, request_timeout: int = 30):
+    def __init__(self, cache_manager=None, request_timeout: int = 30, session: Optional[requests.Session] = None):
         """Initialize the dynamic team resolver.
         
         Args:
             cache_manager: Optional cache manager instance for storing rankings cache
             request_timeout: Timeout for API requests in seconds
+            session: Optional HTTP session to reuse pooled connections
         """
         self.cache_manager = cache_manager
         self.request_timeout = request_timeout
+        self.session = session if session is not None else requests.Session()
         self.logger = logger
         
     def resolve_teams(self, team_list: List[str], sport: str = 'ncaa_fb') -> List[str]:
@@ -147,7 +149,7 @@ class DynamicTeamResolver:
                 'Accept': 'application/json'
             }
             
-            response = requests.get(url, headers=headers, timeout=self.request_timeout)
+            response = self.session.get(url, headers=headers, timeout=self.request_timeout)
             response.raise_for_status()
             
             data = response.json()
@@ -0,0 +1,95 @@
+"""
+Shared HTTP plumbing for ESPN requests.
+
+Every league/mode manager, the logo downloader and the background data
+service talk to the same ESPN endpoints, so the pooled session, the
+request headers and the JSON decoder live here, in one place, for all of them.
+"""
+
+import json
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+# orjson decodes the large ESPN scoreboard payloads several times faster than
+# the stdlib; fall back to json when it is not installed.
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Shared read-only default for .get() chains on ESPN payloads, so a missing
+# key doesn't build a fresh {} on every call. Never mutate it.
+EMPTY_DICT: Dict[str, Any] = {}
+
+# Default headers for ESPN requests. Read-only; copy before adding
+# per-request headers.
+ESPN_REQUEST_HEADERS: Dict[str, str] = {
+    "User-Agent": "LEDMatrix/1.0 (https://github.com/yourusername/LEDMatrix; contact@example.com)",
+    "Accept": "application/json",
+    "Accept-Language": "en-US,en;q=0.9",
+    # Only codecs urllib3 can decode here; brotli ("br") when it is installed
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Connection": "keep-alive",
+}
+
+# Process-wide HTTP session shared by every league/mode manager so ESPN
+# connections (TCP + TLS) are pooled and reused across NFL and NCAA FB fetches.
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def _mount_adapters(session: requests.Session) -> None:
+    """Mount fresh pooled, retrying adapters on session."""
+    retry_strategy = Retry(
+        total=5,  # increased number of retries
+        backoff_factor=1,  # increased backoff factor
+        # added 429 to retry list
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "HEAD", "OPTIONS"],
+    )
+    adapter = HTTPAdapter(
+        pool_connections=4, pool_maxsize=4, max_retries=retry_strategy
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def get_shared_session() -> requests.Session:
+    """
+    Get the shared HTTP session, creating it on first use.
+
+    requests.Session is safe to use from the concurrent league updates as
+    long as its configuration is not mutated after creation.
+    """
+    global _shared_session
+
+    with _shared_session_lock:
+        if _shared_session is None:
+            session = requests.Session()
+            _mount_adapters(session)
+            _shared_session = session
+
+        return _shared_session
+
+
+def close_shared_session() -> None:
+    """
+    Release the shared session's pooled connections (plugin teardown).
+
+    Managers, odds managers and team resolvers keep a reference to the
+    session, and may outlive the teardown (in-flight updates, or a plugin
+    reloaded in the same process). So the same Session object is reset
+    with fresh adapters instead of being discarded, and any holder can
+    keep using it.
+    """
+    with _shared_session_lock:
+        if _shared_session is not None:
+            _shared_session.close()
+            _mount_adapters(_shared_session)
@@ -1,11 +1,82 @@
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timezone, timedelta
+import functools
 import logging
-from PIL import Image, ImageDraw, ImageFont
+import re
+from PIL import ImageFont
 import time
 from sports import SportsCore, SportsLive
+from game_renderer import (
+    FOOTBALL_RADIUS_X,
+    SCORING_EVENT_COLORS,
+    get_text_bbox,
+    get_text_width,
+    get_timeout_positions,
+    load_truetype_font,
+    paste_football,
+    paste_timeout_strips,
+)
 from data_sources import ESPNDataSource
 
+# Scoring event keywords, in priority order. The long status detail is checked
+# before the short one; only the detail text spells out "point after".
+_DETAIL_SCORING_PATTERNS = (
+    (re.compile(r"touchdown|td", re.IGNORECASE), "TOUCHDOWN"),
+    (re.compile(r"field goal|fg", re.IGNORECASE), "FIELD GOAL"),
+    (re.compile(r"extra point|pat|point after", re.IGNORECASE), "PAT"),
+)
+_SHORT_SCORING_PATTERNS = (
+    (re.compile(r"touchdown|td", re.IGNORECASE), "TOUCHDOWN"),
+    (re.compile(r"field goal|fg", re.IGNORECASE), "FIELD GOAL"),
+    (re.compile(r"extra point|pat", re.IGNORECASE), "PAT"),
+)
+
+
+def _any_keyword(patterns) -> re.Pattern:
+    """Combine a pattern table into one alternation that tests for any keyword."""
+    return re.compile("|".join(pattern.pattern for pattern, _ in patterns), re.IGNORECASE)
+
+
+# Most status text mentions no score at all, so a single scan for any keyword
+# rules that out before the priority-ordered patterns run.
+_DETAIL_SCORING_ANY = _any_keyword(_DETAIL_SCORING_PATTERNS)
+_SHORT_SCORING_ANY = _any_keyword(_SHORT_SCORING_PATTERNS)
+
+
+# Live games repeat the same status text across updates, so results are memoized
+@functools.lru_cache(maxsize=256)
+def detect_scoring_event(status_detail: str, status_short: str) -> str:
+    """Return TOUCHDOWN / FIELD GOAL / PAT if the status text mentions one, else ''."""
+    for text, any_pattern, patterns in (
+        (status_detail, _DETAIL_SCORING_ANY, _DETAIL_SCORING_PATTERNS),
+        (status_short, _SHORT_SCORING_ANY, _SHORT_SCORING_PATTERNS),
+    ):
+        if text and any_pattern.search(text):
+            for pattern, event in patterns:
+                if pattern.search(text):
+                    return event
+    return ""
+
+
+# Period labels for in-progress games, indexed by ESPN period number
+# (0 = before kickoff, 5+ = overtime); longer overtimes are formatted on demand.
+_LIVE_PERIOD_TEXT = ("Start", "Q1", "Q2", "Q3", "Q4", "OT1", "OT2", "OT3", "OT4")
+
+
+def format_period_text(state: str, status_name: str, period: int, game_time: str) -> str:
+    """Return the quarter/status label shown on the scorebug for an ESPN game status."""
+    if state == "in":
+        if 0 <= period < len(_LIVE_PERIOD_TEXT):
+            return _LIVE_PERIOD_TEXT[period]
+        return f"OT{period - 4}" if period > 4 else ""
+    if state == "halftime" or status_name == "STATUS_HALFTIME":
+        return "HALF"
+    if state == "post":
+        return "Final/OT" if period > 4 else "Final"
+    if state == "pre":
+        return game_time # Show time for upcoming
+    return ""
+
 class Football(SportsCore):
     """Base class for football sports with common functionality."""
     
@@ -20,8 +91,9 @@ class Football(SportsCore):
         if details is None or home_team is None or away_team is None or status is None:
             return
         try:
-            competition = game_event["competitions"][0]
-            status = competition["status"]
+            # status is the competition status returned by the common extractor;
+            # its state is already flattened into details["state"]
+            state = details["state"]
 
             # --- Football Specific Details (Likely same for NFL/NCAAFB) ---
             down_distance_text = ""
@@ -33,31 +105,21 @@ class Football(SportsCore):
             is_redzone = False
             posession = None
 
-            if situation and status["type"]["state"] == "in":
+            if situation and state == "in":
                 # down = situation.get("down")
                 down_distance_text = situation.get("shortDownDistanceText")
                 down_distance_text_long = situation.get("downDistanceText")
                 # distance = situation.get("distance")
                 
-                # Detect scoring events from status detail
-                status_detail = status["type"].get("detail", "").lower()
-                status_short = status["type"].get("shortDetail", "").lower()
                 is_redzone = situation.get("isRedZone")
                 posession = situation.get("possession")
                 
-                # Check for scoring events in status text
-                if any(keyword in status_detail for keyword in ["touchdown", "td"]):
-                    scoring_event = "TOUCHDOWN"
-                elif any(keyword in status_detail for keyword in ["field goal", "fg"]):
-                    scoring_event = "FIELD GOAL"
-                elif any(keyword in status_detail for keyword in ["extra point", "pat", "point after"]):
-                    scoring_event = "PAT"
-                elif any(keyword in status_short for keyword in ["touchdown", "td"]):
-                    scoring_event = "TOUCHDOWN"
-                elif any(keyword in status_short for keyword in ["field goal", "fg"]):
-                    scoring_event = "FIELD GOAL"
-                elif any(keyword in status_short for keyword in ["extra point", "pat"]):
-                    scoring_event = "PAT"
+                # Detect scoring events from status text once, at extraction time;
+                # the scorebug just reads details["scoring_event"] every frame
+                scoring_event = detect_scoring_event(
+                    status["type"].get("detail", ""),
+                    status["type"].get("shortDetail", ""),
+                )
 
                 # Determine possession based on team ID
                 possession_team_id = situation.get("possession")
@@ -73,35 +135,19 @@ class Football(SportsCore):
 
             # Format period/quarter
             period = status.get("period", 0)
-            period_text = ""
-            if status["type"]["state"] == "in":
-                if period == 0:
-                    period_text = "Start" # Before kickoff
-                elif period >= 1 and period <= 4:
-                    period_text = f"Q{period}" # OT starts after Q4
-                elif period > 4:
-                    period_text = f"OT{period - 4}" # OT starts after Q4
-            elif status["type"]["state"] == "halftime" or status["type"]["name"] == "STATUS_HALFTIME": # Check explicit halftime state
-                period_text = "HALF"
-            elif status["type"]["state"] == "post":
-                 if period > 4 : period_text = "Final/OT"
-                 else: period_text = "Final"
-            elif status["type"]["state"] == "pre":
-                period_text = details.get("game_time", "") # Show time for upcoming
-
-            details.update({
-                "period": period,
-                "period_text": period_text, # Formatted quarter/status
-                "clock": status.get("displayClock", "0:00"),
-                "home_timeouts": home_timeouts,
-                "away_timeouts": away_timeouts,
-                "down_distance_text": down_distance_text, # Added Down/Distance
-                "down_distance_text_long": down_distance_text_long,
-                "is_redzone": is_redzone,
-                "possession": posession, # ID of team with possession
-                "possession_indicator": possession_indicator, # Added for easy home/away check
-                "scoring_event": scoring_event, # Track scoring events (TOUCHDOWN, FIELD GOAL, PAT)
-            })
+            period_text = format_period_text(state, details["status_name"], period, details.get("game_time", ""))
+
+            details["period"] = period
+            details["period_text"] = period_text # Formatted quarter/status
+            details["clock"] = status.get("displayClock", "0:00")
+            details["home_timeouts"] = home_timeouts
+            details["away_timeouts"] = away_timeouts
+            details["down_distance_text"] = down_distance_text # Added Down/Distance
+            details["down_distance_text_long"] = down_distance_text_long
+            details["is_redzone"] = is_redzone
+            details["possession"] = posession # ID of team with possession
+            details["possession_indicator"] = possession_indicator # Added for easy home/away check
+            details["scoring_event"] = scoring_event # Track scoring events (TOUCHDOWN, FIELD GOAL, PAT)
 
             # Basic validation (can be expanded)
             if not details['home_abbr'] or not details['away_abbr']:
@@ -119,6 +165,58 @@ class Football(SportsCore):
 class FootballLive(Football, SportsLive):
     def __init__(self, config: Dict[str, Any], display_manager, cache_manager, logger: logging.Logger, sport_key: str):
         super().__init__(config, display_manager, cache_manager, logger, sport_key)
+        # Scorebug positions for the current matrix size (see _get_scorebug_geometry)
+        self._scorebug_geometry: Optional[Dict[str, Any]] = None
+
+    # Game fields drawn on the live scorebug overlay
+    _SCOREBUG_FIELDS = (
+        "home_score", "away_score", "period_text", "clock", "status_text",
+        "is_live", "is_halftime", "is_period_break", "scoring_event",
+        "down_distance_text", "down_distance_text_long", "is_redzone",
+        "possession_indicator", "away_timeouts", "home_timeouts", "odds",
+        "away_record", "home_record",
+    )
+
+    def _get_scorebug_geometry(self, display_width: int, display_height: int) -> Dict[str, Any]:
+        """
+        Get the scorebug positions that depend only on matrix size and layout config.
+
+        The matrix geometry and layout offsets are fixed for the life of the manager,
+        so these are computed once and only recomputed if the matrix size changes.
+        """
+        geometry = self._scorebug_geometry
+        if geometry is not None and geometry["size"] == (display_width, display_height):
+            return geometry
+
+        status_x_offset = self._get_layout_offset('status_text', 'x_offset')
+        status_y_offset = self._get_layout_offset('status_text', 'y_offset')
+        center_y = display_height // 2
+        try:
+            record_font = load_truetype_font("assets/fonts/4x6-font.ttf", 6)
+        except IOError:
+            record_font = ImageFont.load_default()
+            self.logger.warning(f"Failed to load 6px font, using default font (size: {record_font.size})")
+        record_bbox = get_text_bbox("0-0", record_font)
+        geometry = {
+            "size": (display_width, display_height),
+            "center_y": center_y,
+            "home_logo_offset": (self._get_layout_offset('home_logo', 'x_offset'), self._get_layout_offset('home_logo', 'y_offset')),
+            "away_logo_offset": (self._get_layout_offset('away_logo', 'x_offset'), self._get_layout_offset('away_logo', 'y_offset')),
+            "score_x_offset": self._get_layout_offset('score', 'x_offset'),
+            "score_y": center_y - 3 + self._get_layout_offset('score', 'y_offset'),
+            "status_x_offset": status_x_offset,
+            "status_y": 1 + status_y_offset, # Position at top
+            "bottom_text_y": display_height - 7,
+            "dd_y": display_height - 7 + status_y_offset, # Top of D&D text
+            "is_wide": display_width > 128,
+            # (away, home) top-left corners of the timeout strips (bottom edge)
+            "timeout_positions": get_timeout_positions(display_width, display_height),
+            # Record/ranking text font and its top edge (bottom corners)
+            "record_font": record_font,
+            "record_y": display_height - (record_bbox[3] - record_bbox[1]) - 4,
+        }
+        self._scorebug_geometry = geometry
+        return geometry
 
     def _test_mode_update(self):
         if self.current_game and self.current_game["is_live"]:
@@ -170,32 +268,45 @@ class FootballLive(Football, SportsLive):
             display_width = self.display_manager.matrix.width if hasattr(self.display_manager, 'matrix') and self.display_manager.matrix else self.display_width
             display_height = self.display_manager.matrix.height if hasattr(self.display_manager, 'matrix') and self.display_manager.matrix else self.display_height
             
-            main_img = Image.new('RGBA', (display_width, display_height), (0, 0, 0, 255))
-            overlay = Image.new('RGBA', (display_width, display_height), (0, 0, 0, 0))
-            draw_overlay = ImageDraw.Draw(overlay) # Draw text elements on overlay first
-
             home_logo = self._load_and_resize_logo(game["home_id"], game["home_abbr"], game["home_logo_path"], game.get("home_logo_url"))
             away_logo = self._load_and_resize_logo(game["away_id"], game["away_abbr"], game["away_logo_path"], game.get("away_logo_url"))
 
             if not home_logo or not away_logo:
                 self.logger.error(f"Failed to load logos for live game: {game.get('id')}") # Changed log prefix
                 # Draw placeholder text if logos fail
-                draw_final = ImageDraw.Draw(main_img.convert('RGB'))
-                self._draw_text_with_outline(draw_final, "Logo Error", (5,5), self.fonts['status'])
-                self.display_manager.image.paste(main_img.convert('RGB'), (0, 0))
+                self.display_manager.image = self._compose_output_frame(
+                    self._get_message_frame("Logo Error", (display_width, display_height))
+                )
                 self.display_manager.update_display()
                 return
 
-            center_y = display_height // 2
+            geometry = self._get_scorebug_geometry(display_width, display_height)
+            center_y = geometry["center_y"]
 
             # Draw logos (shifted slightly more inward than NHL perhaps) with layout offsets
-            home_x = display_width - home_logo.width + 10 + self._get_layout_offset('home_logo', 'x_offset') #adjusted from 18 # Adjust position as needed
-            home_y = center_y - (home_logo.height // 2) + self._get_layout_offset('home_logo', 'y_offset')
-            main_img.paste(home_logo, (home_x, home_y), home_logo)
+            home_x_offset, home_y_offset = geometry["home_logo_offset"]
+            home_x = display_width - home_logo.width + 10 + home_x_offset #adjusted from 18 # Adjust position as needed
+            home_y = center_y - (home_logo.height // 2) + home_y_offset
+
+            away_x_offset, away_y_offset = geometry["away_logo_offset"]
+            away_x = -10 + away_x_offset #adjusted from 18 # Adjust position as needed
+            away_y = center_y - (away_logo.height // 2) + away_y_offset
+            # Logos only change with the matchup; reuse the cached logo frame
+            main_img = self._get_logo_base_frame(
+                (display_width, display_height),
+                game["home_abbr"], home_logo, (home_x, home_y),
+                game["away_abbr"], away_logo, (away_x, away_y),
+            )
+
+            scorebug_state = self._get_scorebug_state(game)
+            if self._is_scorebug_current(main_img, scorebug_state, force_clear):
+                self.display_manager.update_display()
+                return
 
-            away_x = -10 + self._get_layout_offset('away_logo', 'x_offset') #adjusted from 18 # Adjust position as needed
-            away_y = center_y - (away_logo.height // 2) + self._get_layout_offset('away_logo', 'y_offset')
-            main_img.paste(away_logo, (away_x, away_y), away_logo)
+            # Draw text elements on the (cleared) overlay first
+            overlay, draw_overlay = self._get_overlay_canvas((display_width, display_height))
+            fonts = self.fonts
+            score_font, time_font, detail_font = fonts['score'], fonts['time'], fonts['detail']
 
             # --- Draw Text Elements on Overlay ---
             # Note: Rankings are now handled in the records/rankings section below
@@ -204,10 +315,10 @@ class FootballLive(Football, SportsLive):
             home_score = str(game.get("home_score", "0"))
             away_score = str(game.get("away_score", "0"))
             score_text = f"{away_score}-{home_score}"
-            score_width = draw_overlay.textlength(score_text, font=self.fonts['score'])
-            score_x = (display_width - score_width) // 2 + self._get_layout_offset('score', 'x_offset')
-            score_y = (display_height // 2) - 3 + self._get_layout_offset('score', 'y_offset') #centered #from 14 # Position score higher
-            self._draw_text_with_outline(draw_overlay, score_text, (score_x, score_y), self.fonts['score'])
+            score_width = get_text_width(score_text, score_font)
+            score_x = (display_width - score_width) // 2 + geometry["score_x_offset"]
+            score_y = geometry["score_y"] #centered #from 14 # Position score higher
+            self._draw_text_with_outline(draw_overlay, score_text, (score_x, score_y), score_font)
 
             # Period/Quarter and Clock (Top center)
             period_clock_text = f"{game.get('period_text', '')} {game.get('clock', '')}".strip()
@@ -216,49 +327,39 @@ class FootballLive(Football, SportsLive):
             elif game.get("is_period_break"):
                 period_clock_text = game.get("status_text", "Period Break")
 
-            status_width = draw_overlay.textlength(period_clock_text, font=self.fonts['time'])
-            status_x = (display_width - status_width) // 2 + self._get_layout_offset('status_text', 'x_offset')
-            status_y = 1 + self._get_layout_offset('status_text', 'y_offset') # Position at top
-            self._draw_text_with_outline(draw_overlay, period_clock_text, (status_x, status_y), self.fonts['time'])
+            status_width = get_text_width(period_clock_text, time_font)
+            status_x = (display_width - status_width) // 2 + geometry["status_x_offset"]
+            status_y = geometry["status_y"] # Position at top
+            self._draw_text_with_outline(draw_overlay, period_clock_text, (status_x, status_y), time_font)
 
             # Down & Distance or Scoring Event (Below Period/Clock)
             scoring_event = game.get("scoring_event", "")
             down_distance = game.get("down_distance_text", "")
-            if display_width > 128:
+            if geometry["is_wide"]:
                 down_distance = game.get("down_distance_text_long", "")
             
             # Show scoring event if detected, otherwise show down & distance
             if scoring_event and game.get("is_live"):
                 # Display scoring event with special formatting
-                event_width = draw_overlay.textlength(scoring_event, font=self.fonts['detail'])
+                event_width = get_text_width(scoring_event, detail_font)
                 event_x = (display_width - event_width) // 2
-                event_y = (display_height) - 7
+                event_y = geometry["bottom_text_y"]
                 
                 # Color coding for different scoring events
-                if scoring_event == "TOUCHDOWN":
-                    event_color = (255, 215, 0)  # Gold
-                elif scoring_event == "FIELD GOAL":
-                    event_color = (0, 255, 0)    # Green
-                elif scoring_event == "PAT":
-                    event_color = (255, 165, 0)  # Orange
-                else:
-                    event_color = (255, 255, 255)  # White
+                event_color = SCORING_EVENT_COLORS.get(scoring_event, (255, 255, 255))  # White
                 
-                self._draw_text_with_outline(draw_overlay, scoring_event, (event_x, event_y), self.fonts['detail'], fill=event_color)
+                self._draw_text_with_outline(draw_overlay, scoring_event, (event_x, event_y), detail_font, fill=event_color)
             elif down_distance and game.get("is_live"): # Only show if live and available
-                dd_width = draw_overlay.textlength(down_distance, font=self.fonts['detail'])
-                dd_x = (display_width - dd_width) // 2 + self._get_layout_offset('status_text', 'x_offset')
-                dd_y = (display_height)- 7 + self._get_layout_offset('status_text', 'y_offset') # Top of D&D text
+                dd_width = get_text_width(down_distance, detail_font)
+                dd_x = (display_width - dd_width) // 2 + geometry["status_x_offset"]
+                dd_y = geometry["dd_y"] # Top of D&D text
                 down_color = (200, 200, 0) if not game.get("is_redzone", False) else (255,0,0) # Yellowish text
-                self._draw_text_with_outline(draw_overlay, down_distance, (dd_x, dd_y), self.fonts['detail'], fill=down_color)
+                self._draw_text_with_outline(draw_overlay, down_distance, (dd_x, dd_y), detail_font, fill=down_color)
 
                 # Possession Indicator (small football icon)
                 possession = game.get("possession_indicator")
                 if possession: # Only draw if possession is known
-                    ball_radius_x = 3  # Wider for football shape
-                    ball_radius_y = 2  # Shorter for football shape
-                    ball_color = (139, 69, 19) # Brown color for the football
-                    lace_color = (255, 255, 255) # White for laces
+                    ball_radius_x = FOOTBALL_RADIUS_X  # Wider for football shape
 
                     # Approximate height of the detail font (4x6 font at size 6 is roughly 6px tall)
                     detail_font_height_approx = 6
@@ -275,38 +376,12 @@ class FootballLive(Football, SportsLive):
                     else:
                         ball_x_center = 0 # Should not happen / no indicator
 
-                    if ball_x_center > 0: # Draw if position is valid
-                        # Draw the football shape (ellipse)
-                        draw_overlay.ellipse(
-                            (ball_x_center - ball_radius_x, ball_y_center - ball_radius_y,  # x0, y0
-                             ball_x_center + ball_radius_x, ball_y_center + ball_radius_y), # x1, y1
-                            fill=ball_color, outline=(0,0,0)
-                        )
-                        # Draw a simple horizontal lace
-                        draw_overlay.line(
-                            (ball_x_center - 1, ball_y_center, ball_x_center + 1, ball_y_center),
-                            fill=lace_color, width=1
-                        )
-
-            # Timeouts (Bottom corners) - 3 small bars per team
-            timeout_bar_width = 4
-            timeout_bar_height = 2
-            timeout_spacing = 1
-            timeout_y = display_height - timeout_bar_height - 1 # Bottom edge
-
-            # Away Timeouts (Bottom Left)
-            away_timeouts_remaining = game.get("away_timeouts", 0)
-            for i in range(3):
-                to_x = 2 + i * (timeout_bar_width + timeout_spacing)
-                color = (255, 255, 255) if i < away_timeouts_remaining else (80, 80, 80) # White if available, gray if used
-                draw_overlay.rectangle([to_x, timeout_y, to_x + timeout_bar_width, timeout_y + timeout_bar_height], fill=color, outline=(0,0,0))
-
-             # Home Timeouts (Bottom Right)
-            home_timeouts_remaining = game.get("home_timeouts", 0)
-            for i in range(3):
-                to_x = display_width - 2 - timeout_bar_width - (2-i) * (timeout_bar_width + timeout_spacing)
-                color = (255, 255, 255) if i < home_timeouts_remaining else (80, 80, 80) # White if available, gray if used
-                draw_overlay.rectangle([to_x, timeout_y, to_x + timeout_bar_width, timeout_y + timeout_bar_height], fill=color, outline=(0,0,0))
+                    # Draw if position is valid and the ball is not entirely right of the screen
+                    if 0 < ball_x_center < display_width + ball_radius_x:
+                        paste_football(overlay, ball_x_center, ball_y_center)
+
+            # Timeouts (Bottom corners) - 3 small bars per team, pre-rendered as one strip
+            paste_timeout_strips(overlay, game, geometry["timeout_positions"]) # Bottom corners
 
             # Draw odds if available
             if 'odds' in game and game['odds']:
@@ -314,86 +389,40 @@ class FootballLive(Football, SportsLive):
 
             # Draw records or rankings if enabled
             if self.show_records or self.show_ranking:
-                try:
-                    record_font = ImageFont.truetype("assets/fonts/4x6-font.ttf", 6)
-                    self.logger.debug(f"Loaded 6px record font successfully")
-                except IOError:
-                    record_font = ImageFont.load_default()
-                    self.logger.warning(f"Failed to load 6px font, using default font (size: {record_font.size})")
+                record_font = geometry["record_font"]
+                record_y = geometry["record_y"]
                 
                 # Get team abbreviations
                 away_abbr = game.get('away_abbr', '')
                 home_abbr = game.get('home_abbr', '')
-                
-                record_bbox = draw_overlay.textbbox((0,0), "0-0", font=record_font)
-                record_height = record_bbox[3] - record_bbox[1]
-                record_y = display_height - record_height - 4
-                self.logger.debug(f"Record positioning: height={record_height}, record_y={record_y}, display_height={display_height}")
 
                 # Display away team info
                 if away_abbr:
-                    if self.show_ranking and self.show_records:
-                        # When both rankings and records are enabled, rankings replace records completely
-                        away_rank = self._team_rankings_cache.get(away_abbr, 0)
-                        if away_rank > 0:
-                            away_text = f"#{away_rank}"
-                        else:
-                            # Show nothing for unranked teams when rankings are prioritized
-                            away_text = ''
-                    elif self.show_ranking:
-                        # Show ranking only if available
-                        away_rank = self._team_rankings_cache.get(away_abbr, 0)
-                        if away_rank > 0:
-                            away_text = f"#{away_rank}"
-                        else:
-                            away_text = ''
-                    elif self.show_records:
-                        # Show record only when rankings are disabled
-                        away_text = game.get('away_record', '')
-                    else:
-                        away_text = ''
+                    away_text = self._get_team_display_text(away_abbr, game.get('away_record', ''))
                     
                     if away_text:
                         away_record_x = 3
-                        self.logger.debug(f"Drawing away ranking '{away_text}' at ({away_record_x}, {record_y}) with font size {record_font.size if hasattr(record_font, 'size') else 'unknown'}")
+                        self.logger.debug("Drawing away ranking '%s' at (%s, %s)", away_text, away_record_x, record_y)
                         self._draw_text_with_outline(draw_overlay, away_text, (away_record_x, record_y), record_font)
 
                 # Display home team info
                 if home_abbr:
-                    if self.show_ranking and self.show_records:
-                        # When both rankings and records are enabled, rankings replace records completely
-                        home_rank = self._team_rankings_cache.get(home_abbr, 0)
-                        if home_rank > 0:
-                            home_text = f"#{home_rank}"
-                        else:
-                            # Show nothing for unranked teams when rankings are prioritized
-                            home_text = ''
-                    elif self.show_ranking:
-                        # Show ranking only if available
-                        home_rank = self._team_rankings_cache.get(home_abbr, 0)
-                        if home_rank > 0:
-                            home_text = f"#{home_rank}"
-                        else:
-                            home_text = ''
-                    elif self.show_records:
-                        # Show record only when rankings are disabled
-                        home_text = game.get('home_record', '')
-                    else:
-                        home_text = ''
+                    home_text = self._get_team_display_text(home_abbr, game.get('home_record', ''))
                     
                     if home_text:
-                        home_record_bbox = draw_overlay.textbbox((0,0), home_text, font=record_font)
+                        home_record_bbox = get_text_bbox(home_text, record_font)
                         home_record_width = home_record_bbox[2] - home_record_bbox[0]
                         home_record_x = display_width - home_record_width - 3
-                        self.logger.debug(f"Drawing home ranking '{home_text}' at ({home_record_x}, {record_y}) with font size {record_font.size if hasattr(record_font, 'size') else 'unknown'}")
+                        self.logger.debug("Drawing home ranking '%s' at (%s, %s)", home_text, home_record_x, record_y)
                         self._draw_text_with_outline(draw_overlay, home_text, (home_record_x, record_y), record_font)
 
             # Composite the text overlay onto the main image
-            main_img = Image.alpha_composite(main_img, overlay)
-            main_img = main_img.convert('RGB') # Convert for display
+            base_img = main_img
+            main_img = self._compose_output_frame(main_img, overlay) # RGB for display
 
             # Display the final image - assign directly like weather plugin does for full display coverage
             self.display_manager.image = main_img
+            self._last_scorebug = (base_img, scorebug_state)
             self.display_manager.update_display() # Update display here for live
 
         except Exception as e:
@@ -11,11 +11,14 @@ This module provides:
 - Consistent rendering across all display modes
 """
 
+import functools
 import logging
+import math
 import os
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, Union
-from PIL import Image, ImageDraw, ImageFont
+from typing import Dict, Any, List, Optional, Tuple, Union
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
 try:
     import freetype
     FREETYPE_AVAILABLE = True
@@ -25,6 +28,373 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+class BoundedCache(dict):
+    """
+    Memo dict holding at most maxsize entries; the oldest insert is dropped first.
+    
+    Reads are plain dict lookups. put() may be called from several threads.
+    For results of a pure function of hashable arguments, use
+    functools.lru_cache instead.
+    """
+    
+    __slots__ = ('maxsize', '_lock')
+    
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+    
+    def put(self, key: Any, value: Any) -> Any:
+        """Store value under key, evicting the oldest entry when full; returns value."""
+        with self._lock:
+            if key not in self and len(self) >= self.maxsize:
+                self.pop(next(iter(self)), None)
+            self[key] = value
+        return value
+
+# Resampling filters selectable via customization.resample_filter for logo downscaling.
+# BICUBIC is the default: on an LED matrix it is indistinguishable from LANCZOS and cheaper.
+LOGO_RESAMPLE_FILTERS = {
+    'nearest': Image.Resampling.NEAREST,
+    'bilinear': Image.Resampling.BILINEAR,
+    'bicubic': Image.Resampling.BICUBIC,
+    'lanczos': Image.Resampling.LANCZOS,
+}
+
+# Timeout indicator bar geometry (pixels)
+TIMEOUT_BAR_WIDTH = 4
+TIMEOUT_BAR_HEIGHT = 2
+TIMEOUT_SPACING = 1
+TIMEOUT_STEP = TIMEOUT_BAR_WIDTH + TIMEOUT_SPACING
+TIMEOUT_STRIP_WIDTH = 2 * TIMEOUT_STEP + TIMEOUT_BAR_WIDTH + 1
+TIMEOUT_AVAILABLE_COLOR = (255, 255, 255)
+TIMEOUT_USED_COLOR = (80, 80, 80)
+TIMEOUT_OUTLINE_COLOR = (0, 0, 0)
+
+
+def _build_timeout_strip(remaining: int) -> Image.Image:
+    """Render one team's three outlined timeout bars (white = available, gray = used)."""
+    # The black strip doubles as every bar's 1px outline; only the bar interiors are filled
+    strip = Image.new('RGBA', (TIMEOUT_STRIP_WIDTH, TIMEOUT_BAR_HEIGHT + 1), TIMEOUT_OUTLINE_COLOR + (255,))
+    for i in range(3):
+        x = i * TIMEOUT_STEP
+        strip.paste(
+            TIMEOUT_AVAILABLE_COLOR if i < remaining else TIMEOUT_USED_COLOR,
+            (x + 1, 1, x + TIMEOUT_BAR_WIDTH, TIMEOUT_BAR_HEIGHT)
+        )
+    return strip
+
+
+# Possession indicator geometry (ellipse radii, pixels)
+FOOTBALL_RADIUS_X = 3
+FOOTBALL_RADIUS_Y = 2
+
+
+def _draw_football(draw: ImageDraw.ImageDraw, center_x: float, center_y: float) -> None:
+    """Draw the possession indicator (brown ball with a white lace) centred at (center_x, center_y)."""
+    draw.ellipse(
+        (center_x - FOOTBALL_RADIUS_X, center_y - FOOTBALL_RADIUS_Y,
+         center_x + FOOTBALL_RADIUS_X, center_y + FOOTBALL_RADIUS_Y),
+        fill=(139, 69, 19), outline=(0, 0, 0)  # Brown
+    )
+    draw.line(
+        (center_x - 1, center_y, center_x + 1, center_y),
+        fill=(255, 255, 255), width=1  # White lace
+    )
+
+
+# Shared possession sprite; paste its top-left at (center_x - 3, center_y - 2)
+FOOTBALL_SPRITE = Image.new('RGBA', (2 * FOOTBALL_RADIUS_X + 1, 2 * FOOTBALL_RADIUS_Y + 1), (0, 0, 0, 0))
+_draw_football(ImageDraw.Draw(FOOTBALL_SPRITE), FOOTBALL_RADIUS_X, FOOTBALL_RADIUS_Y)
+
+
+def paste_football(overlay: Image.Image, center_x: float, center_y: float) -> None:
+    """
+    Draw the possession indicator onto overlay centred at (center_x, center_y).
+    
+    A whole-pixel centre blits FOOTBALL_SPRITE, which gives the same pixels as
+    drawing the ellipse there. A fractional centre (text widths from
+    textlength) rasterizes differently, so it is still drawn directly.
+    """
+    if center_x == int(center_x) and center_y == int(center_y):
+        overlay.paste(
+            FOOTBALL_SPRITE,
+            (int(center_x) - FOOTBALL_RADIUS_X, int(center_y) - FOOTBALL_RADIUS_Y),
+            FOOTBALL_SPRITE
+        )
+    else:
+        _draw_football(ImageDraw.Draw(overlay), center_x, center_y)
+
+# Text colors for detected scoring events; anything else is drawn white
+SCORING_EVENT_COLORS = {
+    "TOUCHDOWN": (255, 215, 0),   # Gold
+    "FIELD GOAL": (0, 255, 0),    # Green
+    "PAT": (255, 165, 0),         # Orange
+}
+
+
+# Timeout bar strips indexed by timeouts remaining (0-3); pasted as one block per team.
+# The bars and their outlines cover every pixel, so strips are fully opaque and
+# are pasted without a mask (a plain row copy, no per-pixel blending).
+TIMEOUT_STRIPS = tuple(_build_timeout_strip(remaining) for remaining in range(4))
+_TIMEOUT_STRIP_BY_COUNT = dict(enumerate(TIMEOUT_STRIPS))
+
+
+def get_timeout_strip(remaining: Optional[int]) -> Image.Image:
+    """Return the pre-rendered timeout strip for a team with `remaining` timeouts."""
+    strip = _TIMEOUT_STRIP_BY_COUNT.get(remaining)
+    if strip is not None:
+        return strip
+    # Out-of-range counts clamp; a missing (None) count shows no timeouts left
+    return TIMEOUT_STRIPS[max(0, min(3, remaining or 0))]
+
+
+def paste_timeout_strips(
+    overlay: Image.Image,
+    game: Dict[str, Any],
+    positions: Tuple[Tuple[int, int], Tuple[int, int]]
+) -> None:
+    """
+    Paste both teams' timeout strips at (away_pos, home_pos) from get_timeout_positions.
+    
+    Strips are opaque, so no mask is passed and Pillow copies the rows directly.
+    """
+    away_pos, home_pos = positions
+    overlay.paste(get_timeout_strip(game.get("away_timeouts", 0)), away_pos)
+    overlay.paste(get_timeout_strip(game.get("home_timeouts", 0)), home_pos)
+
+
+@functools.lru_cache(maxsize=4)
+def get_timeout_positions(display_width: int, display_height: int) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """Top-left paste positions of the away (bottom left) and home (bottom right) timeout strips."""
+    timeout_y = display_height - TIMEOUT_BAR_HEIGHT - 1
+    return (2, timeout_y), (display_width - 1 - TIMEOUT_STRIP_WIDTH, timeout_y)
+
+
+def get_logo_resample_filter(config: Dict[str, Any]) -> int:
+    """Resolve the logo resampling filter from customization.resample_filter."""
+    name = str(config.get('customization', {}).get('resample_filter', 'bicubic')).lower()
+    return LOGO_RESAMPLE_FILTERS.get(name, Image.Resampling.BICUBIC)
+
+
+@functools.lru_cache(maxsize=32)
+def load_truetype_font(font_path: str, font_size: int) -> ImageFont.FreeTypeFont:
+    """
+    Load a TTF/OTF font once per (path, size) for the whole process.
+    
+    Every league/mode manager and GameRenderer loads the same handful of fonts, and
+    the live/recent layouts load the record font on each frame. Font objects are only
+    read while drawing text, so one instance is shared. Failed loads raise and are not cached.
+    """
+    return ImageFont.truetype(font_path, font_size)
+
+
+# File names present in each logo directory, listed once and shared by every
+# manager so resolving a team's logo is a set lookup instead of several stat()
+# calls per filename variation. Keyed by directory path.
+_logo_dir_index: Dict[str, frozenset] = {}
+_logo_dir_index_lock = threading.Lock()
+
+
+def get_logo_dir_index(directory: Union[str, Path], refresh: bool = False) -> frozenset:
+    """
+    Return the set of file names in a logo directory (empty if it is missing).
+    
+    Pass refresh=True to re-list it, e.g. when an expected logo is absent and
+    may have been downloaded since the listing was taken.
+    """
+    key = str(directory)
+    names = None if refresh else _logo_dir_index.get(key)
+    if names is not None:
+        return names
+    
+    try:
+        names = frozenset(os.listdir(key))
+    except OSError:
+        names = frozenset()
+    with _logo_dir_index_lock:
+        _logo_dir_index[key] = names
+    return names
+
+
+# Decoded + resized logos shared by every GameRenderer and league manager in the
+# process, so each logo file is decoded and resampled once rather than once per
+# live/recent/upcoming manager and scroll renderer.
+# Keyed by (path, max_width, max_height, resample); bounded, as the FBS and FCS
+# teams at two logo sizes would otherwise all stay decoded.
+_resized_logo_store = BoundedCache(256)
+
+
+def load_resized_logo(
+    logo_path: Union[str, Path],
+    max_width: int,
+    max_height: int,
+    resample: int
+) -> Image.Image:
+    """
+    Load a logo as RGBA, thumbnailed to fit max_width x max_height.
+    
+    Results are shared process-wide; callers must not modify the returned image.
+    Raises the same errors as Image.open.
+    """
+    key = (str(logo_path), max_width, max_height, int(resample))
+    logo = _resized_logo_store.get(key)
+    if logo is not None:
+        return logo
+    
+    logo = Image.open(logo_path)
+    if logo.format == "JPEG":
+        # Let libjpeg downscale during decode (must run before convert)
+        logo.draft("RGB", (max_width, max_height))
+    if logo.mode != "RGBA":
+        logo = logo.convert("RGBA")
+    logo.thumbnail((max_width, max_height), resample)
+    return _resized_logo_store.put(key, logo)
+
+
+# Black RGB frames with both team logos pasted, shared by every GameRenderer so a
+# matchup's logo layer survives the renderer being rebuilt on each scroll prepare.
+# Keyed by (size, home logo id, home position, away logo id, away position); each
+# entry holds its logos so the ids stay valid.
+_logo_frame_store = BoundedCache(64)
+
+
+def get_logo_frame(
+    size: Tuple[int, int],
+    home_logo: Image.Image,
+    home_pos: Tuple[int, int],
+    away_logo: Image.Image,
+    away_pos: Tuple[int, int]
+) -> Image.Image:
+    """Return the shared black frame with both logos pasted; copy it before drawing on it."""
+    key = (size, id(home_logo), home_pos, id(away_logo), away_pos)
+    cached = _logo_frame_store.get(key)
+    if cached is not None:
+        return cached[2]
+    
+    frame = Image.new('RGB', size, (0, 0, 0))
+    frame.paste(home_logo, home_pos, home_logo)
+    frame.paste(away_logo, away_pos, away_logo)
+    return _logo_frame_store.put(key, (home_logo, away_logo, frame))[2]
+
+
+def clear_logo_caches() -> None:
+    """
+    Drop the shared logo directory listings, resized logos and logo frames.
+    
+    Called on plugin unload so the decoded logos are freed and a reloaded
+    plugin re-reads logo files that changed on disk.
+    """
+    with _logo_dir_index_lock:
+        _logo_dir_index.clear()
+    _resized_logo_store.clear()
+    _logo_frame_store.clear()
+
+
+# Text measurements memoized per (text, font); the layouts measure the same
+# score/clock/date/record strings on every frame.
+_measure_draw = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+
+
+@functools.lru_cache(maxsize=2048)
+def get_text_width(text: str, font: Any) -> float:
+    """Return ImageDraw.textlength(text, font) for an RGBA canvas, memoized."""
+    return _measure_draw.textlength(text, font=font)
+
+
+@functools.lru_cache(maxsize=512)
+def get_text_bbox(text: str, font: Any) -> Tuple[int, int, int, int]:
+    """Return ImageDraw.textbbox((0, 0), text, font) for an RGBA canvas, memoized."""
+    return _measure_draw.textbbox((0, 0), text, font=font)
+
+
+# Outlined text is drawn from two cached masks (glyphs + glyphs dilated by one
+# pixel) instead of nine draw.text calls. Score/clock/status strings repeat
+# constantly, so the masks are memoized per (text, font, subpixel offset).
+# Whole strings rather than per-character sprites: the clock only changes with
+# each data refresh, so a string is rasterized once per new value, and
+# stitching glyphs would drop kerning/advance rounding from FreeType layout.
+# Values are (glyph_mask, outline_mask, origin_x, origin_y); outline_mask is
+# None for anti-aliased text, which keeps the nine-draw path (see
+# draw_text_with_outline).
+_mask_measure_draw = ImageDraw.Draw(Image.new('L', (1, 1)))
+_OUTLINE_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+# Fixed status labels; their masks are built when fonts load rather than on
+# the first frame that shows them.
+STATIC_STATUS_TEXTS = ("Final", "Final/OT", "Halftime", "Next Game")
+
+
+@functools.lru_cache(maxsize=512)
+def _get_outline_masks(
+    text: str,
+    font: Any,
+    frac_x: float = 0.0,
+    frac_y: float = 0.0
+) -> Tuple[Image.Image, Optional[Image.Image], int, int]:
+    """Rasterize text once as an L mask and derive its 1px outline with MaxFilter."""
+    left, top, right, bottom = _mask_measure_draw.textbbox((frac_x, frac_y), text, font=font)
+    # One pixel of margin for the outline, plus room for glyphs left of/above the origin
+    origin_x = 1 - min(0, math.floor(left))
+    origin_y = 1 - min(0, math.floor(top))
+    glyph_mask = Image.new(
+        'L', (max(0, math.ceil(right)) + origin_x + 1, max(0, math.ceil(bottom)) + origin_y + 1), 0
+    )
+    ImageDraw.Draw(glyph_mask).text((origin_x + frac_x, origin_y + frac_y), text, font=font, fill=255)
+    if any(glyph_mask.histogram()[1:255]):
+        # Partial coverage: overlapping outline draws compound their blending,
+        # which a dilated mask (max coverage) does not reproduce
+        outline_mask = None
+    else:
+        outline_mask = glyph_mask.filter(ImageFilter.MaxFilter(3))
+    return (glyph_mask, outline_mask, origin_x, origin_y)
+
+
+def prerender_outlined_text(texts: Tuple[str, ...], fonts: List[Any]) -> None:
+    """Build the outline masks for texts in each font ahead of drawing them."""
+    for font in fonts:
+        try:
+            for text in texts:
+                _get_outline_masks(text, font)
+        except Exception:
+            # Best effort only; fonts PIL can't rasterize fail again when drawn
+            continue
+
+
+def draw_text_with_outline(
+    draw: ImageDraw.ImageDraw,
+    text: str,
+    position: Tuple[float, float],
+    font: Any,
+    fill: Tuple[int, ...] = (255, 255, 255),
+    outline_color: Tuple[int, ...] = (0, 0, 0)
+) -> None:
+    """
+    Draw text with a 1px outline on all eight sides.
+    
+    Same pixels as drawing the text in outline_color at each neighbouring
+    offset and then in fill at position. Text that rasterizes without
+    anti-aliasing (bitmap/pixel fonts) takes two cached bitmap blits instead;
+    anti-aliased text is still drawn nine times.
+    """
+    x, y = position
+    int_x, int_y = int(x), int(y)
+    if isinstance(font, ImageFont.FreeTypeFont):
+        # FreeType positions glyphs at subpixel offsets, so the fraction is part of the raster
+        masks = _get_outline_masks(text, font, x - int_x, y - int_y)
+    else:
+        masks = _get_outline_masks(text, font)
+    glyph_mask, outline_mask, origin_x, origin_y = masks
+    if outline_mask is None:
+        for dx, dy in _OUTLINE_OFFSETS:
+            draw.text((x + dx, y + dy), text, font=font, fill=outline_color)
+        draw.text(position, text, font=font, fill=fill)
+        return
+    xy = (int_x - origin_x, int_y - origin_y)
+    draw.bitmap(xy, outline_mask, fill=outline_color)
+    draw.bitmap(xy, glyph_mask, fill=fill)
+
+
 class GameRenderer:
     """
     Renders individual game cards as PIL Images for display.
@@ -33,12 +403,35 @@ class GameRenderer:
     to provide a reusable component for both switch and scroll display modes.
     """
     
+    # Fixed attribute layout: helpers read these several times per card
+    __slots__ = (
+        'display_width',
+        'display_height',
+        'config',
+        'logger',
+        '_logo_cache',
+        '_logo_resample',
+        'fonts',
+        '_default_show_odds',
+        '_default_show_records',
+        '_default_show_ranking',
+        '_team_rankings_cache',
+        '_score_tile_cache',
+        '_placeholder_card_cache',
+        '_league_display_options',
+        '_overlay_canvas',
+        '_center_y',
+        '_bottom_text_y',
+        '_timeout_positions',
+        '_is_wide',
+    )
+    
     def __init__(
         self,
         display_width: int,
         display_height: int,
         config: Dict[str, Any],
-        logo_cache: Optional[Dict[str, Image.Image]] = None,
+        logo_cache: Optional[Dict[Tuple[str, str], Image.Image]] = None,
         custom_logger: Optional[logging.Logger] = None
     ):
         """
@@ -48,16 +441,23 @@ class GameRenderer:
             display_width: Width of the display/game card
             display_height: Height of the display/game card
             config: Configuration dictionary
-            logo_cache: Optional shared logo cache dictionary
+            logo_cache: Optional shared logo cache dictionary keyed by (league, abbreviation)
             custom_logger: Optional custom logger instance
         """
         self.display_width = display_width
         self.display_height = display_height
         self.config = config
+        
+        # Layout positions depend only on the card size; compute them once
+        self._center_y = display_height // 2
+        self._bottom_text_y = display_height - 7
+        self._timeout_positions = get_timeout_positions(display_width, display_height)
+        self._is_wide = display_width > 128
         self.logger = custom_logger or logger
         
-        # Shared logo cache for performance
+        # Shared logo cache for performance, keyed by (league, team abbreviation)
         self._logo_cache = logo_cache if logo_cache is not None else {}
+        self._logo_resample = get_logo_resample_filter(config)
         
         # Load fonts
         self.fonts = self._load_fonts()
@@ -71,6 +471,19 @@ class GameRenderer:
         # Rankings cache (populated externally)
         self._team_rankings_cache: Dict[str, int] = {}
         
+        # Outlined score tiles keyed by (away_score, home_score); scores rarely change
+        self._score_tile_cache = BoundedCache(200)
+        
+        # Finished "AWY@HOME" placeholder cards for games whose logos failed to load
+        self._placeholder_card_cache = BoundedCache(64)
+        
+        # (show_odds, show_records, show_ranking) per league, resolved on first use
+        self._league_display_options: Dict[str, Tuple[bool, bool, bool]] = {}
+        
+        # Text overlay reused by every card; cleared at the start of each render
+        overlay = Image.new('RGBA', (display_width, display_height), (0, 0, 0, 0))
+        self._overlay_canvas = (overlay, ImageDraw.Draw(overlay))
+        
     def _load_fonts(self) -> Dict[str, Union[ImageFont.FreeTypeFont, Any]]:
         """
         Load fonts used by the scoreboard from config or use defaults.
@@ -104,17 +517,18 @@ class GameRenderer:
             self.logger.error(f"Error loading fonts: {e}, using defaults")
             # Fallback to hardcoded defaults
             try:
-                fonts["score"] = ImageFont.truetype("assets/fonts/PressStart2P-Regular.ttf", 10)
-                fonts["time"] = ImageFont.truetype("assets/fonts/PressStart2P-Regular.ttf", 8)
-                fonts["team"] = ImageFont.truetype("assets/fonts/PressStart2P-Regular.ttf", 8)
-                fonts["status"] = ImageFont.truetype("assets/fonts/4x6-font.ttf", 6)
-                fonts["detail"] = ImageFont.truetype("assets/fonts/4x6-font.ttf", 6)
-                fonts["rank"] = ImageFont.truetype("assets/fonts/PressStart2P-Regular.ttf", 10)
+                fonts["score"] = load_truetype_font("assets/fonts/PressStart2P-Regular.ttf", 10)
+                fonts["time"] = load_truetype_font("assets/fonts/PressStart2P-Regular.ttf", 8)
+                fonts["team"] = load_truetype_font("assets/fonts/PressStart2P-Regular.ttf", 8)
+                fonts["status"] = load_truetype_font("assets/fonts/4x6-font.ttf", 6)
+                fonts["detail"] = load_truetype_font("assets/fonts/4x6-font.ttf", 6)
+                fonts["rank"] = load_truetype_font("assets/fonts/PressStart2P-Regular.ttf", 10)
             except IOError:
                 self.logger.warning("Fonts not found, using default PIL font.")
                 default_font = ImageFont.load_default()
                 fonts = {k: default_font for k in ["score", "time", "team", "status", "detail", "rank"]}
         
+        prerender_outlined_text(STATIC_STATUS_TEXTS, [fonts["time"]])
         return fonts
     
     def _load_custom_font(self, element_config: Dict[str, Any], default_size: int = 8, default_font: str = 'PressStart2P-Regular.ttf') -> Union[ImageFont.FreeTypeFont, Any]:
@@ -133,8 +547,8 @@ class GameRenderer:
         try:
             if os.path.exists(font_path):
                 if font_path.lower().endswith('.ttf') or font_path.lower().endswith('.otf'):
-                    # TTF/OTF fonts - use ImageFont.truetype()
-                    return ImageFont.truetype(font_path, font_size)
+                    # TTF/OTF fonts - use load_truetype_font() (cached per path/size)
+                    return load_truetype_font(font_path, font_size)
                 elif font_path.lower().endswith('.bdf'):
                     # BDF fonts - ImageFont.truetype() does NOT support BDF files
                     # Option (b): Try to load pre-converted .pil/.pbm file (recommended approach)
@@ -163,7 +577,7 @@ class GameRenderer:
         default_font_path = os.path.join('assets', 'fonts', default_font)
         try:
             if os.path.exists(default_font_path):
-                return ImageFont.truetype(default_font_path, font_size)
+                return load_truetype_font(default_font_path, font_size)
         except Exception as e:
             # Default font also failed - log clear warning about BDF handling failure if this was a BDF font
             if font_path.lower().endswith('.bdf'):
@@ -202,19 +616,19 @@ class GameRenderer:
             logo_dir: Path to logo directory
         """
         for game in games:
+            league = game.get('league', 'nfl')
             for team_key in ['home_abbr', 'away_abbr']:
                 abbr = game.get(team_key, '')
-                if abbr and abbr not in self._logo_cache:
+                if abbr and (league, abbr) not in self._logo_cache:
                     logo_path = game.get(f'{team_key.replace("abbr", "logo_path")}')
                     if logo_path:
-                        logo = self._load_and_resize_logo(
+                        self._load_and_resize_logo(
                             game.get(team_key.replace('abbr', 'id'), ''),
                             abbr,
                             logo_path,
-                            game.get(f'{team_key.replace("abbr", "logo_url")}')
+                            game.get(f'{team_key.replace("abbr", "logo_url")}'),
+                            league=league
                         )
-                        if logo:
-                            self._logo_cache[abbr] = logo
         
         self.logger.debug(f"Preloaded {len(self._logo_cache)} team logos")
     
@@ -223,25 +637,32 @@ class GameRenderer:
         team_id: str, 
         team_abbrev: str, 
         logo_path: Path, 
-        logo_url: Optional[str] = None
+        logo_url: Optional[str] = None,
+        league: str = 'nfl'
     ) -> Optional[Image.Image]:
-        """Load and resize a team logo with caching."""
-        if team_abbrev in self._logo_cache:
-            return self._logo_cache[team_abbrev]
+        """
+        Load and resize a team logo with caching.
+        
+        The cache is keyed by (league, abbreviation): scroll mode mixes NFL and
+        NCAA FB cards, and the two leagues reuse abbreviations (e.g. MIA).
+        """
+        cache_key = (league, team_abbrev)
+        logo = self._logo_cache.get(cache_key)
+        if logo is not None:
+            return logo
         
         try:
             # Try to load from path
             if os.path.exists(logo_path):
-                logo = Image.open(logo_path)
-                if logo.mode != "RGBA":
-                    logo = logo.convert("RGBA")
-                
                 # Resize to fit display
-                max_width = int(self.display_width * 1.5)
-                max_height = int(self.display_height * 1.5)
-                logo.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+                logo = load_resized_logo(
+                    logo_path,
+                    int(self.display_width * 1.5),
+                    int(self.display_height * 1.5),
+                    self._logo_resample
+                )
                 
-                self._logo_cache[team_abbrev] = logo
+                self._logo_cache[cache_key] = logo
                 return logo
             else:
                 self.logger.debug(f"Logo not found at {logo_path}")
@@ -273,10 +694,7 @@ class GameRenderer:
             self.logger.warning(f"BDF font detected but ImageDraw.text() doesn't support freetype.Face - using default font for rendering")
             font = ImageFont.load_default()
         
-        x, y = position
-        for dx, dy in [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]:
-            draw.text((x + dx, y + dy), text, font=font, fill=outline_color)
-        draw.text((x, y), text, font=font, fill=fill)
+        draw_text_with_outline(draw, text, position, font, fill, outline_color)
     
     def render_game_card(
         self, 
@@ -293,83 +711,132 @@ class GameRenderer:
         Returns:
             PIL Image of the rendered game card
         """
-        # Create base image
-        main_img = Image.new('RGBA', (self.display_width, self.display_height), (0, 0, 0, 255))
-        overlay = Image.new('RGBA', (self.display_width, self.display_height), (0, 0, 0, 0))
-        draw_overlay = ImageDraw.Draw(overlay)
+        # Bind frequently used values to locals once; this runs per card in scroll mode
+        display_width = self.display_width
+        display_height = self.display_height
+        game_get = game.get
+        home_abbr = game_get("home_abbr", "")
+        away_abbr = game_get("away_abbr", "")
+        game_league = game_get("league", "nfl")
         
         # Load logos
         home_logo = self._load_and_resize_logo(
-            game.get("home_id", ""),
-            game.get("home_abbr", ""),
-            game.get("home_logo_path"),
-            game.get("home_logo_url")
+            game_get("home_id", ""),
+            home_abbr,
+            game_get("home_logo_path"),
+            game_get("home_logo_url"),
+            league=game_league
         )
         away_logo = self._load_and_resize_logo(
-            game.get("away_id", ""),
-            game.get("away_abbr", ""),
-            game.get("away_logo_path"),
-            game.get("away_logo_url")
+            game_get("away_id", ""),
+            away_abbr,
+            game_get("away_logo_path"),
+            game_get("away_logo_url"),
+            league=game_league
         )
         
         if not home_logo or not away_logo:
             # Draw placeholder text if logos fail
-            draw = ImageDraw.Draw(main_img)
-            self._draw_text_with_outline(
-                draw, 
-                f"{game.get('away_abbr', '?')}@{game.get('home_abbr', '?')}", 
-                (5, 5), 
-                self.fonts['status']
+            return self._get_placeholder_card(
+                f"{game_get('away_abbr', '?')}@{game_get('home_abbr', '?')}"
             )
-            return main_img.convert('RGB')
-        
-        center_y = self.display_height // 2
         
-        # Draw logos
-        home_x = self.display_width - home_logo.width + 10
-        home_y = center_y - (home_logo.height // 2)
-        main_img.paste(home_logo, (home_x, home_y), home_logo)
+        center_y = self._center_y
         
-        away_x = -10
-        away_y = center_y - (away_logo.height // 2)
-        main_img.paste(away_logo, (away_x, away_y), away_logo)
+        # Base image: a copy of the matchup's cached logo layer; the overlay is
+        # persistent and only needs clearing
+        home_pos = (display_width - home_logo.width + 10, center_y - (home_logo.height // 2))
+        away_pos = (-10, center_y - (away_logo.height // 2))
+        main_img = get_logo_frame(
+            (display_width, display_height), home_logo, home_pos, away_logo, away_pos
+        ).copy()
+        overlay, draw_overlay = self._overlay_canvas
+        overlay.paste((0, 0, 0, 0), (0, 0, display_width, display_height))
         
         # Draw scores (centered)
-        home_score = str(game.get("home_score", "0"))
-        away_score = str(game.get("away_score", "0"))
-        score_text = f"{away_score}-{home_score}"
-        score_width = draw_overlay.textlength(score_text, font=self.fonts['score'])
-        score_x = (self.display_width - score_width) // 2
-        score_y = (self.display_height // 2) - 3
-        self._draw_text_with_outline(draw_overlay, score_text, (score_x, score_y), self.fonts['score'])
+        score_tile, score_width = self._get_score_tile(str(game_get('away_score', '0')), str(game_get('home_score', '0')))
+        score_x = int((display_width - score_width) // 2)
+        score_y = center_y - 3
+        tile_x, tile_y = score_x - 1, score_y - 1
+        # Crop a tile that starts above/left of the card instead of moving it
+        overlay.alpha_composite(
+            score_tile, (max(0, tile_x), max(0, tile_y)), (max(0, -tile_x), max(0, -tile_y))
+        )
         
         # Draw period/status based on game type
-        if game_type == "live":
-            self._draw_live_game_status(draw_overlay, game)
-        elif game_type == "recent":
-            self._draw_recent_game_status(draw_overlay, game)
-        elif game_type == "upcoming":
-            self._draw_upcoming_game_status(draw_overlay, game)
+        draw_status = self._STATUS_RENDERERS.get(game_type)
+        if draw_status is not None:
+            draw_status(self, draw_overlay, game, overlay)
         
         # Get display options for this game's league
-        game_league = game.get("league", "nfl")
-        show_odds = self._get_display_option(game_league, "show_odds")
-        show_records = self._get_display_option(game_league, "show_records")
-        show_ranking = self._get_display_option(game_league, "show_ranking")
+        league_options = self._league_display_options.get(game_league)
+        if league_options is None:
+            league_options = self._league_display_options[game_league] = (
+                self._get_display_option(game_league, "show_odds"),
+                self._get_display_option(game_league, "show_records"),
+                self._get_display_option(game_league, "show_ranking"),
+            )
+        show_odds, show_records, show_ranking = league_options
         
         # Draw odds if enabled
-        if show_odds and 'odds' in game and game['odds']:
-            self._draw_dynamic_odds(draw_overlay, game['odds'])
+        if show_odds:
+            odds = game_get('odds')
+            if odds:
+                try:
+                    self._draw_dynamic_odds(draw_overlay, odds)
+                except (AttributeError, TypeError, ValueError) as e:
+                    self.logger.error(f"Error drawing odds for game {game_get('id')}: {e}")
         
         # Draw records or rankings if enabled
         if show_records or show_ranking:
-            self._draw_records_or_rankings(draw_overlay, game, show_records, show_ranking)
+            self._draw_records_or_rankings(
+                draw_overlay, show_records, show_ranking,
+                away_abbr, home_abbr,
+                game_get('away_record', ''), game_get('home_record', '')
+            )
+        
+        # Blend the overlay straight into the RGB card (no composite/convert copies)
+        main_img.paste(overlay, (0, 0), overlay)
+        return main_img
+    
+    def _get_score_tile(self, away_score: str, home_score: str) -> Tuple[Image.Image, float]:
+        """
+        Get the outlined "away-home" score text as a transparent RGBA tile.
+        
+        The tile carries a 1px margin on every side for the outline, so it
+        should be composited one pixel up and to the left of the text origin.
         
-        # Composite the overlay onto main image
-        main_img = Image.alpha_composite(main_img, overlay)
-        return main_img.convert('RGB')
+        Returns:
+            Tuple of (tile image, rendered text width)
+        """
+        key = (away_score, home_score)
+        cached = self._score_tile_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        font = self.fonts['score']
+        score_text = f"{away_score}-{home_score}"
+        text_width = get_text_width(score_text, font)
+        text_right, text_bottom = get_text_bbox(score_text, font)[2:]
+        tile = Image.new('RGBA', (text_right + 2, text_bottom + 2), (0, 0, 0, 0))
+        self._draw_text_with_outline(ImageDraw.Draw(tile), score_text, (1, 1), font)
+        return self._score_tile_cache.put(key, (tile, text_width))
+    
+    def _get_placeholder_card(self, message: str) -> Image.Image:
+        """
+        Get a black RGB card with an outlined message, rendered once per message.
+        
+        The card is shared between calls; callers must not modify it.
+        """
+        card = self._placeholder_card_cache.get(message)
+        if card is not None:
+            return card
+        
+        card = Image.new('RGB', (self.display_width, self.display_height), (0, 0, 0))
+        self._draw_text_with_outline(ImageDraw.Draw(card), message, (5, 5), self.fonts['status'])
+        return self._placeholder_card_cache.put(message, card)
     
-    def _draw_live_game_status(self, draw: ImageDraw.Draw, game: Dict) -> None:
+    def _draw_live_game_status(self, draw: ImageDraw.Draw, game: Dict, overlay: Image.Image) -> None:
         """Draw status elements for a live game."""
         # Period/Quarter and Clock (Top center)
         period_clock_text = f"{game.get('period_text', '')} {game.get('clock', '')}".strip()
@@ -378,7 +845,7 @@ class GameRenderer:
         elif game.get("is_period_break"):
             period_clock_text = game.get("status_text", "Period Break")
         
-        status_width = draw.textlength(period_clock_text, font=self.fonts['time'])
+        status_width = get_text_width(period_clock_text, self.fonts['time'])
         status_x = (self.display_width - status_width) // 2
         status_y = 1
         self._draw_text_with_outline(draw, period_clock_text, (status_x, status_y), self.fonts['time'])
@@ -386,46 +853,40 @@ class GameRenderer:
         # Down & Distance or Scoring Event (Bottom center)
         scoring_event = game.get("scoring_event", "")
         down_distance = game.get("down_distance_text", "")
-        if self.display_width > 128:
+        if self._is_wide:
             down_distance = game.get("down_distance_text_long", down_distance)
         
-        if scoring_event and game.get("is_live"):
+        is_live = game.get("is_live")
+        if scoring_event and is_live:
             # Display scoring event with special formatting
-            event_width = draw.textlength(scoring_event, font=self.fonts['detail'])
+            event_width = get_text_width(scoring_event, self.fonts['detail'])
             event_x = (self.display_width - event_width) // 2
-            event_y = self.display_height - 7
+            event_y = self._bottom_text_y
             
             # Color coding for different scoring events
-            if scoring_event == "TOUCHDOWN":
-                event_color = (255, 215, 0)  # Gold
-            elif scoring_event == "FIELD GOAL":
-                event_color = (0, 255, 0)    # Green
-            elif scoring_event == "PAT":
-                event_color = (255, 165, 0)  # Orange
-            else:
-                event_color = (255, 255, 255)  # White
+            event_color = SCORING_EVENT_COLORS.get(scoring_event, (255, 255, 255))  # White
             
             self._draw_text_with_outline(draw, scoring_event, (event_x, event_y), self.fonts['detail'], fill=event_color)
-        elif down_distance and game.get("is_live"):
-            dd_width = draw.textlength(down_distance, font=self.fonts['detail'])
+        elif down_distance and is_live:
+            dd_width = get_text_width(down_distance, self.fonts['detail'])
             dd_x = (self.display_width - dd_width) // 2
-            dd_y = self.display_height - 7
+            dd_y = self._bottom_text_y
             down_color = (200, 200, 0) if not game.get("is_redzone", False) else (255, 0, 0)
             self._draw_text_with_outline(draw, down_distance, (dd_x, dd_y), self.fonts['detail'], fill=down_color)
             
             # Possession indicator
-            self._draw_possession_indicator(draw, game, dd_x, dd_width, dd_y)
+            self._draw_possession_indicator(overlay, game, dd_x, dd_width, dd_y)
         
         # Timeouts
-        self._draw_timeouts(draw, game)
+        self._draw_timeouts(overlay, game)
     
-    def _draw_recent_game_status(self, draw: ImageDraw.Draw, game: Dict) -> None:
-        """Draw status elements for a recently completed game."""
+    def _draw_recent_game_status(self, draw: ImageDraw.Draw, game: Dict, overlay: Optional[Image.Image] = None) -> None:
+        """Draw status elements for a recently completed game (overlay is unused)."""
         # Final status (Top center)
         period_text = game.get("period_text", "Final")
         if not period_text:
             period_text = "Final"
-        status_width = draw.textlength(period_text, font=self.fonts['time'])
+        status_width = get_text_width(period_text, self.fonts['time'])
         status_x = (self.display_width - status_width) // 2
         status_y = 1
         self._draw_text_with_outline(draw, period_text, (status_x, status_y), self.fonts['time'])
@@ -433,17 +894,17 @@ class GameRenderer:
         # Game date (Bottom center)
         game_date = game.get("game_date", "")
         if game_date:
-            date_width = draw.textlength(game_date, font=self.fonts['detail'])
+            date_width = get_text_width(game_date, self.fonts['detail'])
             date_x = (self.display_width - date_width) // 2
-            date_y = self.display_height - 7
+            date_y = self._bottom_text_y
             self._draw_text_with_outline(draw, game_date, (date_x, date_y), self.fonts['detail'])
     
-    def _draw_upcoming_game_status(self, draw: ImageDraw.Draw, game: Dict) -> None:
-        """Draw status elements for an upcoming game."""
+    def _draw_upcoming_game_status(self, draw: ImageDraw.Draw, game: Dict, overlay: Optional[Image.Image] = None) -> None:
+        """Draw status elements for an upcoming game (overlay is unused)."""
         # Game time (Top center)
         game_time = game.get("game_time", "")
         if game_time:
-            time_width = draw.textlength(game_time, font=self.fonts['time'])
+            time_width = get_text_width(game_time, self.fonts['time'])
             time_x = (self.display_width - time_width) // 2
             time_y = 1
             self._draw_text_with_outline(draw, game_time, (time_x, time_y), self.fonts['time'])
@@ -451,14 +912,14 @@ class GameRenderer:
         # Game date (Bottom center)
         game_date = game.get("game_date", "")
         if game_date:
-            date_width = draw.textlength(game_date, font=self.fonts['detail'])
+            date_width = get_text_width(game_date, self.fonts['detail'])
             date_x = (self.display_width - date_width) // 2
-            date_y = self.display_height - 7
+            date_y = self._bottom_text_y
             self._draw_text_with_outline(draw, game_date, (date_x, date_y), self.fonts['detail'])
     
     def _draw_possession_indicator(
         self, 
-        draw: ImageDraw.Draw, 
+        overlay: Image.Image, 
         game: Dict, 
         dd_x: int, 
         dd_width: float, 
@@ -469,10 +930,7 @@ class GameRenderer:
         if not possession:
             return
         
-        ball_radius_x = 3
-        ball_radius_y = 2
-        ball_color = (139, 69, 19)  # Brown
-        lace_color = (255, 255, 255)  # White
+        ball_radius_x = FOOTBALL_RADIUS_X
         
         detail_font_height_approx = 6
         ball_y_center = dd_y + (detail_font_height_approx // 2)
@@ -485,113 +943,83 @@ class GameRenderer:
         else:
             return
         
-        if ball_x_center > 0:
-            # Draw football shape (ellipse)
-            draw.ellipse(
-                (ball_x_center - ball_radius_x, ball_y_center - ball_radius_y,
-                 ball_x_center + ball_radius_x, ball_y_center + ball_radius_y),
-                fill=ball_color, outline=(0, 0, 0)
-            )
-            # Draw simple horizontal lace
-            draw.line(
-                (ball_x_center - 1, ball_y_center, ball_x_center + 1, ball_y_center),
-                fill=lace_color, width=1
-            )
+        # Skip balls off either edge (a long D&D string can push it past the right side)
+        if 0 < ball_x_center < self.display_width + ball_radius_x:
+            paste_football(overlay, ball_x_center, ball_y_center)
     
-    def _draw_timeouts(self, draw: ImageDraw.Draw, game: Dict) -> None:
+    def _draw_timeouts(self, overlay: Image.Image, game: Dict) -> None:
         """Draw timeout indicators at bottom corners."""
-        timeout_bar_width = 4
-        timeout_bar_height = 2
-        timeout_spacing = 1
-        timeout_y = self.display_height - timeout_bar_height - 1
-        
-        # Away Timeouts (Bottom Left)
-        away_timeouts_remaining = game.get("away_timeouts", 0)
-        for i in range(3):
-            to_x = 2 + i * (timeout_bar_width + timeout_spacing)
-            color = (255, 255, 255) if i < away_timeouts_remaining else (80, 80, 80)
-            draw.rectangle(
-                [to_x, timeout_y, to_x + timeout_bar_width, timeout_y + timeout_bar_height],
-                fill=color, outline=(0, 0, 0)
-            )
-        
-        # Home Timeouts (Bottom Right)
-        home_timeouts_remaining = game.get("home_timeouts", 0)
-        for i in range(3):
-            to_x = self.display_width - 2 - timeout_bar_width - (2 - i) * (timeout_bar_width + timeout_spacing)
-            color = (255, 255, 255) if i < home_timeouts_remaining else (80, 80, 80)
-            draw.rectangle(
-                [to_x, timeout_y, to_x + timeout_bar_width, timeout_y + timeout_bar_height],
-                fill=color, outline=(0, 0, 0)
-            )
+        # Each team's three bars are one pre-rendered strip
+        paste_timeout_strips(overlay, game, self._timeout_positions)
     
     def _draw_dynamic_odds(self, draw: ImageDraw.Draw, odds: Dict[str, Any]) -> None:
-        """Draw odds with dynamic positioning."""
-        try:
-            if not odds:
-                return
-            
-            home_team_odds = odds.get("home_team_odds", {})
-            away_team_odds = odds.get("away_team_odds", {})
-            home_spread = home_team_odds.get("spread_odds")
-            away_spread = away_team_odds.get("spread_odds")
-            
-            # Get top-level spread as fallback
-            top_level_spread = odds.get("spread")
-            if top_level_spread is not None:
-                if home_spread is None or home_spread == 0.0:
-                    home_spread = top_level_spread
-                if away_spread is None:
-                    away_spread = -top_level_spread
-            
-            # Determine favored team
-            home_favored = home_spread is not None and isinstance(home_spread, (int, float)) and home_spread < 0
-            away_favored = away_spread is not None and isinstance(away_spread, (int, float)) and away_spread < 0
+        """
+        Draw odds with dynamic positioning.
+
+        Not guarded here; render_game_card catches malformed odds so a bad
+        feed only drops the odds text, not the whole card.
+        """
+        if not odds:
+            return
+        
+        home_team_odds = odds.get("home_team_odds", {})
+        away_team_odds = odds.get("away_team_odds", {})
+        home_spread = home_team_odds.get("spread_odds")
+        away_spread = away_team_odds.get("spread_odds")
+        
+        # Get top-level spread as fallback
+        top_level_spread = odds.get("spread")
+        if top_level_spread is not None:
+            if home_spread is None or home_spread == 0.0:
+                home_spread = top_level_spread
+            if away_spread is None:
+                away_spread = -top_level_spread
+        
+        # Determine favored team
+        home_favored = home_spread is not None and isinstance(home_spread, (int, float)) and home_spread < 0
+        away_favored = away_spread is not None and isinstance(away_spread, (int, float)) and away_spread < 0
+        
+        favored_spread = None
+        favored_side = None
+        
+        if home_favored:
+            favored_spread = home_spread
+            favored_side = "home"
+        elif away_favored:
+            favored_spread = away_spread
+            favored_side = "away"
+        
+        # Show the negative spread
+        if favored_spread is not None:
+            spread_text = str(favored_spread)
+            font = self.fonts["detail"]
             
-            favored_spread = None
-            favored_side = None
+            if favored_side == "home":
+                spread_width = get_text_width(spread_text, font)
+                spread_x = self.display_width - spread_width
+                spread_y = 0
+            else:
+                spread_x = 0
+                spread_y = 0
             
-            if home_favored:
-                favored_spread = home_spread
-                favored_side = "home"
-            elif away_favored:
-                favored_spread = away_spread
-                favored_side = "away"
+            self._draw_text_with_outline(draw, spread_text, (spread_x, spread_y), font, fill=(0, 255, 0))
+        
+        # Show over/under on opposite side
+        over_under = odds.get("over_under")
+        if over_under is not None and isinstance(over_under, (int, float)):
+            ou_text = f"O/U: {over_under}"
+            font = self.fonts["detail"]
+            ou_width = get_text_width(ou_text, font)
             
-            # Show the negative spread
-            if favored_spread is not None:
-                spread_text = str(favored_spread)
-                font = self.fonts["detail"]
-                
-                if favored_side == "home":
-                    spread_width = draw.textlength(spread_text, font=font)
-                    spread_x = self.display_width - spread_width
-                    spread_y = 0
-                else:
-                    spread_x = 0
-                    spread_y = 0
-                
-                self._draw_text_with_outline(draw, spread_text, (spread_x, spread_y), font, fill=(0, 255, 0))
+            if favored_side == "home":
+                ou_x = 0
+            elif favored_side == "away":
+                ou_x = self.display_width - ou_width
+            else:
+                ou_x = (self.display_width - ou_width) // 2
+            ou_y = 0
             
-            # Show over/under on opposite side
-            over_under = odds.get("over_under")
-            if over_under is not None and isinstance(over_under, (int, float)):
-                ou_text = f"O/U: {over_under}"
-                font = self.fonts["detail"]
-                ou_width = draw.textlength(ou_text, font=font)
-                
-                if favored_side == "home":
-                    ou_x = 0
-                elif favored_side == "away":
-                    ou_x = self.display_width - ou_width
-                else:
-                    ou_x = (self.display_width - ou_width) // 2
-                ou_y = 0
-                
-                self._draw_text_with_outline(draw, ou_text, (ou_x, ou_y), font, fill=(0, 255, 0))
-                
-        except Exception as e:
-            self.logger.error(f"Error drawing odds: {e}")
+            self._draw_text_with_outline(draw, ou_text, (ou_x, ou_y), font, fill=(0, 255, 0))
     
     def _get_display_option(self, league: str, option: str) -> bool:
         """
@@ -615,53 +1043,56 @@ class GameRenderer:
         
         return bool(value)
     
-    def _draw_records_or_rankings(self, draw: ImageDraw.Draw, game: Dict, show_records: bool, show_ranking: bool) -> None:
+    def _draw_records_or_rankings(
+        self,
+        draw: ImageDraw.Draw,
+        show_records: bool,
+        show_ranking: bool,
+        away_abbr: str,
+        home_abbr: str,
+        away_record: str = '',
+        home_record: str = ''
+    ) -> None:
         """Draw team records or rankings."""
         try:
-            record_font = ImageFont.truetype("assets/fonts/4x6-font.ttf", 6)
+            record_font = load_truetype_font("assets/fonts/4x6-font.ttf", 6)
         except IOError:
             record_font = ImageFont.load_default()
         
-        away_abbr = game.get('away_abbr', '')
-        home_abbr = game.get('home_abbr', '')
-        
-        record_bbox = draw.textbbox((0, 0), "0-0", font=record_font)
+        record_bbox = get_text_bbox("0-0", record_font)
         record_height = record_bbox[3] - record_bbox[1]
         record_y = self.display_height - record_height - 4
         
         # Away team info
         if away_abbr:
-            away_text = self._get_team_display_text(away_abbr, game.get('away_record', ''), show_records, show_ranking)
+            away_text = self._get_team_display_text(away_abbr, away_record, show_records, show_ranking)
             if away_text:
                 away_record_x = 3
                 self._draw_text_with_outline(draw, away_text, (away_record_x, record_y), record_font)
         
         # Home team info
         if home_abbr:
-            home_text = self._get_team_display_text(home_abbr, game.get('home_record', ''), show_records, show_ranking)
+            home_text = self._get_team_display_text(home_abbr, home_record, show_records, show_ranking)
             if home_text:
-                home_record_bbox = draw.textbbox((0, 0), home_text, font=record_font)
+                home_record_bbox = get_text_bbox(home_text, record_font)
                 home_record_width = home_record_bbox[2] - home_record_bbox[0]
                 home_record_x = self.display_width - home_record_width - 3
                 self._draw_text_with_outline(draw, home_text, (home_record_x, record_y), record_font)
     
     def _get_team_display_text(self, abbr: str, record: str, show_records: bool, show_ranking: bool) -> str:
         """Get the display text for a team (ranking or record)."""
-        if show_ranking and show_records:
+        if show_ranking:
             # Rankings replace records when both are enabled
             rank = self._team_rankings_cache.get(abbr, 0)
-            if rank > 0:
-                return f"#{rank}"
-            return ''
-        elif show_ranking:
-            rank = self._team_rankings_cache.get(abbr, 0)
-            if rank > 0:
-                return f"#{rank}"
-            return ''
-        elif show_records:
+            return f"#{rank}" if rank > 0 else ''
+        if show_records:
             return record
         return ''
-
-
-
-
+    
+    # Status renderer per game type. Each only draws what its layout needs, so
+    # recent/upcoming cards never touch down & distance, possession or timeouts.
+    _STATUS_RENDERERS = {
+        'live': _draw_live_game_status,
+        'recent': _draw_recent_game_status,
+        'upcoming': _draw_upcoming_game_status,
+    }
@@ -11,6 +11,9 @@ from PIL import Image, ImageDraw, ImageFont
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from espn_http import ESPN_REQUEST_HEADERS
+from game_renderer import draw_text_with_outline, load_truetype_font
+
 logger = logging.getLogger(__name__)
 
 class LogoDownloader:
@@ -33,14 +36,7 @@ class LogoDownloader:
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
         
-        # Set up headers
-        self.headers = {
-            'User-Agent': 'LEDMatrix/1.0 (https://github.com/yourusername/LEDMatrix; contact@example.com)',
-            'Accept': 'application/json',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive'
-        }
+        self.headers = dict(ESPN_REQUEST_HEADERS)
     
     @staticmethod
     def normalize_abbreviation(abbr: str) -> str:
@@ -61,7 +57,8 @@ class LogoDownloader:
             
         return variations
 
-def download_missing_logo(sport_key: str, team_id: str, team_abbr: str, logo_path: Path, logo_url: str = None) -> bool:
+def download_missing_logo(sport_key: str, team_id: str, team_abbr: str, logo_path: Path, logo_url: str = None,
+                          session: Optional[requests.Session] = None) -> bool:
     """
     Download missing logo for a team.
     
@@ -71,6 +68,7 @@ def download_missing_logo(sport_key: str, team_id: str, team_abbr: str, logo_pat
         team_abbr: Team abbreviation
         logo_path: Path where logo should be saved
         logo_url: Optional logo URL
+        session: Optional HTTP session to reuse pooled connections
         
     Returns:
         True if logo was downloaded successfully, False otherwise
@@ -101,7 +99,7 @@ def download_missing_logo(sport_key: str, team_id: str, team_abbr: str, logo_pat
         # If we have a logo URL, try to download it
         if logo_url:
             try:
-                response = requests.get(logo_url, timeout=30)
+                response = (session or requests).get(logo_url, timeout=30)
                 if response.status_code == 200:
                     # Verify it's an image
                     content_type = response.headers.get('content-type', '').lower()
@@ -144,7 +142,7 @@ def create_placeholder_logo(team_abbr: str, logo_path: Path) -> bool:
         
         # Try to load a font
         try:
-            font = ImageFont.truetype("assets/fonts/PressStart2P-Regular.ttf", 12)
+            font = load_truetype_font("assets/fonts/PressStart2P-Regular.ttf", 12)
         except:
             font = ImageFont.load_default()
         
@@ -158,9 +156,7 @@ def create_placeholder_logo(team_abbr: str, logo_path: Path) -> bool:
         y = (64 - text_height) // 2
         
         # Draw white text with black outline
-        for dx, dy in [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]:
-            draw.text((x + dx, y + dy), text, font=font, fill=(0, 0, 0))
-        draw.text((x, y), text, font=font, fill=(255, 255, 255))
+        draw_text_with_outline(draw, text, (x, y), font)
         
         # Save the placeholder
         img.save(logo_path)
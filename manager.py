@@ -28,7 +28,9 @@ and made it difficult to ensure both leagues were displayed.
 """
 
 import logging
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, Any, Set, Optional, Tuple, List
 
 from PIL import ImageFont
@@ -44,6 +46,8 @@ except ImportError:
     BaseOddsManager = None
 
 # Import the copied manager classes
+from espn_http import EMPTY_DICT, close_shared_session
+from game_renderer import clear_logo_caches
 from nfl_managers import NFLLiveManager, NFLRecentManager, NFLUpcomingManager
 from ncaa_fb_managers import (
     NCAAFBLiveManager,
@@ -61,6 +65,17 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# ESPN status.state inferred from the manager a game was collected from
+_MODE_TYPE_STATES = {'live': 'in', 'recent': 'post', 'upcoming': 'pre'}
+
+# Mode types of granular display modes ({league}_{mode_type}, e.g. 'nfl_recent')
+_GRANULAR_MODE_TYPES = ('live', 'recent', 'upcoming')
+
+# Managers of a league refreshed together on one worker. Live fetches today's
+# scoreboard on its own; recent and upcoming share the season schedule, so they
+# stay in order (upcoming reuses what recent fetched).
+_UPDATE_GROUPS = (('live',), ('recent', 'upcoming'))
+
 
 class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
     """
@@ -117,6 +132,8 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
         # Format: {league_id: {'enabled': bool, 'priority': int, 'live_priority': bool, 'managers': {...}}}
         # The registry will be populated after managers are initialized
         self._league_registry: Dict[str, Dict[str, Any]] = {}
+        # Granular display mode name -> (league, mode_type), built with the registry
+        self._granular_modes: Dict[str, Tuple[str, str]] = {}
 
         # Global settings
         self.display_duration = float(config.get("display_duration", 30))
@@ -142,6 +159,24 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
             except Exception as e:
                 self.logger.warning(f"Could not initialize background service: {e}")
 
+        # Fixed part of get_info(), built on first request
+        self._static_info: Optional[Dict[str, Any]] = None
+        # Last get_info() result, keyed on (is_enabled, current_mode_index); both
+        # caches assume the league flags and modes are fixed, so anything that
+        # changes those must call _invalidate_info()
+        self._info_cache: Optional[Tuple[Tuple[bool, int], Dict[str, Any]]] = None
+
+        # status.state histogram of the last _collect_games_for_scroll() result
+        self._scroll_state_counts: Dict[str, int] = {'in': 0, 'post': 0, 'pre': 0}
+
+        # Worker pool for background league updates, keyed by (league, _UPDATE_GROUPS entry)
+        self._update_executor: Optional[ThreadPoolExecutor] = None
+        self._league_update_futures: Dict[Tuple[str, Tuple[str, ...]], Future] = {}
+        # Guards the executor and the futures; update() and the display thread
+        # both submit refreshes
+        self._league_update_lock = threading.Lock()
+        self._initial_update_done = False
+
         # Initialize managers
         self._initialize_managers()
         
@@ -317,6 +352,14 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
             }
         }
         
+        # display() resolves a granular mode with one lookup instead of
+        # rebuilding candidate names per call
+        self._granular_modes = {
+            f"{league_id}_{mode_type}": (league_id, mode_type)
+            for league_id in self._league_registry
+            for mode_type in _GRANULAR_MODE_TYPES
+        }
+        
         # Log registry state for debugging
         enabled_leagues = [lid for lid, data in self._league_registry.items() if data['enabled']]
         self.logger.info(
@@ -542,6 +585,7 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
                     "update_interval_seconds", 300
                 ),
                 "live_update_interval": league_config.get("live_update_interval", 30),
+                "idle_update_interval": league_config.get("idle_update_interval", 1800),
                 "live_game_duration": league_config.get("live_game_duration", 20),
                 "recent_game_duration": league_config.get(
                     "recent_game_duration",
@@ -625,7 +669,7 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
         Returns:
             'switch' or 'scroll'
         """
-        return self._display_mode_settings.get(league, {}).get(game_type, 'switch')
+        return self._display_mode_settings.get(league, EMPTY_DICT).get(game_type, 'switch')
     
     def _should_use_scroll_mode(self, mode_type: str) -> bool:
         """
@@ -663,6 +707,8 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
         """
         games = []
         leagues = []
+        # Tallied while games are collected so callers need not rescan them
+        state_counts = {'in': 0, 'post': 0, 'pre': 0}
 
         # Determine which mode types to collect
         if mode_type is None:
@@ -672,65 +718,57 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
             # Collect single game type for internal plugin scroll mode
             mode_types = [mode_type]
 
-        # Collect NFL games if enabled
-        if self.nfl_enabled:
+        # One pass per league tags each game, fills in its state, applies the
+        # live-priority filter and tallies the state histogram
+        for league, label, enabled in (
+            ('nfl', 'NFL', self.nfl_enabled),
+            ('ncaa_fb', 'NCAA FB', self.ncaa_fb_enabled),
+        ):
+            if not enabled:
+                continue
             league_games = []
+            league_collected = False
             for mt in mode_types:
                 # Check if scroll mode is enabled for this league/mode
-                if self._get_display_mode('nfl', mt) == 'scroll':
-                    nfl_manager = self._get_manager_for_league_mode('nfl', mt)
-                    if nfl_manager:
-                        nfl_games = self._get_games_from_manager(nfl_manager, mt)
-                        if nfl_games:
-                            # Add league info and ensure status field
-                            for game in nfl_games:
-                                game['league'] = 'nfl'
-                                # Ensure game has status dict for type determination
-                                if not isinstance(game.get('status'), dict):
-                                    game['status'] = {}
-                                if 'state' not in game['status']:
-                                    # Infer state from mode_type
-                                    state_map = {'live': 'in', 'recent': 'post', 'upcoming': 'pre'}
-                                    game['status']['state'] = state_map.get(mt, 'pre')
-                            league_games.extend(nfl_games)
-                            self.logger.debug(f"Collected {len(nfl_games)} NFL {mt} games for scroll")
-
-            if league_games:
-                games.extend(league_games)
-                leagues.append('nfl')
+                if self._get_display_mode(league, mt) != 'scroll':
+                    continue
+                league_manager = self._get_manager_for_league_mode(league, mt)
+                if not league_manager:
+                    continue
+                mode_games = self._get_games_from_manager(league_manager, mt)
+                if not mode_games:
+                    continue
+                league_collected = True
+                # Add league info and ensure status field
+                inferred_state = _MODE_TYPE_STATES.get(mt, 'pre')
+                for game in mode_games:
+                    game['league'] = league
+                    # Ensure game has status dict for type determination
+                    status = game.get('status')
+                    if not isinstance(status, dict):
+                        status = game['status'] = {}
+                    state = status.get('state')
+                    if state is None:
+                        # Infer state from mode_type
+                        state = status['state'] = inferred_state
+                    # If live priority is active, keep only live games
+                    if live_priority_active and (
+                        not game.get('is_live', False) or game.get('is_final', False)
+                    ):
+                        continue
+                    state_counts[state] = state_counts.get(state, 0) + 1
+                    league_games.append(game)
+                self.logger.debug(f"Collected {len(mode_games)} {label} {mt} games for scroll")
 
-        # Collect NCAA FB games if enabled
-        if self.ncaa_fb_enabled:
-            league_games = []
-            for mt in mode_types:
-                # Check if scroll mode is enabled for this league/mode
-                if self._get_display_mode('ncaa_fb', mt) == 'scroll':
-                    ncaa_manager = self._get_manager_for_league_mode('ncaa_fb', mt)
-                    if ncaa_manager:
-                        ncaa_games = self._get_games_from_manager(ncaa_manager, mt)
-                        if ncaa_games:
-                            # Add league info and ensure status field
-                            for game in ncaa_games:
-                                game['league'] = 'ncaa_fb'
-                                # Ensure game has status dict for type determination
-                                if not isinstance(game.get('status'), dict):
-                                    game['status'] = {}
-                                if 'state' not in game['status']:
-                                    # Infer state from mode_type
-                                    state_map = {'live': 'in', 'recent': 'post', 'upcoming': 'pre'}
-                                    game['status']['state'] = state_map.get(mt, 'pre')
-                            league_games.extend(ncaa_games)
-                            self.logger.debug(f"Collected {len(ncaa_games)} NCAA FB {mt} games for scroll")
-
-            if league_games:
+            if league_collected:
                 games.extend(league_games)
-                leagues.append('ncaa_fb')
+                leagues.append(league)
 
-        # If live priority is active, filter to only live games
         if live_priority_active:
-            games = [g for g in games if g.get('is_live', False) and not g.get('is_final', False)]
             self.logger.debug(f"Live priority active: filtered to {len(games)} live games")
 
+        self._scroll_state_counts = state_counts
+
         return games, leagues
     
     def _get_games_from_manager(self, manager, mode_type: str) -> List[Dict]:
@@ -838,43 +876,142 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
 
     def _ensure_manager_updated(self, manager) -> None:
         """Trigger an update when the delegated manager is stale."""
-        last_update = getattr(manager, "last_update", None)
-        update_interval = getattr(manager, "update_interval", None)
-        if last_update is None or update_interval is None:
+        # Managers own their polling policy (live managers back off adaptively)
+        is_update_due = getattr(manager, "is_update_due", None)
+        if is_update_due is None:
             return
 
-        interval = update_interval
-        no_data_interval = getattr(manager, "no_data_interval", None)
-        live_games = getattr(manager, "live_games", None)
-        if no_data_interval and not live_games:
-            interval = no_data_interval
-
         try:
-            if interval and time.time() - last_update >= interval:
-                manager.update()
+            current_time = time.time()
+            if not is_update_due(current_time):
+                return
+            league = getattr(manager, "sport_key", None)
+            if league in self._league_registry and getattr(manager, "last_update", 0):
+                # Already showing data; refresh it without blocking this frame
+                self._submit_league_update(league, current_time)
+            else:
+                # Nothing fetched yet (or not a league manager); update inline
+                self._run_manager_update(manager)
         except Exception as exc:
             self.logger.debug(f"Auto-refresh failed for manager {manager}: {exc}")
 
+    def _update_league_managers(
+        self, league: str, mode_types: Tuple[str, ...] = ("live", "recent", "upcoming")
+    ) -> None:
+        """Update the given managers of one league (default: live, recent, upcoming) in order."""
+        try:
+            for mode_type in mode_types:
+                manager = getattr(self, f"{league}_{mode_type}")
+                self._run_manager_update(manager)
+                # Warm logos for the refreshed slate while still off the display thread
+                games = getattr(manager, "live_games", None) or getattr(manager, "games_list", None)
+                if games:
+                    manager.preload_logos(games)
+        except Exception as e:
+            self.logger.error(f"Error updating {league} managers: {e}")
+
+    def _run_manager_update(self, manager, wait: bool = True) -> bool:
+        """
+        Run manager.update() under the manager's update_lock.
+
+        The update workers and the display thread both refresh managers, and
+        update() is not safe to run twice at once on one manager. With
+        wait=False the call is skipped, returning False, while another
+        thread's update is in flight; that update brings the same data.
+        """
+        lock = getattr(manager, "update_lock", None)
+        if lock is None:
+            manager.update()
+            return True
+        if not lock.acquire(blocking=wait):
+            return False
+        try:
+            manager.update()
+        finally:
+            lock.release()
+        return True
+
+    def _wait_for_league_updates(self) -> None:
+        """Block until the queued background league refreshes have finished."""
+        with self._league_update_lock:
+            pending = list(self._league_update_futures.values())
+        for future in pending:
+            try:
+                future.result()
+            except Exception as e:
+                self.logger.debug(f"Background league update failed: {e}")
+
+    def _is_league_update_due(
+        self,
+        league: str,
+        current_time: float,
+        mode_types: Tuple[str, ...] = ("live", "recent", "upcoming"),
+    ) -> bool:
+        """Check whether any of the given managers of a league is due to refresh."""
+        try:
+            return any(
+                getattr(self, f"{league}_{mode_type}").is_update_due(current_time)
+                for mode_type in mode_types
+            )
+        except Exception as e:
+            self.logger.error(f"Error checking {league} update schedule: {e}")
+            return True
+
     def update(self) -> None:
         """Update football game data."""
         if not self.is_enabled:
             return
 
-        try:
-            # Update NFL managers if enabled
-            if self.nfl_enabled:
-                self.nfl_live.update()
-                self.nfl_recent.update()
-                self.nfl_upcoming.update()
-
-            # Update NCAA FB managers if enabled
-            if self.ncaa_fb_enabled:
-                self.ncaa_fb_live.update()
-                self.ncaa_fb_recent.update()
-                self.ncaa_fb_upcoming.update()
+        leagues = []
+        if self.nfl_enabled:
+            leagues.append("nfl")
+        if self.ncaa_fb_enabled:
+            leagues.append("ncaa_fb")
 
-        except Exception as e:
-            self.logger.error(f"Error updating managers: {e}")
+        # Each league's managers keep their own polling clocks; only the groups
+        # that are due get queued, so steady-state calls hand no work to the
+        # update threads and one league's refresh never resets the other's.
+        current_time = time.time()
+        submitted = []
+        for league in leagues:
+            submitted.extend(self._submit_league_update(league, current_time))
+
+        # Wait for the very first refresh so the initial frames have data to show
+        if not self._initial_update_done:
+            for future in submitted:
+                future.result()
+            self._initial_update_done = True
+
+    def _submit_league_update(self, league: str, current_time: float) -> List[Future]:
+        """
+        Queue background refreshes of one league's managers that are due.
+
+        Refreshes run on worker threads so the display loop never waits on ESPN;
+        the managers swap in new game lists under their own locks. Each
+        _UPDATE_GROUPS entry is its own job: leagues, and the live vs. schedule
+        fetches within a league, hit independent endpoints and run concurrently.
+        Groups whose previous refresh is still in flight are skipped.
+        """
+        submitted = []
+        with self._league_update_lock:
+            if self._update_executor is None:
+                self._update_executor = ThreadPoolExecutor(
+                    max_workers=2 * len(_UPDATE_GROUPS), thread_name_prefix="FootballUpdate"
+                )
+            for mode_types in _UPDATE_GROUPS:
+                key = (league, mode_types)
+                pending = self._league_update_futures.get(key)
+                if pending is not None and not pending.done():
+                    # Previous refresh still in flight; don't queue a second one
+                    continue
+                if not self._is_league_update_due(league, current_time, mode_types):
+                    continue
+                future = self._update_executor.submit(
+                    self._update_league_managers, league, mode_types
+                )
+                self._league_update_futures[key] = future
+                submitted.append(future)
+        return submitted
 
     def _get_managers_in_priority_order(self, mode_type: str) -> list:
         """
@@ -911,10 +1048,11 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
                     f"(priority: {self._league_registry[league_id].get('priority', 999)})"
                 )
         
-        self.logger.debug(
-            f"Managers in priority order for {mode_type}: "
-            f"{[m.__class__.__name__ for m in managers]}"
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Managers in priority order for %s: %s",
+                mode_type, [m.__class__.__name__ for m in managers]
+            )
         
         return managers
 
@@ -1024,8 +1162,8 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
         else:
             # Frequent calls - only log at DEBUG level
             self.logger.debug(
-                f"Manager {manager_class_name} display() returned {result}, "
-                f"has_current_game={has_current_game}, game_id={current_game_id}"
+                "Manager %s display() returned %s, has_current_game=%s, game_id=%s",
+                manager_class_name, result, has_current_game, current_game_id
             )
         
         if result is True:
@@ -1055,7 +1193,7 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
             # In sequential block display, we'll try the next league if this one is complete
             # The completion check happens in _display_external_mode()
             self.logger.debug(
-                f"Manager {manager_class_name} returned False - no content or between games"
+                "Manager %s returned False - no content or between games", manager_class_name
             )
             return False, None
         
@@ -1333,7 +1471,7 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
                     return False
             
             self.logger.debug(
-                f"Displayed content from {league} {mode_type} (mode: {display_mode})"
+                "Displayed content from %s %s (mode: %s)", league, mode_type, display_mode
             )
         else:
             # No content - clear any existing start time so mode can start fresh when content becomes available
@@ -1342,7 +1480,7 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
                 self.logger.debug(f"Cleared mode start time for {display_mode} (no content available)")
             
             self.logger.debug(
-                f"No content available for {league} {mode_type} (mode: {display_mode})"
+                "No content available for %s %s (mode: %s)", league, mode_type, display_mode
             )
         
         return success
@@ -1511,39 +1649,9 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
                 # e.g., "ncaa_fb_recent" -> league="ncaa_fb", mode_type="recent"
                 # e.g., "uefa.champions_recent" -> league="uefa.champions", mode_type="recent" (for soccer)
                 # 
-                # Scalable approach: Check league registry first, then extract mode type
-                # This works for any league naming convention (underscores, dots, etc.)
-                mode_type_str = None
-                league = None
-                
-                # Known mode type suffixes (standardized across all sports plugins)
-                mode_suffixes = ['_live', '_recent', '_upcoming']
-                
-                # Try to match against league registry first (most reliable)
-                # Check each league ID in registry to see if display_mode starts with it
-                for league_id in self._league_registry.keys():
-                    for mode_suffix in mode_suffixes:
-                        expected_mode = f"{league_id}{mode_suffix}"
-                        if display_mode == expected_mode:
-                            league = league_id
-                            mode_type_str = mode_suffix[1:]  # Remove leading underscore
-                            break
-                    if league:
-                        break
-                
-                # Fallback: If no registry match, parse from the end (for backward compatibility)
-                if not league:
-                    for mode_suffix in mode_suffixes:
-                        if display_mode.endswith(mode_suffix):
-                            mode_type_str = mode_suffix[1:]  # Remove leading underscore
-                            league = display_mode[:-len(mode_suffix)]  # Everything before the suffix
-                            # Validate it's a known league
-                            if league in self._league_registry:
-                                break
-                            else:
-                                # Not a known league, try next suffix
-                                league = None
-                                mode_type_str = None
+                # Scalable approach: the name table is built from the league registry,
+                # so this works for any league naming convention (underscores, dots, etc.)
+                league, mode_type_str = self._granular_modes.get(display_mode, (None, None))
                 
                 if not mode_type_str or not league:
                     self.logger.warning(
@@ -1604,7 +1712,12 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
             or (self.ncaa_fb_enabled and self.ncaa_fb_live_priority)
         )
         # Log at DEBUG level since this is called frequently and the result rarely changes
-        self.logger.debug(f"has_live_priority() called: nfl_enabled={self.nfl_enabled}, nfl_live_priority={self.nfl_live_priority}, ncaa_fb_enabled={self.ncaa_fb_enabled}, ncaa_fb_live_priority={self.ncaa_fb_live_priority}, result={result}")
+        self.logger.debug(
+            "has_live_priority() called: nfl_enabled=%s, nfl_live_priority=%s, "
+            "ncaa_fb_enabled=%s, ncaa_fb_live_priority=%s, result=%s",
+            self.nfl_enabled, self.nfl_live_priority,
+            self.ncaa_fb_enabled, self.ncaa_fb_live_priority, result
+        )
         return result
 
     def has_live_content(self) -> bool:
@@ -1619,80 +1732,18 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
             and self.nfl_live_priority
             and hasattr(self, "nfl_live")
         ):
-            raw_live_games = getattr(self.nfl_live, "live_games", [])
-            self.logger.debug(f"[LIVE_PRIORITY_DEBUG] NFL raw live_games count: {len(raw_live_games)}")
-
-            # Log each raw game for debugging
-            for i, game in enumerate(raw_live_games):
-                self.logger.debug(
-                    f"[LIVE_PRIORITY_DEBUG] NFL raw game {i+1}: "
-                    f"{game.get('away_abbr')}@{game.get('home_abbr')} "
-                    f"is_final={game.get('is_final')}, is_live={game.get('is_live')}, "
-                    f"clock={game.get('clock')}, period={game.get('period')}, "
-                    f"period_text={game.get('period_text')}"
+            live_count, shown_count = self._scan_live_games(self.nfl_live, "NFL")
+            nfl_live = shown_count > 0
+            if live_count:
+                self.logger.info(
+                    "has_live_content: NFL live_games=%s, filtered_live_games=%s, nfl_live=%s",
+                    live_count, shown_count, nfl_live
                 )
-
-            if raw_live_games:
-                # Filter out any games that are final or appear over
-                live_games = [g for g in raw_live_games if not g.get("is_final", False)]
-                games_after_final_filter = len(live_games)
-                self.logger.debug(f"[LIVE_PRIORITY_DEBUG] NFL after is_final filter: {games_after_final_filter} games")
-
-                # Additional validation using helper method if available
-                if hasattr(self.nfl_live, "_is_game_really_over"):
-                    games_before_really_over = len(live_games)
-                    for game in live_games[:]:  # Iterate over copy
-                        is_really_over = self.nfl_live._is_game_really_over(game)
-                        if is_really_over:
-                            self.logger.debug(
-                                f"[LIVE_PRIORITY_DEBUG] NFL _is_game_really_over=True for "
-                                f"{game.get('away_abbr')}@{game.get('home_abbr')} "
-                                f"(clock={game.get('clock')}, period={game.get('period')}, "
-                                f"period_text={game.get('period_text')})"
-                            )
-                            live_games.remove(game)
-                    self.logger.debug(
-                        f"[LIVE_PRIORITY_DEBUG] NFL after _is_game_really_over filter: "
-                        f"{len(live_games)} games (removed {games_before_really_over - len(live_games)})"
-                    )
-
-                if live_games:
-                    # If favorite teams are configured, only return True if there are live games for favorite teams
-                    favorite_teams = getattr(self.nfl_live, "favorite_teams", [])
-                    self.logger.debug(f"[LIVE_PRIORITY_DEBUG] NFL favorite_teams configured: {favorite_teams}")
-
-                    if favorite_teams:
-                        # Check if any live game involves a favorite team
-                        for game in live_games:
-                            home = game.get("home_abbr")
-                            away = game.get("away_abbr")
-                            home_match = home in favorite_teams
-                            away_match = away in favorite_teams
-                            self.logger.debug(
-                                f"[LIVE_PRIORITY_DEBUG] NFL favorite check: {away}@{home} - "
-                                f"home_in_favorites={home_match}, away_in_favorites={away_match}"
-                            )
-
-                        nfl_live = any(
-                            game.get("home_abbr") in favorite_teams
-                            or game.get("away_abbr") in favorite_teams
-                            for game in live_games
-                        )
-                        self.logger.debug(f"[LIVE_PRIORITY_DEBUG] NFL favorite team match result: {nfl_live}")
-                    else:
-                        # No favorite teams configured, return True if any live games exist
-                        nfl_live = True
-                        self.logger.debug("[LIVE_PRIORITY_DEBUG] NFL no favorites configured, nfl_live=True")
-
-                    self.logger.info(f"has_live_content: NFL live_games={len(live_games)}, filtered_live_games={len(live_games)}, nfl_live={nfl_live}")
-                else:
-                    self.logger.debug("[LIVE_PRIORITY_DEBUG] NFL no live games after filtering")
-            else:
-                self.logger.debug("[LIVE_PRIORITY_DEBUG] NFL raw live_games is empty")
         else:
             self.logger.debug(
-                f"[LIVE_PRIORITY_DEBUG] NFL check skipped: nfl_enabled={self.nfl_enabled}, "
-                f"nfl_live_priority={self.nfl_live_priority}, has_nfl_live={hasattr(self, 'nfl_live')}"
+                "[LIVE_PRIORITY_DEBUG] NFL check skipped: nfl_enabled=%s, "
+                "nfl_live_priority=%s, has_nfl_live=%s",
+                self.nfl_enabled, self.nfl_live_priority, hasattr(self, 'nfl_live')
             )
 
         # Check NCAA FB live content
@@ -1702,80 +1753,18 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
             and self.ncaa_fb_live_priority
             and hasattr(self, "ncaa_fb_live")
         ):
-            raw_live_games = getattr(self.ncaa_fb_live, "live_games", [])
-            self.logger.debug(f"[LIVE_PRIORITY_DEBUG] NCAA FB raw live_games count: {len(raw_live_games)}")
-
-            # Log each raw game for debugging
-            for i, game in enumerate(raw_live_games):
-                self.logger.debug(
-                    f"[LIVE_PRIORITY_DEBUG] NCAA FB raw game {i+1}: "
-                    f"{game.get('away_abbr')}@{game.get('home_abbr')} "
-                    f"is_final={game.get('is_final')}, is_live={game.get('is_live')}, "
-                    f"clock={game.get('clock')}, period={game.get('period')}, "
-                    f"period_text={game.get('period_text')}"
+            live_count, shown_count = self._scan_live_games(self.ncaa_fb_live, "NCAA FB")
+            ncaa_live = shown_count > 0
+            if live_count:
+                self.logger.info(
+                    "has_live_content: NCAA FB live_games=%s, filtered_live_games=%s, ncaa_live=%s",
+                    live_count, shown_count, ncaa_live
                 )
-
-            if raw_live_games:
-                # Filter out any games that are final or appear over
-                live_games = [g for g in raw_live_games if not g.get("is_final", False)]
-                games_after_final_filter = len(live_games)
-                self.logger.debug(f"[LIVE_PRIORITY_DEBUG] NCAA FB after is_final filter: {games_after_final_filter} games")
-
-                # Additional validation using helper method if available
-                if hasattr(self.ncaa_fb_live, "_is_game_really_over"):
-                    games_before_really_over = len(live_games)
-                    for game in live_games[:]:  # Iterate over copy
-                        is_really_over = self.ncaa_fb_live._is_game_really_over(game)
-                        if is_really_over:
-                            self.logger.debug(
-                                f"[LIVE_PRIORITY_DEBUG] NCAA FB _is_game_really_over=True for "
-                                f"{game.get('away_abbr')}@{game.get('home_abbr')} "
-                                f"(clock={game.get('clock')}, period={game.get('period')}, "
-                                f"period_text={game.get('period_text')})"
-                            )
-                            live_games.remove(game)
-                    self.logger.debug(
-                        f"[LIVE_PRIORITY_DEBUG] NCAA FB after _is_game_really_over filter: "
-                        f"{len(live_games)} games (removed {games_before_really_over - len(live_games)})"
-                    )
-
-                if live_games:
-                    # If favorite teams are configured, only return True if there are live games for favorite teams
-                    favorite_teams = getattr(self.ncaa_fb_live, "favorite_teams", [])
-                    self.logger.debug(f"[LIVE_PRIORITY_DEBUG] NCAA FB favorite_teams configured: {favorite_teams}")
-
-                    if favorite_teams:
-                        # Check if any live game involves a favorite team
-                        for game in live_games:
-                            home = game.get("home_abbr")
-                            away = game.get("away_abbr")
-                            home_match = home in favorite_teams
-                            away_match = away in favorite_teams
-                            self.logger.debug(
-                                f"[LIVE_PRIORITY_DEBUG] NCAA FB favorite check: {away}@{home} - "
-                                f"home_in_favorites={home_match}, away_in_favorites={away_match}"
-                            )
-
-                        ncaa_live = any(
-                            game.get("home_abbr") in favorite_teams
-                            or game.get("away_abbr") in favorite_teams
-                            for game in live_games
-                        )
-                        self.logger.debug(f"[LIVE_PRIORITY_DEBUG] NCAA FB favorite team match result: {ncaa_live}")
-                    else:
-                        # No favorite teams configured, return True if any live games exist
-                        ncaa_live = True
-                        self.logger.debug("[LIVE_PRIORITY_DEBUG] NCAA FB no favorites configured, ncaa_live=True")
-
-                    self.logger.info(f"has_live_content: NCAA FB live_games={len(live_games)}, filtered_live_games={len(live_games)}, ncaa_live={ncaa_live}")
-                else:
-                    self.logger.debug("[LIVE_PRIORITY_DEBUG] NCAA FB no live games after filtering")
-            else:
-                self.logger.debug("[LIVE_PRIORITY_DEBUG] NCAA FB raw live_games is empty")
         else:
             self.logger.debug(
-                f"[LIVE_PRIORITY_DEBUG] NCAA FB check skipped: ncaa_fb_enabled={self.ncaa_fb_enabled}, "
-                f"ncaa_fb_live_priority={self.ncaa_fb_live_priority}, has_ncaa_fb_live={hasattr(self, 'ncaa_fb_live')}"
+                "[LIVE_PRIORITY_DEBUG] NCAA FB check skipped: ncaa_fb_enabled=%s, "
+                "ncaa_fb_live_priority=%s, has_ncaa_fb_live=%s",
+                self.ncaa_fb_enabled, self.ncaa_fb_live_priority, hasattr(self, 'ncaa_fb_live')
             )
 
         result = nfl_live or ncaa_live
@@ -1814,27 +1803,9 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
             and self.nfl_live_priority
             and hasattr(self, "nfl_live")
         ):
-            live_games = getattr(self.nfl_live, "live_games", [])
-            if live_games:
-                # Filter out any games that are final or appear over
-                live_games = [g for g in live_games if not g.get("is_final", False)]
-                # Additional validation using helper method if available
-                if hasattr(self.nfl_live, "_is_game_really_over"):
-                    live_games = [g for g in live_games if not self.nfl_live._is_game_really_over(g)]
-                
-                if live_games:
-                    # If favorite teams are configured, only return if there are live games for favorite teams
-                    favorite_teams = getattr(self.nfl_live, "favorite_teams", [])
-                    if favorite_teams:
-                        if any(
-                            game.get("home_abbr") in favorite_teams
-                            or game.get("away_abbr") in favorite_teams
-                            for game in live_games
-                        ):
-                            live_modes.append("nfl_live")
-                    else:
-                        # No favorite teams configured, include if any live games exist
-                        live_modes.append("nfl_live")
+            # Only count live games for favorite teams when favorites are configured
+            if self._scan_live_games(self.nfl_live, "nfl_live")[1]:
+                live_modes.append("nfl_live")
         
         # Check NCAA FB live content
         if (
@@ -1842,27 +1813,9 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
             and self.ncaa_fb_live_priority
             and hasattr(self, "ncaa_fb_live")
         ):
-            live_games = getattr(self.ncaa_fb_live, "live_games", [])
-            if live_games:
-                # Filter out any games that are final or appear over
-                live_games = [g for g in live_games if not g.get("is_final", False)]
-                # Additional validation using helper method if available
-                if hasattr(self.ncaa_fb_live, "_is_game_really_over"):
-                    live_games = [g for g in live_games if not self.ncaa_fb_live._is_game_really_over(g)]
-                
-                if live_games:
-                    # If favorite teams are configured, only return if there are live games for favorite teams
-                    favorite_teams = getattr(self.ncaa_fb_live, "favorite_teams", [])
-                    if favorite_teams:
-                        if any(
-                            game.get("home_abbr") in favorite_teams
-                            or game.get("away_abbr") in favorite_teams
-                            for game in live_games
-                        ):
-                            live_modes.append("ncaa_fb_live")
-                    else:
-                        # No favorite teams configured, include if any live games exist
-                        live_modes.append("ncaa_fb_live")
+            # Only count live games for favorite teams when favorites are configured
+            if self._scan_live_games(self.ncaa_fb_live, "ncaa_fb_live")[1]:
+                live_modes.append("ncaa_fb_live")
         
         return live_modes
 
@@ -2236,16 +2189,12 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
 
                 # Filter out invalid games
                 if games:
-                    # For live games, filter out final games
                     if mode_type == 'live':
-                        games = [g for g in games if not g.get('is_final', False)]
-                        if hasattr(manager, '_is_game_really_over'):
-                            games = [
-                                g for g in games
-                                if not manager._is_game_really_over(g)
-                            ]
-
-                    game_count = len(games)
+                        # Count live games without final/really-over ones in
+                        # the same single pass the live-priority check uses
+                        game_count = self._scan_live_games(manager, f"{league_name} cycle")[0]
+                    else:
+                        game_count = len(games)
                     total_games += game_count
 
                     # Calculate this league's contribution to total duration
@@ -2314,52 +2263,90 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
             self.logger.error(f"Error calculating cycle duration for {display_mode}: {e}")
             return None
 
-    def get_info(self) -> Dict[str, Any]:
-        """Get plugin information."""
-        try:
-            current_manager = self._get_current_manager()
-            current_mode = self.modes[self.current_mode_index] if self.modes else "none"
-
-            info = {
+    def _get_static_info(self) -> Dict[str, Any]:
+        """
+        Build the parts of get_info() that are fixed once the plugin is initialized.
+
+        League flags, modes, durations and the set of managers do not change
+        after __init__, so this scaffolding is assembled on the first call and
+        reused; get_info() copies it and fills in the per-call fields. Only
+        immutable values are stored (the mode list as a tuple, the per-league
+        maps as tuples of pairs), and get_info() rebuilds the nested dicts for
+        each caller, so nothing a caller mutates reaches the snapshot or the
+        mode rotation. The info itself stays a plain dict: callers serialize it
+        with json, which rejects MappingProxyType.
+        """
+        static_info = self._static_info
+        if static_info is None:
+            # One pass over the leagues fills every per-league field
+            live_priority: List[Tuple[str, bool]] = []
+            managers_initialized: List[Tuple[str, bool]] = []
+            static_info = {
                 "plugin_id": self.plugin_id,
                 "name": "Football Scoreboard",
                 "version": "2.0.5",
-                "enabled": self.is_enabled,
                 "display_size": f"{self.display_width}x{self.display_height}",
-                "nfl_enabled": self.nfl_enabled,
-                "ncaa_fb_enabled": self.ncaa_fb_enabled,
-                "current_mode": current_mode,
-                "available_modes": self.modes,
-                "display_duration": self.display_duration,
-                "game_display_duration": self.game_display_duration,
-                "live_priority": {
-                    "nfl": self.nfl_enabled and self.nfl_live_priority,
-                    "ncaa_fb": self.ncaa_fb_enabled and self.ncaa_fb_live_priority,
-                },
-                "show_records": getattr(current_manager, "mode_config", {}).get(
-                    "show_records"
-                )
-                if current_manager
-                else None,
-                "show_ranking": getattr(current_manager, "mode_config", {}).get(
-                    "show_ranking"
-                )
-                if current_manager
-                else None,
-                "show_odds": getattr(current_manager, "mode_config", {}).get(
-                    "show_odds"
-                )
-                if current_manager
-                else None,
-                "managers_initialized": {
-                    "nfl_live": hasattr(self, "nfl_live"),
-                    "nfl_recent": hasattr(self, "nfl_recent"),
-                    "nfl_upcoming": hasattr(self, "nfl_upcoming"),
-                    "ncaa_fb_live": hasattr(self, "ncaa_fb_live"),
-                    "ncaa_fb_recent": hasattr(self, "ncaa_fb_recent"),
-                    "ncaa_fb_upcoming": hasattr(self, "ncaa_fb_upcoming"),
-                },
             }
+            for league, enabled, priority in (
+                ("nfl", self.nfl_enabled, self.nfl_live_priority),
+                ("ncaa_fb", self.ncaa_fb_enabled, self.ncaa_fb_live_priority),
+            ):
+                static_info[f"{league}_enabled"] = enabled
+                live_priority.append((league, enabled and priority))
+                for mode_type in _GRANULAR_MODE_TYPES:
+                    attr = f"{league}_{mode_type}"
+                    managers_initialized.append((attr, hasattr(self, attr)))
+            static_info["available_modes"] = tuple(self.modes)
+            static_info["display_duration"] = self.display_duration
+            static_info["game_display_duration"] = self.game_display_duration
+            static_info["live_priority"] = tuple(live_priority)
+            static_info["managers_initialized"] = tuple(managers_initialized)
+            self._static_info = static_info
+        return static_info
+
+    def _invalidate_info(self) -> None:
+        """Drop the cached get_info() snapshot and result; rebuilt on the next call."""
+        self._static_info = None
+        self._info_cache = None
+
+    @staticmethod
+    def _copy_info(info: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a get_info() result, nested dicts included, so callers never share one."""
+        copied = dict(info)
+        copied["live_priority"] = dict(info["live_priority"])
+        copied["managers_initialized"] = dict(info["managers_initialized"])
+        return copied
+
+    def get_info(self) -> Dict[str, Any]:
+        """Get plugin information."""
+        try:
+            # Everything reported below follows from the enabled flag and the
+            # current mode, so reuse the last result until either changes
+            enabled = self.is_enabled
+            mode_index = self.current_mode_index
+            info_key = (enabled, mode_index)
+            cached = self._info_cache
+            if cached is not None and cached[0] == info_key:
+                return self._copy_info(cached[1])
+
+            modes = self.modes
+            current_manager = self._get_current_manager()
+            current_mode = modes[mode_index] if modes else "none"
+            mode_config = (
+                getattr(current_manager, "mode_config", {}) if current_manager else None
+            )
+
+            info = dict(self._get_static_info())
+            info["live_priority"] = dict(info["live_priority"])
+            info["managers_initialized"] = dict(info["managers_initialized"])
+            info["enabled"] = enabled
+            info["current_mode"] = current_mode
+            if mode_config is not None:
+                info["show_records"] = mode_config.get("show_records")
+                info["show_ranking"] = mode_config.get("show_ranking")
+                info["show_odds"] = mode_config.get("show_odds")
+            else:
+                info["show_records"] = info["show_ranking"] = info["show_odds"] = None
 
             # Add manager-specific info if available
             if current_manager and hasattr(current_manager, "get_info"):
@@ -2368,6 +2355,9 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
                     info["current_manager_info"] = manager_info
                 except Exception as e:
                     info["current_manager_info"] = f"Error getting manager info: {e}"
+            else:
+                # Manager-reported info can change under us; only cache without it
+                self._info_cache = (info_key, self._copy_info(info))
 
             return info
 
@@ -2684,84 +2674,59 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
         Returns:
             True if manager has live games that should be displayed
         """
-        manager_name = getattr(manager, 'sport_key', type(manager).__name__)
-
         if not manager:
             self.logger.debug("[LIVE_PRIORITY_DEBUG] _has_live_games_for_manager: manager is None")
             return False
 
-        raw_live_games = getattr(manager, 'live_games', [])
-        self.logger.debug(
-            f"[LIVE_PRIORITY_DEBUG] _has_live_games_for_manager({manager_name}): "
-            f"raw live_games count = {len(raw_live_games)}"
-        )
-
-        if not raw_live_games:
-            self.logger.debug(
-                f"[LIVE_PRIORITY_DEBUG] _has_live_games_for_manager({manager_name}): "
-                f"returning False - no raw live games"
-            )
-            return False
-
-        # Filter out games that are final or appear over
-        live_games = [g for g in raw_live_games if not g.get('is_final', False)]
-        games_after_final_filter = len(live_games)
-        self.logger.debug(
-            f"[LIVE_PRIORITY_DEBUG] _has_live_games_for_manager({manager_name}): "
-            f"after is_final filter = {games_after_final_filter} games"
-        )
-
-        if hasattr(manager, '_is_game_really_over'):
-            games_before = len(live_games)
-            live_games = [g for g in live_games if not manager._is_game_really_over(g)]
-            self.logger.debug(
-                f"[LIVE_PRIORITY_DEBUG] _has_live_games_for_manager({manager_name}): "
-                f"after _is_game_really_over filter = {len(live_games)} games (removed {games_before - len(live_games)})"
-            )
+        manager_name = getattr(manager, 'sport_key', type(manager).__name__)
+        return self._scan_live_games(manager, manager_name)[1] > 0
 
-        if not live_games:
-            self.logger.debug(
-                f"[LIVE_PRIORITY_DEBUG] _has_live_games_for_manager({manager_name}): "
-                f"returning False - no live games after filtering"
-            )
-            return False
+    def _scan_live_games(self, manager, label: str) -> Tuple[int, int]:
+        """
+        Count a live manager's displayable games in a single pass.
 
-        # If favorite teams are configured, only return True if there are live games for favorite teams
-        favorite_teams = getattr(manager, 'favorite_teams', [])
-        self.logger.debug(
-            f"[LIVE_PRIORITY_DEBUG] _has_live_games_for_manager({manager_name}): "
-            f"favorite_teams = {favorite_teams}"
-        )
+        Games that are final, or that the manager's _is_game_really_over()
+        flags, are skipped. Of the rest, games involving a favorite team are
+        counted as shown (all of them when no favorites are configured).
 
+        Returns:
+            Tuple of (live game count, shown game count)
+        """
+        raw_live_games = getattr(manager, "live_games", None) or []
+        favorite_teams = getattr(manager, "favorite_teams", None)
+        is_game_really_over = getattr(manager, "_is_game_really_over", None)
+        favorite_set = None
         if favorite_teams:
-            # Log each game's match status
-            for game in live_games:
-                home = game.get('home_abbr')
-                away = game.get('away_abbr')
-                home_match = home in favorite_teams
-                away_match = away in favorite_teams
-                self.logger.debug(
-                    f"[LIVE_PRIORITY_DEBUG] _has_live_games_for_manager({manager_name}): "
-                    f"checking {away}@{home} - home_in_favorites={home_match}, away_in_favorites={away_match}"
-                )
-
-            has_favorite_live = any(
-                game.get('home_abbr') in favorite_teams
-                or game.get('away_abbr') in favorite_teams
-                for game in live_games
-            )
-            self.logger.debug(
-                f"[LIVE_PRIORITY_DEBUG] _has_live_games_for_manager({manager_name}): "
-                f"returning {has_favorite_live} - has_favorite_live check"
-            )
-            return has_favorite_live
+            favorite_set = getattr(manager, "_favorite_teams_set", None) or frozenset(favorite_teams)
+
+        live_count = shown_count = final_count = over_count = 0
+        for game in raw_live_games:
+            if game.get("is_final", False):
+                final_count += 1
+            elif is_game_really_over is not None and is_game_really_over(game):
+                over_count += 1
+            else:
+                live_count += 1
+                if favorite_set is None:
+                    shown_count += 1
+                    continue
+                # Extraction caches the favorite check on the game dict
+                is_favorite = game.get("is_favorite")
+                if is_favorite is None:
+                    is_favorite = (
+                        game.get("home_abbr") in favorite_set
+                        or game.get("away_abbr") in favorite_set
+                    )
+                if is_favorite:
+                    shown_count += 1
 
-        # No favorite teams configured, any live game counts
         self.logger.debug(
-            f"[LIVE_PRIORITY_DEBUG] _has_live_games_for_manager({manager_name}): "
-            f"returning True - no favorites configured, {len(live_games)} live games exist"
+            "[LIVE_PRIORITY_DEBUG] %s: %d raw live games, %d final, %d really over, "
+            "%d live, %d shown (favorite_teams=%s)",
+            label, len(raw_live_games), final_count, over_count,
+            live_count, shown_count, favorite_teams
         )
-        return True
+        return live_count, shown_count
 
     def _filter_managers_by_live_content(self, managers: list, mode_type: str) -> list:
         """Filter managers based on live content when in live mode.
@@ -2817,7 +2782,8 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
                 manager = self._get_league_manager_for_mode(league_id, 'live')
                 if manager:
                     try:
-                        manager.update()
+                        # Skip if a background refresh of this manager is running
+                        self._run_manager_update(manager, wait=False)
                     except Exception as e:
                         self.logger.debug(f"Error updating {league_id} live manager: {e}")
             
@@ -2867,10 +2833,11 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
                         f"(priority: {self._league_registry[league_id].get('priority', 999)})"
                     )
         
-        self.logger.debug(
-            f"Resolved {len(managers_to_try)} manager(s) for {mode_type} mode: "
-            f"{[m.__class__.__name__ for m in managers_to_try]}"
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Resolved %d manager(s) for %s mode: %s",
+                len(managers_to_try), mode_type, [m.__class__.__name__ for m in managers_to_try]
+            )
         
         return managers_to_try
 
@@ -2975,7 +2942,12 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
                 mode_type = current_mode.split('_', 2)[2]
         
         # Log for debugging
-        self.logger.debug(f"_record_dynamic_progress: current_mode={current_mode}, display_mode={display_mode}, manager={current_manager.__class__.__name__}, manager_key={manager_key}, _last_display_mode={self._last_display_mode}")
+        self.logger.debug(
+            "_record_dynamic_progress: current_mode=%s, display_mode=%s, manager=%s, "
+            "manager_key=%s, _last_display_mode=%s",
+            current_mode, display_mode, current_manager.__class__.__name__,
+            manager_key, self._last_display_mode
+        )
 
         total_games = self._get_total_games_for_manager(current_manager)
         
@@ -3437,6 +3409,8 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
         try:
             if hasattr(self, 'update') and callable(self.update):
                 self.update()
+                # update() only queues the refreshes; build from their results
+                self._wait_for_league_updates()
                 self.logger.debug("[Football Vegas] Refreshed managers via update()")
             elif hasattr(self, 'refresh_managers') and callable(self.refresh_managers):
                 self.refresh_managers()
@@ -3454,16 +3428,13 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
             self.logger.debug("[Football Vegas] No games available")
             return
 
-        # Count games by type for logging
-        game_type_counts = {'live': 0, 'recent': 0, 'upcoming': 0}
-        for game in games:
-            state = game.get('status', {}).get('state', '')
-            if state == 'in':
-                game_type_counts['live'] += 1
-            elif state == 'post':
-                game_type_counts['recent'] += 1
-            elif state == 'pre':
-                game_type_counts['upcoming'] += 1
+        # Game type counts were tallied during collection
+        state_counts = self._scroll_state_counts
+        game_type_counts = {
+            'live': state_counts['in'],
+            'recent': state_counts['post'],
+            'upcoming': state_counts['pre'],
+        }
 
         # Get rankings cache if available
         rankings_cache = self._get_rankings_cache() if hasattr(self, '_get_rankings_cache') else None
@@ -3491,6 +3462,21 @@ class FootballScoreboardPlugin(BasePlugin if BasePlugin else object):
             if hasattr(self, "background_service") and self.background_service:
                 # Clean up background service if needed
                 pass
+            with self._league_update_lock:
+                if self._update_executor is not None:
+                    self._update_executor.shutdown(wait=False)
+                    self._update_executor = None
+                self._league_update_futures.clear()
+            self._invalidate_info()
+            # Release per-game tracking in place; these grow with every game seen
+            self._game_id_start_times.clear()
+            self._single_game_manager_start_times.clear()
+            self._current_game_tracking.clear()
+            self._dynamic_manager_progress.clear()
+            # Managers share one pooled HTTP session; release it with the plugin
+            close_shared_session()
+            # Decoded logos are shared process-wide too (see load_resized_logo)
+            clear_logo_caches()
             self.logger.info("Football scoreboard plugin cleanup completed")
         except Exception as e:
             self.logger.error(f"Error during cleanup: {e}")
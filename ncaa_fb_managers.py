@@ -4,8 +4,6 @@ import logging
 import requests
 import json
 from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
-import pytz
 from sports import SportsRecent, SportsUpcoming
 from football import Football, FootballLive
 from pathlib import Path
@@ -61,10 +59,7 @@ class BaseNCAAFBManager(Football):  # Renamed class
 
         This method now uses background threading to prevent blocking the display.
         """
-        now = datetime.now(pytz.utc)
-        season_year = now.year
-        if now.month < 8:
-            season_year = now.year - 1
+        season_year = self._get_season_year()
         datestring = f"{season_year}0801-{season_year+1}0201"
         cache_key = f"ncaafb_schedule_{season_year}"
 
@@ -166,14 +161,13 @@ class BaseNCAAFBManager(Football):  # Renamed class
                 "Background service not available, using synchronous fetch"
             )
             try:
-                response = self.session.get(
+                # Conditional GET: an unchanged season schedule is not re-downloaded
+                data = self._get_json_if_modified(
+                    cache_key,
                     ESPN_NCAAFB_SCOREBOARD_URL,
-                    params={"dates": datestring, "limit": 1000},
-                    headers=self.headers,
+                    {"dates": datestring, "limit": 1000},
                     timeout=30,
                 )
-                response.raise_for_status()
-                data = response.json()
 
                 # Cache the data
                 self.cache_manager.set(cache_key, data)
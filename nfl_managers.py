@@ -1,10 +1,8 @@
 import logging
 import os
-from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import pytz
 import requests
 
 from football import Football, FootballLive
@@ -56,10 +54,7 @@ class BaseNFLManager(Football):  # Renamed class
         Fetches the full season schedule for NFL using background threading.
         Returns cached data immediately if available, otherwise starts background fetch.
         """
-        now = datetime.now(pytz.utc)
-        season_year = now.year
-        if now.month < 8:
-            season_year = now.year - 1
+        season_year = self._get_season_year()
         datestring = f"{season_year}0801-{season_year+1}0301"
         cache_key = f"{self.sport_key}_schedule_{season_year}"
 
@@ -138,14 +133,13 @@ class BaseNFLManager(Football):  # Renamed class
                 "Background service not available, using synchronous fetch"
             )
             try:
-                response = self.session.get(
+                # Conditional GET: an unchanged season schedule is not re-downloaded
+                data = self._get_json_if_modified(
+                    cache_key,
                     ESPN_NFL_SCOREBOARD_URL,
-                    params={"dates": datestring, "limit": 1000},
-                    headers=self.headers,
+                    {"dates": datestring, "limit": 1000},
                     timeout=30,
                 )
-                response.raise_for_status()
-                data = response.json()
 
                 # Cache the data
                 self.cache_manager.set(cache_key, data)
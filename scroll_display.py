@@ -85,10 +85,10 @@ class ScrollDisplay:
             self.scroll_helper = None
             self.logger.error("ScrollHelper not available - scroll mode will not work")
         
-        # Shared logo cache for game renderer
-        self._logo_cache: Dict[str, Image.Image] = {}
+        # Shared logo cache for game renderer, keyed by (league, team abbreviation)
+        self._logo_cache: Dict[Tuple[str, str], Image.Image] = {}
         
-        # League separator icons cache
+        # League separator frames (icon centered on a padded black strip)
         self._separator_icons: Dict[str, Image.Image] = {}
         self._load_separator_icons()
         
@@ -204,7 +204,7 @@ class ScrollDisplay:
                 aspect = nfl_icon.width / nfl_icon.height
                 new_width = int(separator_height * aspect)
                 nfl_icon = nfl_icon.resize((new_width, separator_height), Image.Resampling.LANCZOS)
-                self._separator_icons["nfl"] = nfl_icon
+                self._separator_icons["nfl"] = self._build_separator_frame(nfl_icon)
                 self.logger.debug(f"Loaded NFL separator icon: {new_width}x{separator_height}")
             except Exception as e:
                 self.logger.error(f"Error loading NFL separator icon: {e}")
@@ -221,13 +221,19 @@ class ScrollDisplay:
                 aspect = ncaa_icon.width / ncaa_icon.height
                 new_width = int(separator_height * aspect)
                 ncaa_icon = ncaa_icon.resize((new_width, separator_height), Image.Resampling.LANCZOS)
-                self._separator_icons["ncaa_fb"] = ncaa_icon
+                self._separator_icons["ncaa_fb"] = self._build_separator_frame(ncaa_icon)
                 self.logger.debug(f"Loaded NCAA FB separator icon: {new_width}x{separator_height}")
             except Exception as e:
                 self.logger.error(f"Error loading NCAA FB separator icon: {e}")
         else:
             self.logger.warning(f"NCAA FB separator icon not found at {self.NCAA_FB_SEPARATOR_ICON}")
     
+    def _build_separator_frame(self, icon: Image.Image) -> Image.Image:
+        """Center a separator icon on a black, full-height RGB strip with 4px side padding."""
+        frame = Image.new('RGB', (icon.width + 8, self.display_height), (0, 0, 0))
+        frame.paste(icon, (4, (self.display_height - icon.height) // 2), icon)
+        return frame
+
     def _determine_game_type(self, game: Dict) -> str:
         """
         Determine the game type from the game's status.
@@ -311,28 +317,19 @@ class ScrollDisplay:
             game_league = game.get("league", "nfl")  # Default to NFL if not specified
 
             # Add league separator if switching leagues OR if this is the first league
+            # Separator frames are composed once at load and reused as-is
             if show_separators:
                 if current_league is None:
                     # First league - add separator at the start
                     separator = self._separator_icons.get(game_league)
                     if separator:
-                        # Create a separator image with proper background
-                        sep_img = Image.new('RGB', (separator.width + 8, self.display_height), (0, 0, 0))
-                        # Center the separator vertically
-                        y_offset = (self.display_height - separator.height) // 2
-                        sep_img.paste(separator, (4, y_offset), separator)
-                        content_items.append(sep_img)
+                        content_items.append(separator)
                         self.logger.debug(f"Added {game_league} separator icon at start")
                 elif game_league != current_league:
                     # Switching leagues - add separator
                     separator = self._separator_icons.get(game_league)
                     if separator:
-                        # Create a separator image with proper background
-                        sep_img = Image.new('RGB', (separator.width + 8, self.display_height), (0, 0, 0))
-                        # Center the separator vertically
-                        y_offset = (self.display_height - separator.height) // 2
-                        sep_img.paste(separator, (4, y_offset), separator)
-                        content_items.append(sep_img)
+                        content_items.append(separator)
                         self.logger.debug(f"Added {game_league} separator icon")
 
             current_league = game_league
@@ -353,7 +350,7 @@ class ScrollDisplay:
                 game_count += 1
                 league_counts[game_league] = league_counts.get(game_league, 0) + 1
             except Exception as e:
-                self.logger.error(f"Error rendering game card: {e}")
+                self.logger.error(f"Error rendering game card {game.get('id')}: {e}")
                 continue
         
         if not content_items:
@@ -464,12 +461,10 @@ class ScrollDisplay:
             return {"error": "ScrollHelper not available"}
         
         info = self.scroll_helper.get_scroll_info()
-        info.update({
-            "game_count": len(self._current_games),
-            "game_type": self._current_game_type,
-            "leagues": self._current_leagues,
-            "is_scrolling": self._is_scrolling
-        })
+        info["game_count"] = len(self._current_games)
+        info["game_type"] = self._current_game_type
+        info["leagues"] = self._current_leagues
+        info["is_scrolling"] = self._is_scrolling
         return info
     
     def get_dynamic_duration(self) -> int:
@@ -482,6 +477,8 @@ class ScrollDisplay:
         """Clear scroll content and reset state."""
         if self.scroll_helper:
             self.scroll_helper.clear_cache()
+        # Rebind rather than clear(): prepare_scroll_content() keeps the
+        # caller's games/leagues lists, which must not be emptied under them
         self._current_games = []
         self._current_game_type = ""
         self._current_leagues = []
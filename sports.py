@@ -1,3 +1,5 @@
+import hashlib
+import heapq
 import logging
 import os
 import threading
@@ -5,20 +7,37 @@ import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import pytz
 import requests
 from PIL import Image, ImageDraw, ImageFont
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 # Import simplified dependencies for plugin use
 from dynamic_team_resolver import DynamicTeamResolver
 from logo_downloader import LogoDownloader, download_missing_logo
 from base_odds_manager import BaseOddsManager
 from data_sources import ESPNDataSource
-
+from espn_http import EMPTY_DICT, ESPN_REQUEST_HEADERS, get_shared_session, json_loads
+from game_renderer import (
+    STATIC_STATUS_TEXTS,
+    BoundedCache,
+    draw_text_with_outline,
+    get_logo_dir_index,
+    get_logo_resample_filter,
+    get_text_bbox,
+    get_text_width,
+    load_resized_logo,
+    load_truetype_font,
+    prerender_outlined_text,
+)
+
+# Sort-key sentinels for games without a parsed start time (latest / earliest)
+_UTC_MAX = datetime.max.replace(tzinfo=timezone.utc)
+_UTC_MIN = datetime.min.replace(tzinfo=timezone.utc)
+
+# Seconds before a logo that failed to load is probed (and downloaded) again
+LOGO_RETRY_INTERVAL = 300
 
 class SportsCore(ABC):
     def __init__(
@@ -34,7 +53,9 @@ class SportsCore(ABC):
         self.cache_manager = cache_manager
         self.config_manager = getattr(cache_manager, "config_manager", None)
         # Initialize odds manager
-        self.odds_manager = BaseOddsManager(self.cache_manager, self.config_manager)
+        self.odds_manager = BaseOddsManager(
+            self.cache_manager, self.config_manager, session=get_shared_session()
+        )
         self.display_manager = display_manager
         # Get display dimensions from matrix (same as base SportsCore class)
         # This ensures proper scaling for different display sizes
@@ -83,41 +104,62 @@ class SportsCore(ABC):
             filtering_config.get("show_all_live", False),
         )
 
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=5,  # increased number of retries
-            backoff_factor=1,  # increased backoff factor
-            # added 429 to retry list
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "HEAD", "OPTIONS"],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
+        self.session = get_shared_session()
 
         self._logo_cache = {}
-
-        # Set up headers
-        self.headers = {
-            "User-Agent": "LEDMatrix/1.0 (https://github.com/yourusername/LEDMatrix; contact@example.com)",
-            "Accept": "application/json",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-        }
+        # Resolved layout offsets keyed by (element, axis, default); the layout
+        # config is fixed for the manager's life (see _get_layout_offset)
+        self._layout_offset_cache: Dict[Tuple[str, str, int], int] = {}
+        # Team abbreviation -> time before which a failed logo load is not retried
+        self._logo_retry_at: Dict[str, float] = {}
+        # Raw ESPN event date -> (start_time_utc, game_time, game_date); kickoff
+        # times repeat across events and updates (see _parse_start_time)
+        self._start_time_cache = BoundedCache(512)
+        # Black frames with both team logos pasted, keyed by matchup and layout
+        self._base_frame_cache = BoundedCache(64)
+        # Reused RGB output frame for the scorebug layouts
+        self._output_frame: Optional[Image.Image] = None
+        # Scratch text overlay (image, ImageDraw) reused across frames
+        self._overlay_canvas: Optional[tuple] = None
+        # (base frame, drawn state) of the frame last pushed by _draw_scorebug_layout
+        self._last_scorebug: Optional[tuple] = None
+        # Pre-rendered static message frames keyed by (message, size, position)
+        self._message_frame_cache = BoundedCache(64)
+        # Validators from the last 200 response per endpoint, for conditional GETs
+        # and body-hash reuse: {cache_key: (request_key, etag, last_modified, digest, data)}
+        self._http_validators: Dict[str, tuple] = {}
+        self._logo_resample = get_logo_resample_filter(config)
+        # Local YYYYMMDD for today's scoreboard request, recomputed after midnight
+        self._today_str = ""
+        self._today_str_expires_at = 0.0
+        # UTC ISO year+week for the partial-data cache key and the schedule's
+        # season year, recomputed after UTC midnight
+        self._week_str = ""
+        self._season_year = 0
+        self._utc_day_expires_at = 0.0
+
+        self.headers = dict(ESPN_REQUEST_HEADERS)
         self.last_update = 0
         self.current_game = None
         # Thread safety lock for shared game state
         self._games_lock = threading.RLock()
+        # Held by whoever runs update(); the plugin refreshes managers from both
+        # its worker threads and the display thread
+        self.update_lock = threading.Lock()
         self.fonts = self._load_fonts()
 
         # Initialize dynamic team resolver and resolve favorite teams
-        self.dynamic_resolver = DynamicTeamResolver(cache_manager=cache_manager)
+        self.dynamic_resolver = DynamicTeamResolver(
+            cache_manager=cache_manager, session=get_shared_session()
+        )
         raw_favorite_teams = self.mode_config.get("favorite_teams", [])
         self.favorite_teams = self.dynamic_resolver.resolve_teams(
             raw_favorite_teams, sport_key
         )
 
+        # Hashed copy for membership tests; favorite_teams keeps config order for display/logging
+        self._favorite_teams_set = frozenset(self.favorite_teams)
+
         # Log dynamic team resolution
         if raw_favorite_teams != self.favorite_teams:
             self.logger.info(
@@ -162,11 +204,12 @@ class SportsCore(ABC):
         """Placeholder draw method - subclasses should override."""
         # This base method will be simple, subclasses provide specifics
         try:
-            img = Image.new("RGB", (self.display_width, self.display_height), (0, 0, 0))
-            draw = ImageDraw.Draw(img)
             status = game.get("status_text", "N/A")
-            self._draw_text_with_outline(draw, status, (2, 2), self.fonts["status"])
-            self.display_manager.image.paste(img, (0, 0))
+            self.display_manager.image = self._compose_output_frame(
+                self._get_message_frame(
+                    status, (self.display_width, self.display_height), (2, 2)
+                )
+            )
             # Don't call update_display here, let subclasses handle it after drawing
         except Exception as e:
             self.logger.error(
@@ -228,14 +271,14 @@ class SportsCore(ABC):
             if os.path.exists(font_path):
                 # Try loading as TTF first (works for both TTF and some BDF files with PIL)
                 if font_path.lower().endswith('.ttf'):
-                    font = ImageFont.truetype(font_path, font_size)
+                    font = load_truetype_font(font_path, font_size)
                     self.logger.debug(f"Loaded font: {font_name} at size {font_size}")
                     return font
                 elif font_path.lower().endswith('.bdf'):
                     # PIL's ImageFont.truetype() can sometimes handle BDF files
                     # If it fails, we'll fall through to the default font
                     try:
-                        font = ImageFont.truetype(font_path, font_size)
+                        font = load_truetype_font(font_path, font_size)
                         self.logger.debug(f"Loaded BDF font: {font_name} at size {font_size}")
                         return font
                     except Exception:
@@ -252,7 +295,7 @@ class SportsCore(ABC):
         default_font_path = os.path.join('assets', 'fonts', 'PressStart2P-Regular.ttf')
         try:
             if os.path.exists(default_font_path):
-                return ImageFont.truetype(default_font_path, font_size)
+                return load_truetype_font(default_font_path, font_size)
             else:
                 self.logger.warning("Default font not found, using PIL default")
                 return ImageFont.load_default()
@@ -272,6 +315,15 @@ class SportsCore(ABC):
         Returns:
             Offset value from config or default (always returns int)
         """
+        # The layouts read a dozen offsets per frame; resolve each one once
+        key = (element, axis, default)
+        offset = self._layout_offset_cache.get(key)
+        if offset is None:
+            offset = self._layout_offset_cache[key] = self._resolve_layout_offset(element, axis, default)
+        return offset
+
+    def _resolve_layout_offset(self, element: str, axis: str, default: int = 0) -> int:
+        """Read one layout offset from customization.layout (see _get_layout_offset)."""
         try:
             layout_config = self.config.get('customization', {}).get('layout', {})
             element_config = layout_config.get(element, {})
@@ -323,12 +375,12 @@ class SportsCore(ABC):
             self.logger.error(f"Error loading fonts: {e}, using defaults")
             # Fallback to hardcoded defaults
             try:
-                fonts["score"] = ImageFont.truetype("assets/fonts/PressStart2P-Regular.ttf", 10)
-                fonts["time"] = ImageFont.truetype("assets/fonts/PressStart2P-Regular.ttf", 8)
-                fonts["team"] = ImageFont.truetype("assets/fonts/PressStart2P-Regular.ttf", 8)
-                fonts["status"] = ImageFont.truetype("assets/fonts/4x6-font.ttf", 6)
-                fonts["detail"] = ImageFont.truetype("assets/fonts/4x6-font.ttf", 6)
-                fonts["rank"] = ImageFont.truetype("assets/fonts/PressStart2P-Regular.ttf", 10)
+                fonts["score"] = load_truetype_font("assets/fonts/PressStart2P-Regular.ttf", 10)
+                fonts["time"] = load_truetype_font("assets/fonts/PressStart2P-Regular.ttf", 8)
+                fonts["team"] = load_truetype_font("assets/fonts/PressStart2P-Regular.ttf", 8)
+                fonts["status"] = load_truetype_font("assets/fonts/4x6-font.ttf", 6)
+                fonts["detail"] = load_truetype_font("assets/fonts/4x6-font.ttf", 6)
+                fonts["rank"] = load_truetype_font("assets/fonts/PressStart2P-Regular.ttf", 10)
             except IOError:
                 self.logger.warning("Fonts not found, using default PIL font.")
                 fonts["score"] = ImageFont.load_default()
@@ -337,6 +389,7 @@ class SportsCore(ABC):
                 fonts["status"] = ImageFont.load_default()
                 fonts["detail"] = ImageFont.load_default()
                 fonts["rank"] = ImageFont.load_default()
+        prerender_outlined_text(STATIC_STATUS_TEXTS, [fonts["status"], fonts["time"]])
         return fonts
 
     def _draw_dynamic_odds(
@@ -407,7 +460,7 @@ class SportsCore(ABC):
 
                 if favored_side == "home":
                     # Home team is favored, show spread on right side
-                    spread_width = draw.textlength(spread_text, font=font)
+                    spread_width = get_text_width(spread_text, font)
                     spread_x = width - spread_width  # Top right
                     spread_y = 0
                     self._draw_text_with_outline(
@@ -432,7 +485,7 @@ class SportsCore(ABC):
             if over_under is not None and isinstance(over_under, (int, float)):
                 ou_text = f"O/U: {over_under}"
                 font = self.fonts["detail"]  # Use detail font for odds
-                ou_width = draw.textlength(ou_text, font=font)
+                ou_width = get_text_width(ou_text, font)
 
                 if favored_side == "home":
                     # Home favored, show O/U on left side (opposite of spread)
@@ -467,29 +520,21 @@ class SportsCore(ABC):
         self, draw, text, position, font, fill=(255, 255, 255), outline_color=(0, 0, 0)
     ):
         """Draw text with a black outline for better readability."""
-        x, y = position
-        for dx, dy in [
-            (-1, -1),
-            (-1, 0),
-            (-1, 1),
-            (0, -1),
-            (0, 1),
-            (1, -1),
-            (1, 0),
-            (1, 1),
-        ]:
-            draw.text((x + dx, y + dy), text, font=font, fill=outline_color)
-        draw.text((x, y), text, font=font, fill=fill)
+        draw_text_with_outline(draw, text, position, font, fill, outline_color)
 
     def _load_and_resize_logo(
         self, team_id: str, team_abbrev: str, logo_path: Path, logo_url: str | None
     ) -> Optional[Image.Image]:
         """Load and resize a team logo, with caching and automatic download if missing."""
-        self.logger.debug(f"Logo path: {logo_path}")
-        if team_abbrev in self._logo_cache:
-            self.logger.debug(f"Using cached logo for {team_abbrev}")
-            return self._logo_cache[team_abbrev]
+        logo = self._logo_cache.get(team_abbrev)
+        if logo is not None:
+            return logo
+        # Called every frame; don't re-probe the disk or re-download a logo
+        # that just failed
+        if time.time() < self._logo_retry_at.get(team_abbrev, 0):
+            return None
 
+        self.logger.debug("Logo path: %s", logo_path)
         try:
             # Try different filename variations first (for cases like TA&M vs TAANDM)
             actual_logo_path = None
@@ -497,25 +542,35 @@ class SportsCore(ABC):
                 team_abbrev
             )
 
+            # Look the names up in the directory listing rather than stat()ing
+            # each one; re-list once before treating the logo as missing
+            logo_dir = logo_path.parent
+            existing = get_logo_dir_index(logo_dir)
+            if logo_path.name not in existing and not any(
+                filename in existing for filename in filename_variations
+            ):
+                existing = get_logo_dir_index(logo_dir, refresh=True)
+
             for filename in filename_variations:
-                test_path = logo_path.parent / filename
-                if test_path.exists():
-                    actual_logo_path = test_path
+                if filename in existing:
+                    actual_logo_path = logo_dir / filename
                     self.logger.debug(
                         f"Found logo at alternative path: {actual_logo_path}"
                     )
                     break
 
             # If no variation found, try to download missing logo
-            if not actual_logo_path and not logo_path.exists():
+            if not actual_logo_path and logo_path.name not in existing:
                 self.logger.info(
                     f"Logo not found for {team_abbrev} at {logo_path}. Attempting to download."
                 )
 
                 # Try to download the logo from ESPN API (this will create placeholder if download fails)
                 download_missing_logo(
-                    self.sport_key, team_id, team_abbrev, logo_path, logo_url
+                    self.sport_key, team_id, team_abbrev, logo_path, logo_url,
+                    session=self.session,
                 )
+                get_logo_dir_index(logo_dir, refresh=True)
                 actual_logo_path = logo_path
 
             # Use the original path if no alternative was found
@@ -523,28 +578,180 @@ class SportsCore(ABC):
                 actual_logo_path = logo_path
 
             # Only try to open the logo if the file exists
-            if os.path.exists(actual_logo_path):
-                logo = Image.open(actual_logo_path)
-            else:
+            if not os.path.exists(actual_logo_path):
                 self.logger.error(
                     f"Logo file still doesn't exist at {actual_logo_path} after download attempt"
                 )
+                self._logo_retry_at[team_abbrev] = time.time() + LOGO_RETRY_INTERVAL
                 return None
-            if logo.mode != "RGBA":
-                logo = logo.convert("RGBA")
-
-            max_width = int(self.display_width * 1.5)
-            max_height = int(self.display_height * 1.5)
-            logo.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+            logo = load_resized_logo(
+                actual_logo_path,
+                int(self.display_width * 1.5),
+                int(self.display_height * 1.5),
+                self._logo_resample,
+            )
             self._logo_cache[team_abbrev] = logo
+            self._logo_retry_at.pop(team_abbrev, None)
             return logo
 
         except Exception as e:
             self.logger.error(
                 f"Error loading logo for {team_abbrev}: {e}", exc_info=True
             )
+            self._logo_retry_at[team_abbrev] = time.time() + LOGO_RETRY_INTERVAL
             return None
 
+    def preload_logos(self, games: List[Dict]) -> None:
+        """
+        Load and resize the logos of every team in games ahead of display.
+
+        Called after a refresh from the update worker thread, so the first frame
+        of a newly selected game finds its logos in _logo_cache instead of
+        decoding and resampling them on the display thread.
+        """
+        for game in games:
+            for side in ("home", "away"):
+                abbr = game.get(f"{side}_abbr")
+                logo_path = game.get(f"{side}_logo_path")
+                if abbr and logo_path and abbr not in self._logo_cache:
+                    self._load_and_resize_logo(
+                        game.get(f"{side}_id"),
+                        abbr,
+                        logo_path,
+                        game.get(f"{side}_logo_url"),
+                    )
+
+    def _get_logo_base_frame(
+        self,
+        size: tuple,
+        home_abbr: str,
+        home_logo: Image.Image,
+        home_pos: tuple,
+        away_abbr: str,
+        away_logo: Image.Image,
+        away_pos: tuple,
+    ) -> Image.Image:
+        """
+        Get the black RGB base frame with both team logos pasted.
+
+        Logos only change with the matchup, so the pasted frame is cached and
+        reused until a different logo image or position is requested; the
+        logos' alpha blend is paid once per matchup rather than per frame.
+        The returned image is shared; callers must not draw on it (see
+        _compose_output_frame).
+        """
+        key = (size, home_abbr, home_pos, away_abbr, away_pos)
+        cached = self._base_frame_cache.get(key)
+        if cached is not None and cached[0] is home_logo and cached[1] is away_logo:
+            return cached[2]
+
+        frame = Image.new("RGB", size, (0, 0, 0))
+        frame.paste(home_logo, home_pos, home_logo)
+        frame.paste(away_logo, away_pos, away_logo)
+        return self._base_frame_cache.put(key, (home_logo, away_logo, frame))[2]
+
+    def _compose_output_frame(
+        self, base: Image.Image, overlay: Optional[Image.Image] = None
+    ) -> Image.Image:
+        """
+        Blend the RGBA text overlay (if any) onto the base frame for display.
+
+        Writes into an RGB buffer kept per manager instead of allocating an
+        alpha_composite result and its RGB conversion every frame. The buffer
+        is fully repainted on each call, so handing it to the display manager
+        without a copy is safe. The masked paste already skips transparent
+        overlay pixels; cropping to the overlay's bbox first does not pay off
+        because the records and timeouts span the full width.
+        """
+        out = self._output_frame
+        if out is None or out.size != base.size:
+            out = self._output_frame = Image.new("RGB", base.size)
+        # The buffer no longer holds the last scorebug; its caller re-records it
+        self._last_scorebug = None
+        out.paste(base)
+        if overlay is not None:
+            out.paste(overlay, (0, 0), overlay)
+        return out
+
+    def _get_team_display_text(self, abbr: str, record: str) -> str:
+        """Get the text shown under a team: its ranking (replacing the record when both are enabled) or record."""
+        if self.show_ranking:
+            # Show nothing for unranked teams when rankings are enabled
+            rank = self._team_rankings_cache.get(abbr, 0)
+            return f"#{rank}" if rank > 0 else ""
+        if self.show_records:
+            return record
+        return ""
+
+    # Game fields drawn on the scorebug overlay; each layout lists its own
+    _SCOREBUG_FIELDS: Tuple[str, ...] = ()
+
+    def _get_scorebug_state(self, game: Dict) -> tuple:
+        """Snapshot everything the scorebug overlay draws for this game."""
+        rankings = self._team_rankings_cache if self.show_ranking else {}
+        return (
+            tuple(game.get(field) for field in self._SCOREBUG_FIELDS),
+            self.show_records,
+            self.show_ranking,
+            rankings.get(game.get("away_abbr", "")),
+            rankings.get(game.get("home_abbr", "")),
+        )
+
+    def _is_scorebug_current(
+        self, base_img: Image.Image, scorebug_state: tuple, force_clear: bool = False
+    ) -> bool:
+        """
+        Return True if the display still holds the frame last drawn for this state.
+
+        Nothing drawn has changed and no other manager has replaced the display
+        image since, so the caller can push it again instead of redrawing.
+        """
+        last_scorebug = self._last_scorebug
+        return (
+            not force_clear
+            and last_scorebug is not None
+            and last_scorebug[0] is base_img
+            and last_scorebug[1] == scorebug_state
+            and self.display_manager.image is self._output_frame
+        )
+
+    def _get_overlay_canvas(self, size: tuple) -> tuple:
+        """
+        Get the per-manager RGBA text overlay and its ImageDraw, cleared.
+
+        The scorebug layouts draw into one persistent overlay instead of
+        allocating a new image and ImageDraw every frame. The overlay is only
+        valid until the next call; it is consumed by _compose_output_frame
+        within the same draw.
+        """
+        canvas = self._overlay_canvas
+        if canvas is None or canvas[0].size != size:
+            overlay = Image.new("RGBA", size, (0, 0, 0, 0))
+            canvas = self._overlay_canvas = (overlay, ImageDraw.Draw(overlay))
+        else:
+            canvas[0].paste((0, 0, 0, 0), (0, 0) + tuple(size))
+        return canvas
+
+    def _get_message_frame(
+        self, message: str, size: tuple, position: tuple = (5, 5)
+    ) -> Image.Image:
+        """
+        Get a black RGB frame with an outlined status message, rendered once.
+
+        Used for static placeholder screens such as the logo error frame. The
+        returned image is shared; pass it through _compose_output_frame (or
+        paste it) rather than handing it to the display manager directly.
+        """
+        key = (message, size, position)
+        frame = self._message_frame_cache.get(key)
+        if frame is None:
+            frame = Image.new("RGB", size, (0, 0, 0))
+            self._draw_text_with_outline(
+                ImageDraw.Draw(frame), message, position, self.fonts["status"]
+            )
+            self._message_frame_cache.put(key, frame)
+        return frame
+
     def _fetch_odds(self, game: Dict) -> None:
         """Fetch odds for a specific game using async threading to prevent blocking."""
         try:
@@ -676,6 +883,53 @@ class SportsCore(ABC):
             self.logger.error(f"Error fetching team rankings: {e}")
             return {}
 
+    def _parse_start_time(self, game_date_str: str) -> Tuple[Optional[datetime], str, str]:
+        """
+        Parse an ESPN event date into (start_time_utc, game_time, game_date).
+        
+        The local time/date strings depend only on the raw date and the
+        manager's (fixed) timezone and date format, so results are memoized.
+        """
+        cached = self._start_time_cache.get(game_date_str)
+        if cached is not None:
+            return cached
+        
+        start_time_utc = None
+        try:
+            # Parse the datetime string
+            iso_str = game_date_str
+            if iso_str.endswith('Z'):
+                iso_str = iso_str.replace('Z', '+00:00')
+            dt = datetime.fromisoformat(iso_str)
+            # Ensure the datetime is UTC-aware (fromisoformat may create timezone-aware but not pytz.UTC)
+            if dt.tzinfo is None:
+                # If naive, assume it's UTC
+                start_time_utc = dt.replace(tzinfo=pytz.UTC)
+            else:
+                # Convert to pytz.UTC for consistency
+                start_time_utc = dt.astimezone(pytz.UTC)
+        except ValueError:
+            self.logger.warning("Could not parse game date: %s", game_date_str)
+
+        game_time, game_date = "", ""
+        if start_time_utc:
+            local_time = start_time_utc.astimezone(self._get_timezone())
+            game_time = local_time.strftime("%I:%M%p").lstrip("0")
+
+            # Check date format from config
+            use_short_date_format = self.config.get("display", {}).get(
+                "use_short_date_format", False
+            )
+            if use_short_date_format:
+                game_date = local_time.strftime("%-m/%-d")
+            else:
+                # Note: display_manager.format_date_with_ordinal will be handled by plugin wrapper
+                game_date = local_time.strftime("%m/%d")  # Simplified for plugin
+
+        return self._start_time_cache.put(
+            game_date_str, (start_time_utc, game_time, game_date)
+        )
+
     def _extract_game_details_common(
         self, game_event: Dict
     ) -> tuple[Dict | None, Dict | None, Dict | None, Dict | None, Dict | None]:
@@ -693,30 +947,31 @@ class SportsCore(ABC):
                 self.logger.warning(f"No status data for game {game_event.get('id', 'unknown')}")
                 return None, None, None, None, None
             competitors = competition.get("competitors", [])
-            game_date_str = game_event["date"]
             situation = competition.get("situation")
-            start_time_utc = None
-            try:
-                # Parse the datetime string
-                if game_date_str.endswith('Z'):
-                    game_date_str = game_date_str.replace('Z', '+00:00')
-                dt = datetime.fromisoformat(game_date_str)
-                # Ensure the datetime is UTC-aware (fromisoformat may create timezone-aware but not pytz.UTC)
-                if dt.tzinfo is None:
-                    # If naive, assume it's UTC
-                    start_time_utc = dt.replace(tzinfo=pytz.UTC)
-                else:
-                    # Convert to pytz.UTC for consistency
-                    start_time_utc = dt.astimezone(pytz.UTC)
-            except ValueError:
-                self.logger.warning(f"Could not parse game date: {game_date_str}")
-
-            home_team = next(
-                (c for c in competitors if c.get("homeAway") == "home"), None
-            )
-            away_team = next(
-                (c for c in competitors if c.get("homeAway") == "away"), None
-            )
+            start_time_utc, game_time, game_date = self._parse_start_time(game_event["date"])
+
+            # Events normally carry exactly one home and one away competitor;
+            # otherwise fall back to a single pass where the first entry wins
+            home_team = away_team = None
+            if len(competitors) == 2:
+                first, second = competitors
+                first_side = first.get("homeAway")
+                second_side = second.get("homeAway")
+                if first_side == "home" and second_side == "away":
+                    home_team, away_team = first, second
+                elif first_side == "away" and second_side == "home":
+                    home_team, away_team = second, first
+            if home_team is None:
+                for competitor in competitors:
+                    home_away = competitor.get("homeAway")
+                    if home_away == "home":
+                        if home_team is None:
+                            home_team = competitor
+                    elif home_away == "away":
+                        if away_team is None:
+                            away_team = competitor
+                    if home_team is not None and away_team is not None:
+                        break
 
             if not home_team or not away_team:
                 self.logger.warning(
@@ -734,8 +989,9 @@ class SportsCore(ABC):
                 away_abbr = away_team["team"]["name"][:3]
 
             # Check if this is a favorite team game BEFORE doing expensive logging
-            is_favorite_game = self.favorite_teams and (
-                home_abbr in self.favorite_teams or away_abbr in self.favorite_teams
+            favorite_teams_set = self._favorite_teams_set
+            is_favorite_game = (
+                home_abbr in favorite_teams_set or away_abbr in favorite_teams_set
             )
 
             # Only log debug info for favorite team games
@@ -747,31 +1003,10 @@ class SportsCore(ABC):
                     f"Found teams: {away_abbr}@{home_abbr}, Status: {status['type']['name']}, State: {status['type']['state']}"
                 )
 
-            game_time, game_date = "", ""
-            if start_time_utc:
-                local_time = start_time_utc.astimezone(self._get_timezone())
-                game_time = local_time.strftime("%I:%M%p").lstrip("0")
-
-                # Check date format from config
-                use_short_date_format = self.config.get("display", {}).get(
-                    "use_short_date_format", False
-                )
-                if use_short_date_format:
-                    game_date = local_time.strftime("%-m/%-d")
-                else:
-                    # Note: display_manager.format_date_with_ordinal will be handled by plugin wrapper
-                    game_date = local_time.strftime("%m/%d")  # Simplified for plugin
-
-            home_record = (
-                home_team.get("records", [{}])[0].get("summary", "")
-                if home_team.get("records")
-                else ""
-            )
-            away_record = (
-                away_team.get("records", [{}])[0].get("summary", "")
-                if away_team.get("records")
-                else ""
-            )
+            home_records = home_team.get("records")
+            home_record = home_records[0].get("summary", "") if home_records else ""
+            away_records = away_team.get("records")
+            away_record = away_records[0].get("summary", "") if away_records else ""
 
             # Don't show "0-0" records - set to blank instead
             if home_record in {"0-0", "0-0-0"}:
@@ -779,24 +1014,31 @@ class SportsCore(ABC):
             if away_record in {"0-0", "0-0-0"}:
                 away_record = ""
 
+            # Flatten the status fields that filtering/sorting read per game
+            status_type = status["type"]
+            state = status_type["state"]
+            status_name = status_type["name"]
+
             details = {
                 "id": game_event.get("id"),
                 "game_time": game_time,
                 "game_date": game_date,
                 "start_time_utc": start_time_utc,
-                "status_text": status["type"][
+                "status_text": status_type[
                     "shortDetail"
                 ],  # e.g., "Final", "7:30 PM", "Q1 12:34"
-                "is_live": status["type"]["state"] == "in",
-                "is_final": status["type"]["state"] == "post",
+                "state": state,  # ESPN state: "pre", "in" or "post"
+                "status_name": status_name,
+                "is_live": state == "in",
+                "is_final": state == "post",
                 "is_upcoming": (
-                    status["type"]["state"] == "pre"
-                    or status["type"]["name"].lower()
+                    state == "pre"
+                    or status_name.lower()
                     in ["scheduled", "pre-game", "status_scheduled"]
                 ),
-                "is_halftime": status["type"]["state"] == "halftime"
-                or status["type"]["name"] == "STATUS_HALFTIME",  # Added halftime check
-                "is_period_break": status["type"]["name"]
+                "is_halftime": state == "halftime"
+                or status_name == "STATUS_HALFTIME",  # Added halftime check
+                "is_period_break": status_name
                 == "STATUS_END_PERIOD",  # Added Period Break check
                 "home_abbr": home_abbr,
                 "home_id": home_team["id"],
@@ -813,6 +1055,7 @@ class SportsCore(ABC):
                 / Path(f"{LogoDownloader.normalize_abbreviation(away_abbr)}.png"),
                 "away_logo_url": away_team["team"].get("logo"),
                 "is_within_window": True,  # Whether game is within display window
+                "is_favorite": is_favorite_game,  # Involves a favorite team (computed once here)
             }
             return details, home_team, away_team, status, situation
         except Exception as e:
@@ -828,26 +1071,121 @@ class SportsCore(ABC):
         details, _, _, _, _ = self._extract_game_details_common(game_event)
         return details
 
+    def _event_involves_favorite(self, game_event: Dict) -> bool:
+        """
+        Cheap favorite-team check on a raw ESPN event, before full extraction.
+
+        Uses the same abbreviation fallback as _extract_game_details_common.
+        Malformed events return True so extraction still sees (and logs) them.
+        """
+        try:
+            competitors = game_event["competitions"][0]["competitors"]
+        except (KeyError, IndexError, TypeError):
+            return True
+        favorite_teams_set = self._favorite_teams_set
+        for competitor in competitors:
+            team = competitor.get("team") or {}
+            abbr = team["abbreviation"] if "abbreviation" in team else team.get("name", "")[:3]
+            if abbr in favorite_teams_set:
+                return True
+        return False
+
     @abstractmethod
     def _fetch_data(self) -> Optional[Dict]:
         pass
 
+    def _get_json_if_modified(
+        self, cache_key: str, url: str, params: Dict[str, Any], timeout: int
+    ) -> Dict:
+        """
+        GET a JSON endpoint with If-None-Match/If-Modified-Since validators.
+
+        When ESPN answers 304 Not Modified, the payload parsed from the previous
+        200 response is returned without downloading or parsing the body again.
+        A 200 whose body hashes the same as last time is likewise not re-parsed.
+        Raises requests exceptions like session.get/raise_for_status, and
+        ValueError (json/orjson JSONDecodeError) for a body that is not JSON.
+        """
+        headers = self.headers
+        request_key = (url, tuple(sorted(params.items())))
+        validators = self._http_validators.get(cache_key)
+        if validators and validators[0] != request_key:
+            # Different date range than last time; the stored validators don't apply
+            validators = None
+        if validators and (validators[1] or validators[2]):
+            _, etag, last_modified, _, _ = validators
+            headers = dict(headers)
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        response = self.session.get(url, params=params, headers=headers, timeout=timeout)
+        if response.status_code == 304 and validators:
+            self.logger.debug("%s not modified, reusing previous payload", cache_key)
+            return validators[4]
+
+        response.raise_for_status()
+        digest = hashlib.blake2b(response.content, digest_size=16).digest()
+        if validators and validators[3] == digest:
+            self.logger.debug("%s body unchanged, reusing previous payload", cache_key)
+            data = validators[4]
+        else:
+            data = json_loads(response.content)
+        self._http_validators[cache_key] = (
+            request_key,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            digest,
+            data,
+        )
+        return data
+
+    def _get_today_str(self) -> str:
+        """Return today's local date as YYYYMMDD, formatting it at most once per day."""
+        current_time = time.time()
+        if current_time >= self._today_str_expires_at:
+            tm = time.localtime(current_time)
+            self._today_str = time.strftime("%Y%m%d", tm)
+            # Next local midnight; mktime normalizes day overflow and DST
+            self._today_str_expires_at = time.mktime(
+                (tm.tm_year, tm.tm_mon, tm.tm_mday + 1, 0, 0, 0, 0, 0, -1)
+            )
+        return self._today_str
+
+    def _refresh_utc_day(self) -> None:
+        """Recompute the UTC-date-derived keys once the UTC day has rolled over."""
+        current_time = time.time()
+        if current_time >= self._utc_day_expires_at:
+            tm = time.gmtime(current_time)
+            self._week_str = time.strftime("%G%V", tm)
+            # Seasons run August to February, so January-July belong to last year's
+            self._season_year = tm.tm_year if tm.tm_mon >= 8 else tm.tm_year - 1
+            self._utc_day_expires_at = (int(current_time) // 86400 + 1) * 86400
+
+    def _get_week_str(self) -> str:
+        """Return the current UTC ISO year and week (%G%V), formatting it at most once per UTC day."""
+        self._refresh_utc_day()
+        return self._week_str
+
+    def _get_season_year(self) -> int:
+        """Return the season year of the current UTC date (the year the season started)."""
+        self._refresh_utc_day()
+        return self._season_year
+
     def _fetch_todays_games(self) -> Optional[Dict]:
         """Fetch only today's games for live updates (not entire season)."""
         try:
-            now = datetime.now()
-            formatted_date = now.strftime("%Y%m%d")
+            formatted_date = self._get_today_str()
             # Fetch todays games only
             url = f"https://site.api.espn.com/apis/site/v2/sports/{self.sport}/{self.league}/scoreboard"
             self.logger.debug(f"Fetching today's games for {self.sport}/{self.league} on date {formatted_date}")
-            response = self.session.get(
+            data = self._get_json_if_modified(
+                f"{self.sport_key}_today",
                 url,
-                params={"dates": formatted_date, "limit": 1000},
-                headers=self.headers,
+                {"dates": formatted_date, "limit": 1000},
                 timeout=10,
             )
-            response.raise_for_status()
-            data = response.json()
             events = data.get("events", [])
 
             self.logger.info(
@@ -855,10 +1193,11 @@ class SportsCore(ABC):
             )
             
             # Log status of each game for debugging
-            if events:
+            if events and self.logger.isEnabledFor(logging.DEBUG):
                 for event in events:
-                    status = event.get("competitions", [{}])[0].get("status", {})
-                    status_type = status.get("type", {})
+                    competitions = event.get("competitions")
+                    status = (competitions[0] if competitions else EMPTY_DICT).get("status") or EMPTY_DICT
+                    status_type = status.get("type") or EMPTY_DICT
                     state = status_type.get("state", "unknown")
                     name = status_type.get("name", "unknown")
                     self.logger.debug(
@@ -867,7 +1206,7 @@ class SportsCore(ABC):
                     )
             
             return {"events": events}
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             self.logger.error(
                 f"API error fetching todays games for {self.sport} - {self.league}: {e}"
             )
@@ -878,30 +1217,46 @@ class SportsCore(ABC):
         Get partial data for immediate display while background fetch is in progress.
         This fetches current/recent games only for quick response.
         """
+        date_str = ""
         try:
-            # Fetch current week and next few days for immediate display
-            now = datetime.now(pytz.utc)
             immediate_events = []
 
+            # Recent and upcoming managers of a league both fall back to this
+            # while the season fetch is pending; share the result per week and
+            # judge freshness by when that entry was fetched, not by last_update.
+            cache_key = f"{self.sport_key}_weeks_{self._get_week_str()}"
+            cached = self.cache_manager.get(cache_key)
+            if (
+                isinstance(cached, dict)
+                and "fetched_at" in cached
+                and time.time() - cached["fetched_at"] < self.update_interval
+            ):
+                self.logger.debug("Using cached partial data for %s", cache_key)
+                return cached["data"]
+
+            # Fetch current week and next few days for immediate display
+            now = datetime.now(pytz.utc)
             start_date = now + timedelta(weeks=-2)
             end_date = now + timedelta(weeks=1)
             date_str = f"{start_date.strftime('%Y%m%d')}-{end_date.strftime('%Y%m%d')}"
             url = f"https://site.api.espn.com/apis/site/v2/sports/{self.sport}/{self.league}/scoreboard"
-            response = self.session.get(
+            data = self._get_json_if_modified(
+                f"{self.sport_key}_weeks",
                 url,
-                params={"dates": date_str, "limit": 1000},
-                headers=self.headers,
+                {"dates": date_str, "limit": 1000},
                 timeout=10,
             )
-            response.raise_for_status()
-            data = response.json()
             immediate_events = data.get("events", [])
 
             if immediate_events:
                 self.logger.info(f"Fetched {len(immediate_events)} events {date_str}")
-                return {"events": immediate_events}
+                partial_data = {"events": immediate_events}
+                self.cache_manager.set(
+                    cache_key, {"data": partial_data, "fetched_at": time.time()}
+                )
+                return partial_data
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             self.logger.warning(
                 f"Error fetching this weeks games for {self.sport} - {self.league} - {date_str}: {e}"
             )
@@ -910,23 +1265,36 @@ class SportsCore(ABC):
     def _custom_scorebug_layout(self, game: dict, draw_overlay: ImageDraw.ImageDraw):
         pass
 
+    def is_update_due(self, current_time: float) -> bool:
+        """Return True if update() would refresh data at current_time rather than no-op."""
+        return self.is_enabled and current_time - self.last_update >= self.update_interval
+
     def cleanup(self):
         """Clean up resources when plugin is unloaded."""
-        # Close HTTP session
-        if hasattr(self, 'session') and self.session:
-            try:
-                self.session.close()
-            except Exception as e:
-                self.logger.warning(f"Error closing session: {e}")
+        # HTTP session is shared by all managers (see get_shared_session), so it
+        # is left open here; closing it would drop other managers' connections.
 
         # Clear caches
         if hasattr(self, '_logo_cache'):
             self._logo_cache.clear()
+        if hasattr(self, '_logo_retry_at'):
+            self._logo_retry_at.clear()
+        if hasattr(self, '_start_time_cache'):
+            self._start_time_cache.clear()
+        if hasattr(self, '_base_frame_cache'):
+            self._base_frame_cache.clear()
+        if hasattr(self, '_message_frame_cache'):
+            self._message_frame_cache.clear()
 
         self.logger.info(f"{self.__class__.__name__} cleanup completed")
 
 
 class SportsUpcoming(SportsCore):
+    # Game fields drawn on the upcoming layout's overlay
+    _SCOREBUG_FIELDS = (
+        "game_date", "game_time", "odds", "away_record", "home_record",
+    )
+
     def __init__(
         self,
         config: Dict[str, Any],
@@ -962,8 +1330,7 @@ class SportsUpcoming(SportsCore):
         # Sort by start time for consistent priority
         sorted_games = sorted(
             processed_games,
-            key=lambda g: g.get("start_time_utc")
-            or datetime.max.replace(tzinfo=timezone.utc),
+            key=lambda g: g.get("start_time_utc") or _UTC_MAX,
         )
 
         if not favorite_teams:
@@ -973,6 +1340,10 @@ class SportsUpcoming(SportsCore):
         selected_games = []
         selected_ids = set()
         team_counts = {team: 0 for team in favorite_teams}
+        games_limit = self.upcoming_games_to_show
+        # Running count of favorites that reached games_limit, so the stop
+        # check below is O(1) instead of rescanning team_counts per game
+        teams_satisfied = len(team_counts) if games_limit <= 0 else 0
 
         for game in sorted_games:
             game_id = game.get("id")
@@ -982,15 +1353,16 @@ class SportsUpcoming(SportsCore):
             home = game.get("home_abbr")
             away = game.get("away_abbr")
 
-            home_fav = home in favorite_teams
-            away_fav = away in favorite_teams
+            # team_counts doubles as a hashed lookup of the favorites
+            home_fav = home in team_counts
+            away_fav = away in team_counts
 
             if not home_fav and not away_fav:
                 continue
 
             # Check if at least one favorite team still needs games
-            home_needs = home_fav and team_counts[home] < self.upcoming_games_to_show
-            away_needs = away_fav and team_counts[away] < self.upcoming_games_to_show
+            home_needs = home_fav and team_counts[home] < games_limit
+            away_needs = away_fav and team_counts[away] < games_limit
 
             if home_needs or away_needs:
                 selected_games.append(game)
@@ -999,15 +1371,19 @@ class SportsUpcoming(SportsCore):
                 # This is key: one game counts toward limits of BOTH teams if both are favorites
                 if home_fav:
                     team_counts[home] += 1
+                    if team_counts[home] == games_limit:
+                        teams_satisfied += 1
                 if away_fav:
                     team_counts[away] += 1
+                    if team_counts[away] == games_limit:
+                        teams_satisfied += 1
 
                 self.logger.debug(
-                    f"Selected game {away}@{home}: team_counts={team_counts}"
+                    "Selected game %s@%s: team_counts=%s", away, home, team_counts
                 )
 
             # Check if all favorites are satisfied
-            if all(c >= self.upcoming_games_to_show for c in team_counts.values()):
+            if teams_satisfied >= len(team_counts):
                 self.logger.debug("All favorite teams satisfied, stopping selection")
                 break
 
@@ -1046,9 +1422,13 @@ class SportsUpcoming(SportsCore):
 
             processed_games = []
             favorite_games_found = 0
-            all_upcoming_games = 0  # Count all upcoming games regardless of favorites
+            all_upcoming_games = 0  # Count all extracted upcoming games
+            # Non-favorite games would be dropped below, so skip their extraction
+            favorites_only = self.show_favorite_teams_only and bool(self.favorite_teams)
 
             for event in events:
+                if favorites_only and not self._event_involves_favorite(event):
+                    continue
                 game = self._extract_game_details(event)
                 # Count all upcoming games for debugging
                 if game and game["is_upcoming"]:
@@ -1060,17 +1440,11 @@ class SportsUpcoming(SportsCore):
                     # If show_favorite_teams_only is True, filter by favorite teams
                     # But if no favorite teams are configured, show all games (fallback)
                     if self.show_favorite_teams_only and self.favorite_teams:
-                        if (
-                            game["home_abbr"] not in self.favorite_teams
-                            and game["away_abbr"] not in self.favorite_teams
-                        ):
+                        if not game["is_favorite"]:
                             continue
                     processed_games.append(game)
                     # Count favorite team games for logging
-                    if self.favorite_teams and (
-                        game["home_abbr"] in self.favorite_teams
-                        or game["away_abbr"] in self.favorite_teams
-                    ):
+                    if game["is_favorite"]:
                         favorite_games_found += 1
                     if self.show_odds:
                         self._fetch_odds(game)
@@ -1100,12 +1474,13 @@ class SportsUpcoming(SportsCore):
                     processed_games, self.favorite_teams
                 )
             else:
-                # No favorite teams: show N total games sorted by time (schedule view)
-                team_games = sorted(
+                # No favorite teams: show N total games sorted by time (schedule view);
+                # a bounded heap selection, same result as sorting and slicing
+                team_games = heapq.nsmallest(
+                    self.upcoming_games_to_show,
                     processed_games,
-                    key=lambda g: g.get("start_time_utc")
-                    or datetime.max.replace(tzinfo=timezone.utc),
-                )[:self.upcoming_games_to_show]
+                    key=lambda g: g.get("start_time_utc") or _UTC_MAX,
+                )
                 self.logger.info(
                     f"No favorites configured: showing {len(team_games)} total upcoming games"
                 )
@@ -1192,14 +1567,6 @@ class SportsUpcoming(SportsCore):
             display_width = self.display_manager.matrix.width if hasattr(self.display_manager, 'matrix') and self.display_manager.matrix else self.display_width
             display_height = self.display_manager.matrix.height if hasattr(self.display_manager, 'matrix') and self.display_manager.matrix else self.display_height
             
-            main_img = Image.new(
-                "RGBA", (display_width, display_height), (0, 0, 0, 255)
-            )
-            overlay = Image.new(
-                "RGBA", (display_width, display_height), (0, 0, 0, 0)
-            )
-            draw_overlay = ImageDraw.Draw(overlay)
-
             home_logo = self._load_and_resize_logo(
                 game["home_id"],
                 game["home_abbr"],
@@ -1217,11 +1584,11 @@ class SportsUpcoming(SportsCore):
                 self.logger.error(
                     f"Failed to load logos for game: {game.get('id')}"
                 )  # Changed log prefix
-                draw_final = ImageDraw.Draw(main_img.convert("RGB"))
-                self._draw_text_with_outline(
-                    draw_final, "Logo Error", (5, 5), self.fonts["status"]
+                self.display_manager.image = self._compose_output_frame(
+                    self._get_message_frame(
+                        "Logo Error", (display_width, display_height)
+                    )
                 )
-                self.display_manager.image = main_img.convert("RGB")
                 self.display_manager.update_display()
                 return
 
@@ -1230,11 +1597,26 @@ class SportsUpcoming(SportsCore):
             # MLB-style logo positions with layout offsets
             home_x = display_width - home_logo.width + 2 + self._get_layout_offset('home_logo', 'x_offset')
             home_y = center_y - (home_logo.height // 2) + self._get_layout_offset('home_logo', 'y_offset')
-            main_img.paste(home_logo, (home_x, home_y), home_logo)
 
             away_x = -2 + self._get_layout_offset('away_logo', 'x_offset')
             away_y = center_y - (away_logo.height // 2) + self._get_layout_offset('away_logo', 'y_offset')
-            main_img.paste(away_logo, (away_x, away_y), away_logo)
+            main_img = self._get_logo_base_frame(
+                (display_width, display_height),
+                game["home_abbr"],
+                home_logo,
+                (home_x, home_y),
+                game["away_abbr"],
+                away_logo,
+                (away_x, away_y),
+            )
+
+            scorebug_state = self._get_scorebug_state(game)
+            if self._is_scorebug_current(main_img, scorebug_state, force_clear):
+                self.display_manager.update_display()
+                return
+
+            # Draw text elements on the (cleared) overlay first
+            overlay, draw_overlay = self._get_overlay_canvas((display_width, display_height))
 
             # Draw Text Elements on Overlay
             game_date = game.get("game_date", "")
@@ -1247,7 +1629,7 @@ class SportsUpcoming(SportsCore):
             if display_width > 128:
                 status_font = self.fonts["time"]
             status_text = "Next Game"
-            status_width = draw_overlay.textlength(status_text, font=status_font)
+            status_width = get_text_width(status_text, status_font)
             status_x = (display_width - status_width) // 2 + self._get_layout_offset('status_text', 'x_offset')
             status_y = 1 + self._get_layout_offset('status_text', 'y_offset')  # Changed from 2
             self._draw_text_with_outline(
@@ -1255,7 +1637,7 @@ class SportsUpcoming(SportsCore):
             )
 
             # Date text (centered, below "Next Game") with layout offsets
-            date_width = draw_overlay.textlength(game_date, font=self.fonts["time"])
+            date_width = get_text_width(game_date, self.fonts["time"])
             date_x = (display_width - date_width) // 2 + self._get_layout_offset('date', 'x_offset')
             # Adjust Y position to stack date and time nicely
             date_y = center_y - 7 + self._get_layout_offset('date', 'y_offset')  # Raise date slightly
@@ -1264,7 +1646,7 @@ class SportsUpcoming(SportsCore):
             )
 
             # Time text (centered, below Date) with layout offsets
-            time_width = draw_overlay.textlength(game_time, font=self.fonts["time"])
+            time_width = get_text_width(game_time, self.fonts["time"])
             time_x = (display_width - time_width) // 2 + self._get_layout_offset('time', 'x_offset')
             time_y = date_y + 9 + self._get_layout_offset('time', 'y_offset')  # Place time below date
             self._draw_text_with_outline(
@@ -1280,8 +1662,8 @@ class SportsUpcoming(SportsCore):
             # Draw records or rankings if enabled
             if self.show_records or self.show_ranking:
                 try:
-                    record_font = ImageFont.truetype("assets/fonts/4x6-font.ttf", 6)
-                    self.logger.debug(f"Loaded 6px record font successfully")
+                    record_font = load_truetype_font("assets/fonts/4x6-font.ttf", 6)
+                    self.logger.debug("Loaded 6px record font successfully")
                 except IOError:
                     record_font = ImageFont.load_default()
                     self.logger.warning(
@@ -1292,40 +1674,22 @@ class SportsUpcoming(SportsCore):
                 away_abbr = game.get("away_abbr", "")
                 home_abbr = game.get("home_abbr", "")
 
-                record_bbox = draw_overlay.textbbox((0, 0), "0-0", font=record_font)
+                record_bbox = get_text_bbox("0-0", record_font)
                 record_height = record_bbox[3] - record_bbox[1]
                 record_y = self.display_height - record_height + self._get_layout_offset('records', 'y_offset')
                 self.logger.debug(
-                    f"Record positioning: height={record_height}, record_y={record_y}, display_height={self.display_height}"
+                    "Record positioning: height=%s, record_y=%s, display_height=%s",
+                    record_height, record_y, self.display_height,
                 )
 
                 # Display away team info
                 if away_abbr:
-                    if self.show_ranking and self.show_records:
-                        # When both rankings and records are enabled, rankings replace records completely
-                        away_rank = self._team_rankings_cache.get(away_abbr, 0)
-                        if away_rank > 0:
-                            away_text = f"#{away_rank}"
-                        else:
-                            # Show nothing for unranked teams when rankings are prioritized
-                            away_text = ""
-                    elif self.show_ranking:
-                        # Show ranking only if available
-                        away_rank = self._team_rankings_cache.get(away_abbr, 0)
-                        if away_rank > 0:
-                            away_text = f"#{away_rank}"
-                        else:
-                            away_text = ""
-                    elif self.show_records:
-                        # Show record only when rankings are disabled
-                        away_text = game.get("away_record", "")
-                    else:
-                        away_text = ""
+                    away_text = self._get_team_display_text(away_abbr, game.get("away_record", ""))
 
                     if away_text:
                         away_record_x = 0 + self._get_layout_offset('records', 'away_x_offset')
                         self.logger.debug(
-                            f"Drawing away ranking '{away_text}' at ({away_record_x}, {record_y}) with font size {record_font.size if hasattr(record_font, 'size') else 'unknown'}"
+                            "Drawing away ranking '%s' at (%s, %s)", away_text, away_record_x, record_y
                         )
                         self._draw_text_with_outline(
                             draw_overlay,
@@ -1336,35 +1700,14 @@ class SportsUpcoming(SportsCore):
 
                 # Display home team info
                 if home_abbr:
-                    if self.show_ranking and self.show_records:
-                        # When both rankings and records are enabled, rankings replace records completely
-                        home_rank = self._team_rankings_cache.get(home_abbr, 0)
-                        if home_rank > 0:
-                            home_text = f"#{home_rank}"
-                        else:
-                            # Show nothing for unranked teams when rankings are prioritized
-                            home_text = ""
-                    elif self.show_ranking:
-                        # Show ranking only if available
-                        home_rank = self._team_rankings_cache.get(home_abbr, 0)
-                        if home_rank > 0:
-                            home_text = f"#{home_rank}"
-                        else:
-                            home_text = ""
-                    elif self.show_records:
-                        # Show record only when rankings are disabled
-                        home_text = game.get("home_record", "")
-                    else:
-                        home_text = ""
+                    home_text = self._get_team_display_text(home_abbr, game.get("home_record", ""))
 
                     if home_text:
-                        home_record_bbox = draw_overlay.textbbox(
-                            (0, 0), home_text, font=record_font
-                        )
+                        home_record_bbox = get_text_bbox(home_text, record_font)
                         home_record_width = home_record_bbox[2] - home_record_bbox[0]
                         home_record_x = self.display_width - home_record_width + self._get_layout_offset('records', 'home_x_offset')
                         self.logger.debug(
-                            f"Drawing home ranking '{home_text}' at ({home_record_x}, {record_y}) with font size {record_font.size if hasattr(record_font, 'size') else 'unknown'}"
+                            "Drawing home ranking '%s' at (%s, %s)", home_text, home_record_x, record_y
                         )
                         self._draw_text_with_outline(
                             draw_overlay,
@@ -1374,9 +1717,11 @@ class SportsUpcoming(SportsCore):
                         )
 
             # Composite and display
-            main_img = Image.alpha_composite(main_img, overlay)
-            main_img = main_img.convert("RGB")
-            self.display_manager.image.paste(main_img, (0, 0))
+            base_img = main_img
+            main_img = self._compose_output_frame(main_img, overlay)
+            # Assign directly like weather plugin does for full display coverage
+            self.display_manager.image = main_img
+            self._last_scorebug = (base_img, scorebug_state)
             self.display_manager.update_display()  # Update display here
 
         except Exception as e:
@@ -1452,6 +1797,11 @@ class SportsUpcoming(SportsCore):
 
 
 class SportsRecent(SportsCore):
+    # Game fields drawn on the recent layout's overlay
+    _SCOREBUG_FIELDS = (
+        "home_score", "away_score", "period_text", "game_date", "odds",
+        "away_record", "home_record",
+    )
 
     def __init__(
         self,
@@ -1498,8 +1848,7 @@ class SportsRecent(SportsCore):
         # Sort by start time, most recent first
         sorted_games = sorted(
             processed_games,
-            key=lambda g: g.get("start_time_utc")
-            or datetime.min.replace(tzinfo=timezone.utc),
+            key=lambda g: g.get("start_time_utc") or _UTC_MIN,
             reverse=True,
         )
 
@@ -1510,6 +1859,10 @@ class SportsRecent(SportsCore):
         selected_games = []
         selected_ids = set()
         team_counts = {team: 0 for team in favorite_teams}
+        games_limit = self.recent_games_to_show
+        # Running count of favorites that reached games_limit, so the stop
+        # check below is O(1) instead of rescanning team_counts per game
+        teams_satisfied = len(team_counts) if games_limit <= 0 else 0
 
         for game in sorted_games:
             game_id = game.get("id")
@@ -1519,15 +1872,16 @@ class SportsRecent(SportsCore):
             home = game.get("home_abbr")
             away = game.get("away_abbr")
 
-            home_fav = home in favorite_teams
-            away_fav = away in favorite_teams
+            # team_counts doubles as a hashed lookup of the favorites
+            home_fav = home in team_counts
+            away_fav = away in team_counts
 
             if not home_fav and not away_fav:
                 continue
 
             # Check if at least one favorite team still needs games
-            home_needs = home_fav and team_counts[home] < self.recent_games_to_show
-            away_needs = away_fav and team_counts[away] < self.recent_games_to_show
+            home_needs = home_fav and team_counts[home] < games_limit
+            away_needs = away_fav and team_counts[away] < games_limit
 
             if home_needs or away_needs:
                 selected_games.append(game)
@@ -1535,15 +1889,19 @@ class SportsRecent(SportsCore):
                 # Count game for ALL favorite teams involved
                 if home_fav:
                     team_counts[home] += 1
+                    if team_counts[home] == games_limit:
+                        teams_satisfied += 1
                 if away_fav:
                     team_counts[away] += 1
+                    if team_counts[away] == games_limit:
+                        teams_satisfied += 1
 
                 self.logger.debug(
-                    f"Selected recent game {away}@{home}: team_counts={team_counts}"
+                    "Selected recent game %s@%s: team_counts=%s", away, home, team_counts
                 )
 
             # Check if all favorites are satisfied
-            if all(c >= self.recent_games_to_show for c in team_counts.values()):
+            if teams_satisfied >= len(team_counts):
                 self.logger.debug("All favorite teams satisfied, stopping selection")
                 break
 
@@ -1587,7 +1945,12 @@ class SportsRecent(SportsCore):
 
             # Process games and filter for final games, date range & favorite teams
             processed_games = []
+            # _select_recent_games_for_display keeps only favorite games, so skip
+            # extracting the rest
+            favorites_only = self.show_favorite_teams_only and bool(self.favorite_teams)
             for event in events:
+                if favorites_only and not self._event_involves_favorite(event):
+                    continue
                 game = self._extract_game_details(event)
                 if not game:
                     continue
@@ -1659,7 +2022,7 @@ class SportsRecent(SportsCore):
                         )
                 else:
                     # Log why game was filtered out (only for favorite teams to reduce noise)
-                    if self.favorite_teams and (game.get("home_abbr") in self.favorite_teams or game.get("away_abbr") in self.favorite_teams):
+                    if game.get("is_favorite"):
                         self.logger.debug(
                             f"Game {game.get('away_abbr')}@{game.get('home_abbr')} "
                             f"not included: is_final={game.get('is_final')}, "
@@ -1679,12 +2042,11 @@ class SportsRecent(SportsCore):
                     )
             else:
                 # No favorites or show_favorite_teams_only disabled: show N total games sorted by time
-                team_games = sorted(
+                team_games = heapq.nlargest(
+                    self.recent_games_to_show,
                     processed_games,
-                    key=lambda g: g.get("start_time_utc")
-                    or datetime.min.replace(tzinfo=timezone.utc),
-                    reverse=True,
-                )[:self.recent_games_to_show]
+                    key=lambda g: g.get("start_time_utc") or _UTC_MIN,
+                )
                 self.logger.info(
                     f"No favorites configured: showing {len(team_games)} total recent games"
                 )
@@ -1752,14 +2114,6 @@ class SportsRecent(SportsCore):
             display_width = self.display_manager.matrix.width if hasattr(self.display_manager, 'matrix') and self.display_manager.matrix else self.display_width
             display_height = self.display_manager.matrix.height if hasattr(self.display_manager, 'matrix') and self.display_manager.matrix else self.display_height
             
-            main_img = Image.new(
-                "RGBA", (display_width, display_height), (0, 0, 0, 255)
-            )
-            overlay = Image.new(
-                "RGBA", (display_width, display_height), (0, 0, 0, 0)
-            )
-            draw_overlay = ImageDraw.Draw(overlay)
-
             home_logo = self._load_and_resize_logo(
                 game["home_id"],
                 game["home_abbr"],
@@ -1778,11 +2132,11 @@ class SportsRecent(SportsCore):
                     f"Failed to load logos for game: {game.get('id')}"
                 )  # Changed log prefix
                 # Draw placeholder text if logos fail (similar to live)
-                draw_final = ImageDraw.Draw(main_img.convert("RGB"))
-                self._draw_text_with_outline(
-                    draw_final, "Logo Error", (5, 5), self.fonts["status"]
+                self.display_manager.image = self._compose_output_frame(
+                    self._get_message_frame(
+                        "Logo Error", (display_width, display_height)
+                    )
                 )
-                self.display_manager.image = main_img.convert("RGB")
                 self.display_manager.update_display()
                 return
 
@@ -1791,11 +2145,26 @@ class SportsRecent(SportsCore):
             # MLB-style logo positioning (closer to edges) with layout offsets
             home_x = display_width - home_logo.width + 2 + self._get_layout_offset('home_logo', 'x_offset')
             home_y = center_y - (home_logo.height // 2) + self._get_layout_offset('home_logo', 'y_offset')
-            main_img.paste(home_logo, (home_x, home_y), home_logo)
 
             away_x = -2 + self._get_layout_offset('away_logo', 'x_offset')
             away_y = center_y - (away_logo.height // 2) + self._get_layout_offset('away_logo', 'y_offset')
-            main_img.paste(away_logo, (away_x, away_y), away_logo)
+            main_img = self._get_logo_base_frame(
+                (display_width, display_height),
+                game["home_abbr"],
+                home_logo,
+                (home_x, home_y),
+                game["away_abbr"],
+                away_logo,
+                (away_x, away_y),
+            )
+
+            scorebug_state = self._get_scorebug_state(game)
+            if self._is_scorebug_current(main_img, scorebug_state, force_clear):
+                self.display_manager.update_display()
+                return
+
+            # Draw text elements on the (cleared) overlay first
+            overlay, draw_overlay = self._get_overlay_canvas((display_width, display_height))
 
             # Draw Text Elements on Overlay
             # Note: Rankings are now handled in the records/rankings section below
@@ -1804,7 +2173,7 @@ class SportsRecent(SportsCore):
             home_score = str(game.get("home_score", "0"))
             away_score = str(game.get("away_score", "0"))
             score_text = f"{away_score}-{home_score}"
-            score_width = draw_overlay.textlength(score_text, font=self.fonts["score"])
+            score_width = get_text_width(score_text, self.fonts["score"])
             score_x = (display_width - score_width) // 2 + self._get_layout_offset('score', 'x_offset')
             score_y = (display_height // 2) - 3 + self._get_layout_offset('score', 'y_offset')  # Centered vertically, same as live games
             self._draw_text_with_outline(
@@ -1815,7 +2184,7 @@ class SportsRecent(SportsCore):
             # Use same font as upcoming games (time font) for consistency
             game_date = game.get("game_date", "")
             if game_date:
-                date_width = draw_overlay.textlength(game_date, font=self.fonts["time"])
+                date_width = get_text_width(game_date, self.fonts["time"])
                 date_x = (display_width - date_width) // 2 + self._get_layout_offset('date', 'x_offset')
                 # Position date at bottom of display, one line above the bottom edge
                 date_y = display_height - 7 + self._get_layout_offset('date', 'y_offset')  # One line above bottom edge
@@ -1827,7 +2196,7 @@ class SportsRecent(SportsCore):
             status_text = game.get(
                 "period_text", "Final"
             )  # Use formatted period text (e.g., "Final/OT") or default "Final"
-            status_width = draw_overlay.textlength(status_text, font=self.fonts["time"])
+            status_width = get_text_width(status_text, self.fonts["time"])
             status_x = (display_width - status_width) // 2 + self._get_layout_offset('status_text', 'x_offset')
             status_y = 1 + self._get_layout_offset('status_text', 'y_offset')
             self._draw_text_with_outline(
@@ -1843,8 +2212,8 @@ class SportsRecent(SportsCore):
             # Draw records or rankings if enabled
             if self.show_records or self.show_ranking:
                 try:
-                    record_font = ImageFont.truetype("assets/fonts/4x6-font.ttf", 6)
-                    self.logger.debug(f"Loaded 6px record font successfully")
+                    record_font = load_truetype_font("assets/fonts/4x6-font.ttf", 6)
+                    self.logger.debug("Loaded 6px record font successfully")
                 except IOError:
                     record_font = ImageFont.load_default()
                     self.logger.warning(
@@ -1855,40 +2224,22 @@ class SportsRecent(SportsCore):
                 away_abbr = game.get("away_abbr", "")
                 home_abbr = game.get("home_abbr", "")
 
-                record_bbox = draw_overlay.textbbox((0, 0), "0-0", font=record_font)
+                record_bbox = get_text_bbox("0-0", record_font)
                 record_height = record_bbox[3] - record_bbox[1]
                 record_y = self.display_height - record_height
                 self.logger.debug(
-                    f"Record positioning: height={record_height}, record_y={record_y}, display_height={self.display_height}"
+                    "Record positioning: height=%s, record_y=%s, display_height=%s",
+                    record_height, record_y, self.display_height,
                 )
 
                 # Display away team info
                 if away_abbr:
-                    if self.show_ranking and self.show_records:
-                        # When both rankings and records are enabled, rankings replace records completely
-                        away_rank = self._team_rankings_cache.get(away_abbr, 0)
-                        if away_rank > 0:
-                            away_text = f"#{away_rank}"
-                        else:
-                            # Show nothing for unranked teams when rankings are prioritized
-                            away_text = ""
-                    elif self.show_ranking:
-                        # Show ranking only if available
-                        away_rank = self._team_rankings_cache.get(away_abbr, 0)
-                        if away_rank > 0:
-                            away_text = f"#{away_rank}"
-                        else:
-                            away_text = ""
-                    elif self.show_records:
-                        # Show record only when rankings are disabled
-                        away_text = game.get("away_record", "")
-                    else:
-                        away_text = ""
+                    away_text = self._get_team_display_text(away_abbr, game.get("away_record", ""))
 
                     if away_text:
                         away_record_x = 0
                         self.logger.debug(
-                            f"Drawing away ranking '{away_text}' at ({away_record_x}, {record_y}) with font size {record_font.size if hasattr(record_font, 'size') else 'unknown'}"
+                            "Drawing away ranking '%s' at (%s, %s)", away_text, away_record_x, record_y
                         )
                         self._draw_text_with_outline(
                             draw_overlay,
@@ -1899,35 +2250,14 @@ class SportsRecent(SportsCore):
 
                 # Display home team info
                 if home_abbr:
-                    if self.show_ranking and self.show_records:
-                        # When both rankings and records are enabled, rankings replace records completely
-                        home_rank = self._team_rankings_cache.get(home_abbr, 0)
-                        if home_rank > 0:
-                            home_text = f"#{home_rank}"
-                        else:
-                            # Show nothing for unranked teams when rankings are prioritized
-                            home_text = ""
-                    elif self.show_ranking:
-                        # Show ranking only if available
-                        home_rank = self._team_rankings_cache.get(home_abbr, 0)
-                        if home_rank > 0:
-                            home_text = f"#{home_rank}"
-                        else:
-                            home_text = ""
-                    elif self.show_records:
-                        # Show record only when rankings are disabled
-                        home_text = game.get("home_record", "")
-                    else:
-                        home_text = ""
+                    home_text = self._get_team_display_text(home_abbr, game.get("home_record", ""))
 
                     if home_text:
-                        home_record_bbox = draw_overlay.textbbox(
-                            (0, 0), home_text, font=record_font
-                        )
+                        home_record_bbox = get_text_bbox(home_text, record_font)
                         home_record_width = home_record_bbox[2] - home_record_bbox[0]
                         home_record_x = display_width - home_record_width + self._get_layout_offset('records', 'home_x_offset')
                         self.logger.debug(
-                            f"Drawing home ranking '{home_text}' at ({home_record_x}, {record_y}) with font size {record_font.size if hasattr(record_font, 'size') else 'unknown'}"
+                            "Drawing home ranking '%s' at (%s, %s)", home_text, home_record_x, record_y
                         )
                         self._draw_text_with_outline(
                             draw_overlay,
@@ -1938,10 +2268,11 @@ class SportsRecent(SportsCore):
 
             self._custom_scorebug_layout(game, draw_overlay)
             # Composite and display
-            main_img = Image.alpha_composite(main_img, overlay)
-            main_img = main_img.convert("RGB")
+            base_img = main_img
+            main_img = self._compose_output_frame(main_img, overlay)
             # Assign directly like weather plugin does for full display coverage
             self.display_manager.image = main_img
+            self._last_scorebug = (base_img, scorebug_state)
             self.display_manager.update_display()  # Update display here
 
         except Exception as e:
@@ -2019,10 +2350,15 @@ class SportsLive(SportsCore):
         super().__init__(config, display_manager, cache_manager, logger, sport_key)
         self.update_interval = self.mode_config.get("live_update_interval", 15)
         self.no_data_interval = 300
+        # Used instead of no_data_interval once today's slate has no games left to start
+        self.idle_update_interval = self.mode_config.get("idle_update_interval", 1800)
+        # Whether the last fetch of today's games had any still scheduled ("pre")
+        self._games_pending_today = True
         # Log the configured interval for debugging
         self.logger.info(
             f"SportsLive initialized: live_update_interval={self.update_interval}s, "
             f"no_data_interval={self.no_data_interval}s, "
+            f"idle_update_interval={self.idle_update_interval}s, "
             f"mode_config keys={list(self.mode_config.keys())}"
         )
         self.last_update = 0
@@ -2043,15 +2379,20 @@ class SportsLive(SportsCore):
 
     def _is_game_really_over(self, game: Dict) -> bool:
         """Check if a game appears to be over even if API says it's live."""
-        game_str = f"{game.get('away_abbr')}@{game.get('home_abbr')}"
+        # Called per live game on every live-priority check from the display loop;
+        # only build the diagnostic strings when debug logging is enabled
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        game_str = f"{game.get('away_abbr')}@{game.get('home_abbr')}" if debug else ""
 
         # Check if period_text indicates final
         period_text = game.get("period_text", "").lower()
         if "final" in period_text:
-            self.logger.debug(
-                f"[LIVE_PRIORITY_DEBUG] _is_game_really_over({game_str}): "
-                f"returning True - 'final' in period_text='{period_text}'"
-            )
+            if debug:
+                self.logger.debug(
+                    "[LIVE_PRIORITY_DEBUG] _is_game_really_over(%s): "
+                    "returning True - 'final' in period_text='%s'",
+                    game_str, period_text,
+                )
             return True
 
         # Check if clock is 0:00 in Q4 or OT
@@ -2065,25 +2406,31 @@ class SportsLive(SportsCore):
         # Handle various clock formats: "0:00", ":00", "0", ":40" (stuck at :40)
         clock_normalized = clock.replace(":", "").strip()
 
-        self.logger.debug(
-            f"[LIVE_PRIORITY_DEBUG] _is_game_really_over({game_str}): "
-            f"raw_clock={raw_clock!r}, clock='{clock}', clock_normalized='{clock_normalized}', period={period}, period_text='{period_text}'"
-        )
+        if debug:
+            self.logger.debug(
+                "[LIVE_PRIORITY_DEBUG] _is_game_really_over(%s): "
+                "raw_clock=%r, clock='%s', clock_normalized='%s', period=%s, period_text='%s'",
+                game_str, raw_clock, clock, clock_normalized, period, period_text,
+            )
 
         if period >= 4:
             # In Q4 or OT, if clock is 0:00 or appears stuck (like :40), consider it over
             # Check for clock at 0:00 - various formats: "0:00", ":00", normalized "000"/"00"
             # Note: Clocks like ":40", ":50" are legitimate (under 1 minute remaining)
             if clock_normalized == "000" or clock_normalized == "00" or clock == "0:00" or clock == ":00":
-                self.logger.debug(
-                    f"[LIVE_PRIORITY_DEBUG] _is_game_really_over({game_str}): "
-                    f"returning True - clock appears to be 0:00 (clock='{clock}', normalized='{clock_normalized}', period={period})"
-                )
+                if debug:
+                    self.logger.debug(
+                        "[LIVE_PRIORITY_DEBUG] _is_game_really_over(%s): "
+                        "returning True - clock appears to be 0:00 (clock='%s', normalized='%s', period=%s)",
+                        game_str, clock, clock_normalized, period,
+                    )
                 return True
 
-        self.logger.debug(
-            f"[LIVE_PRIORITY_DEBUG] _is_game_really_over({game_str}): returning False"
-        )
+        if debug:
+            self.logger.debug(
+                "[LIVE_PRIORITY_DEBUG] _is_game_really_over(%s): returning False",
+                game_str,
+            )
         return False
 
     def _detect_stale_games(self, games: List[Dict]) -> None:
@@ -2119,15 +2466,8 @@ class SportsLive(SportsCore):
                 if game_id in self.game_update_timestamps:
                     del self.game_update_timestamps[game_id]
 
-    def update(self):
-        """Update live game data and handle game switching."""
-        if not self.is_enabled:
-            return
-
-        # Define current_time and interval before the problematic line (originally line 455)
-        # Ensure 'import time' is present at the top of the file.
-        current_time = time.time()
-
+    def _get_live_update_interval(self, current_time: float) -> float:
+        """Return the polling interval that applies at current_time."""
         # Define interval using a pattern similar to NFLLiveManager's update method.
         # Uses getattr for robustness, assuming attributes for live_games, test_mode,
         # no_data_interval, and update_interval are available on self.
@@ -2143,21 +2483,36 @@ class SportsLive(SportsCore):
         )  # Default similar to NFLLiveManager
 
         # For live managers, always use the configured live_update_interval when checking for updates.
-        # Only use no_data_interval if we've recently checked and confirmed there are no live games.
-        # This ensures we check for live games frequently even if the list is temporarily empty.
-        # Only use no_data_interval if we have no live games AND we've checked recently (within last 5 minutes)
-        time_since_last_update = current_time - self.last_update
-        has_recently_checked = self.last_update > 0 and time_since_last_update < 300
-        
+        # Only back off once a check has confirmed there are no live games:
+        # no_data_interval while games are still scheduled to start today, and
+        # idle_update_interval once today's slate is finished (or empty).
         if _live_games_attr or _test_mode_attr:
             # We have live games or are in test mode, use the configured update interval
             interval = _update_interval_attr
-        elif has_recently_checked:
-            # We've checked recently and found no live games, use longer interval
-            interval = _no_data_interval_attr
+        elif self.last_update > 0:
+            # We've checked and found no live games, use a longer interval
+            if self._games_pending_today:
+                interval = _no_data_interval_attr
+            else:
+                interval = self.idle_update_interval
         else:
-            # First check or haven't checked in a while, use update interval to check for live games
+            # First check, use update interval to check for live games
             interval = _update_interval_attr
+        return interval
+
+    def is_update_due(self, current_time: float) -> bool:
+        """Return True if update() would refresh data at current_time rather than no-op."""
+        return self.is_enabled and current_time - self.last_update >= self._get_live_update_interval(current_time)
+
+    def update(self):
+        """Update live game data and handle game switching."""
+        if not self.is_enabled:
+            return
+
+        # Define current_time and interval before the problematic line (originally line 455)
+        # Ensure 'import time' is present at the top of the file.
+        current_time = time.time()
+        interval = self._get_live_update_interval(current_time)
 
         # Original line from traceback (line 455), now with variables defined:
         if current_time - self.last_update >= interval:
@@ -2170,6 +2525,8 @@ class SportsLive(SportsCore):
             # Fetch live game data
             data = self._fetch_data()
             new_live_games = []
+            # Unknown until a fetch succeeds; assume games may still start
+            games_pending_today = True
             if not data:
                 self.logger.debug(f"No data returned from _fetch_data() for {self.sport_key}")
             elif "events" not in data:
@@ -2180,13 +2537,16 @@ class SportsLive(SportsCore):
                 
                 live_or_halftime_count = 0
                 filtered_out_count = 0
+                games_pending_today = False
                 
                 for game in data["events"]:
                     details = self._extract_game_details(game)
                     if details:
                         # Log game status for debugging - use INFO level to see what's happening
-                        status_state = game.get("competitions", [{}])[0].get("status", {}).get("type", {}).get("state", "unknown")
-                        status_name = game.get("competitions", [{}])[0].get("status", {}).get("type", {}).get("name", "unknown")
+                        status_state = details["state"]
+                        status_name = details["status_name"]
+                        if status_state == "pre":
+                            games_pending_today = True
                         self.logger.info(
                             f"[{self.sport_key.upper()} Live] Game {details.get('away_abbr', '?')}@{details.get('home_abbr', '?')}: "
                             f"state={status_state}, name={status_name}, is_live={details.get('is_live')}, "
@@ -2284,8 +2644,8 @@ class SportsLive(SportsCore):
                             else:
                                 # Favorite teams filtering is enabled AND favorites are configured
                                 # Only show games involving favorite teams
-                                home_match = home_abbr in self.favorite_teams
-                                away_match = away_abbr in self.favorite_teams
+                                home_match = home_abbr in self._favorite_teams_set
+                                away_match = away_abbr in self._favorite_teams_set
                                 should_include = home_match or away_match
                                 include_reason = (
                                     f"favorite_teams={self.favorite_teams}, "
@@ -2376,10 +2736,11 @@ class SportsLive(SportsCore):
                         current_game_ids = {g["id"] for g in self.live_games}
 
                         if new_game_ids != current_game_ids:
+                            # One fallback time for every game without a start time
+                            now_utc = datetime.now(timezone.utc)
                             self.live_games = sorted(
                                 new_live_games,
-                                key=lambda g: g.get("start_time_utc")
-                                or datetime.now(timezone.utc),
+                                key=lambda g: g.get("start_time_utc") or now_utc,
                             )  # Sort by start time
                             # Reset index if current game is gone or list is new
                             if (
@@ -2451,6 +2812,8 @@ class SportsLive(SportsCore):
                     )  # Changed log prefix
                     self.current_game = None  # Clear current game if fetch fails and no games were active
 
+            self._games_pending_today = games_pending_today
+
             # Handle game switching (outside test mode check, thread-safe)
             # Fix: Don't check for switching if last_game_switch is still 0 (games haven't been loaded yet)
             # This prevents immediate switching when the system has been running for a while before games load
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Tests for the conditional GETs in SportsCore._get_json_if_modified.
+
+These tests verify that:
+1. Validators from a 200 response are sent on the next request for the same key
+2. A 304 Not Modified reuses the previously parsed payload
+3. A 200 whose body is unchanged reuses the previous payload
+4. Validators are dropped when the request parameters (date range) change
+"""
+
+import sys
+import logging
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+# Add the plugin directory to Python path
+plugin_dir = Path(__file__).parent
+sys.path.insert(0, str(plugin_dir))
+
+# Add LEDMatrix src to path for imports
+ledmatrix_src = Path(__file__).parent.parent.parent / "LEDMatrix" / "src"
+sys.path.insert(0, str(ledmatrix_src))
+
+URL = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
+PARAMS = {"dates": "20251016", "limit": 1000}
+
+
+def create_response(status_code=200, content=b'{"events": []}', headers=None):
+    """Create a mock requests.Response."""
+    response = Mock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = headers or {}
+    response.raise_for_status = Mock()
+    return response
+
+
+@pytest.fixture
+def manager():
+    """
+    Create a live manager with only the state _get_json_if_modified uses.
+
+    The constructor needs the LEDMatrix core (logo downloader, config), which
+    the HTTP logic under test does not touch.
+    """
+    from nfl_managers import NFLLiveManager
+
+    manager = NFLLiveManager.__new__(NFLLiveManager)
+    manager.logger = logging.getLogger(__name__)
+    manager.headers = {"Accept": "application/json"}
+    manager._http_validators = {}
+    manager.session = Mock()
+    return manager
+
+
+def sent_headers(manager, call_index=-1):
+    """Return the headers passed to session.get on the given call."""
+    return manager.session.get.call_args_list[call_index].kwargs["headers"]
+
+
+class TestValidators:
+    """Tests for how validators are stored and sent."""
+
+    def test_first_request_sends_no_validators(self, manager):
+        """A key with no previous response should send the plain headers."""
+        manager.session.get.return_value = create_response()
+        manager._get_json_if_modified("nfl_today", URL, PARAMS, timeout=10)
+        headers = sent_headers(manager)
+        assert "If-None-Match" not in headers
+        assert "If-Modified-Since" not in headers
+
+    def test_validators_sent_on_next_request(self, manager):
+        """ETag and Last-Modified of a 200 should be sent back on the next request."""
+        manager.session.get.return_value = create_response(
+            headers={"ETag": '"abc"', "Last-Modified": "Thu, 16 Oct 2025 12:00:00 GMT"}
+        )
+        manager._get_json_if_modified("nfl_today", URL, PARAMS, timeout=10)
+        manager._get_json_if_modified("nfl_today", URL, PARAMS, timeout=10)
+        headers = sent_headers(manager)
+        assert headers["If-None-Match"] == '"abc"'
+        assert headers["If-Modified-Since"] == "Thu, 16 Oct 2025 12:00:00 GMT"
+
+    def test_validators_do_not_leak_into_shared_headers(self, manager):
+        """Conditional headers should be added to a copy, not to manager.headers."""
+        manager.session.get.return_value = create_response(headers={"ETag": '"abc"'})
+        manager._get_json_if_modified("nfl_today", URL, PARAMS, timeout=10)
+        manager._get_json_if_modified("nfl_today", URL, PARAMS, timeout=10)
+        assert "If-None-Match" not in manager.headers
+
+    def test_validators_are_kept_per_cache_key(self, manager):
+        """Another cache key should not send the first key's validators."""
+        manager.session.get.return_value = create_response(headers={"ETag": '"abc"'})
+        manager._get_json_if_modified("nfl_today", URL, PARAMS, timeout=10)
+        manager._get_json_if_modified("nfl_weeks", URL, PARAMS, timeout=10)
+        assert "If-None-Match" not in sent_headers(manager)
+
+    def test_changed_params_drop_validators(self, manager):
+        """A different date range should not send validators of the previous one."""
+        manager.session.get.return_value = create_response(headers={"ETag": '"abc"'})
+        manager._get_json_if_modified("nfl_today", URL, PARAMS, timeout=10)
+        next_day = {"dates": "20251017", "limit": 1000}
+        manager._get_json_if_modified("nfl_today", URL, next_day, timeout=10)
+        assert "If-None-Match" not in sent_headers(manager)
+
+
+class TestPayloadReuse:
+    """Tests for reusing the previously parsed payload."""
+
+    def test_not_modified_returns_previous_payload(self, manager):
+        """A 304 should return the payload parsed from the last 200."""
+        manager.session.get.side_effect = [
+            create_response(content=b'{"events": [{"id": "1"}]}', headers={"ETag": '"abc"'}),
+            create_response(status_code=304, content=b""),
+        ]
+        first = manager._get_json_if_modified("nfl_today", URL, PARAMS, timeout=10)
+        second = manager._get_json_if_modified("nfl_today", URL, PARAMS, timeout=10)
+        assert second is first
+        assert second == {"events": [{"id": "1"}]}
+
+    def test_unchanged_body_returns_previous_payload(self, manager):
+        """A 200 with the same body as last time should not be parsed again."""
+        body = b'{"events": [{"id": "1"}]}'
+        manager.session.get.side_effect = [
+            create_response(content=body),
+            create_response(content=body),
+        ]
+        first = manager._get_json_if_modified("nfl_today", URL, PARAMS, timeout=10)
+        second = manager._get_json_if_modified("nfl_today", URL, PARAMS, timeout=10)
+        assert second is first
+
+    def test_changed_body_is_parsed(self, manager):
+        """A 200 with a new body should return the new payload."""
+        manager.session.get.side_effect = [
+            create_response(content=b'{"events": [{"id": "1"}]}'),
+            create_response(content=b'{"events": [{"id": "2"}]}'),
+        ]
+        manager._get_json_if_modified("nfl_today", URL, PARAMS, timeout=10)
+        second = manager._get_json_if_modified("nfl_today", URL, PARAMS, timeout=10)
+        assert second == {"events": [{"id": "2"}]}
+
+    def test_body_hash_not_reused_across_params(self, manager):
+        """The same body for a different date range should still be parsed afresh."""
+        body = b'{"events": []}'
+        manager.session.get.side_effect = [
+            create_response(content=body),
+            create_response(content=body),
+        ]
+        first = manager._get_json_if_modified("nfl_today", URL, PARAMS, timeout=10)
+        next_day = {"dates": "20251017", "limit": 1000}
+        second = manager._get_json_if_modified("nfl_today", URL, next_day, timeout=10)
+        assert second is not first
+        assert second == first
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Tests for how often the live managers poll ESPN.
+
+These tests verify that SportsLive._get_live_update_interval uses:
+1. live_update_interval while live games are showing
+2. no_data_interval when nothing is live but a game is still to start today
+3. idle_update_interval once nothing is left to start today
+4. no_data_interval after a failed fetch, whatever the previous slate was
+"""
+
+import sys
+import logging
+import threading
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+# Add the plugin directory to Python path
+plugin_dir = Path(__file__).parent
+sys.path.insert(0, str(plugin_dir))
+
+# Add LEDMatrix src to path for imports
+ledmatrix_src = Path(__file__).parent.parent.parent / "LEDMatrix" / "src"
+sys.path.insert(0, str(ledmatrix_src))
+
+LIVE_INTERVAL = 30
+NO_DATA_INTERVAL = 300
+IDLE_INTERVAL = 1800
+
+
+def create_game(game_id, state):
+    """Create extracted game details in the given ESPN status state."""
+    return {
+        "id": game_id,
+        "state": state,
+        "status_name": {"pre": "STATUS_SCHEDULED", "in": "STATUS_IN_PROGRESS"}.get(
+            state, "STATUS_FINAL"
+        ),
+        "is_live": state == "in",
+        "is_halftime": False,
+        "is_final": state == "post",
+        "home_abbr": "TB",
+        "away_abbr": "DAL",
+        "home_score": "7",
+        "away_score": "3",
+        "clock": "10:00" if state == "in" else "",
+        "period": 2 if state == "in" else 0,
+        "status_text": "Q2 10:00" if state == "in" else "",
+    }
+
+
+@pytest.fixture
+def manager():
+    """
+    Create a live manager with only the state update() uses.
+
+    The constructor needs the LEDMatrix core (logo downloader, config), which
+    the polling logic under test does not touch. Events from _fetch_data are
+    passed through _extract_game_details unchanged.
+    """
+    from nfl_managers import NFLLiveManager
+
+    manager = NFLLiveManager.__new__(NFLLiveManager)
+    manager.logger = logging.getLogger(__name__)
+    manager.sport_key = "nfl"
+    manager.is_enabled = True
+    manager.test_mode = False
+    manager.show_ranking = False
+    manager.show_odds = False
+    manager.show_all_live = True
+    manager.show_favorite_teams_only = False
+    manager.favorite_teams = []
+    manager._favorite_teams_set = set()
+    manager.update_interval = LIVE_INTERVAL
+    manager.no_data_interval = NO_DATA_INTERVAL
+    manager.idle_update_interval = IDLE_INTERVAL
+    manager._games_pending_today = True
+    manager.last_update = 0
+    manager.live_games = []
+    manager.current_game = None
+    manager.current_game_index = 0
+    manager.last_game_switch = 0
+    manager.game_display_duration = 15
+    manager.last_log_time = 0
+    manager.log_interval = 300
+    manager.game_update_timestamps = {}
+    manager.stale_game_timeout = 600
+    manager._games_lock = threading.RLock()
+    manager._extract_game_details = lambda event: event
+    manager._is_game_really_over = Mock(return_value=False)
+    manager._fetch_data = Mock(return_value=None)
+    return manager
+
+
+def poll(manager, data):
+    """Run one update() that fetches data, and return the interval that follows."""
+    manager._fetch_data.return_value = data
+    manager.last_update = 0
+    manager.update()
+    return manager._get_live_update_interval(manager.last_update)
+
+
+class TestLiveUpdateInterval:
+    """Tests for SportsLive._get_live_update_interval after an update."""
+
+    def test_first_check_uses_live_interval(self, manager):
+        """Before anything has been fetched, poll at the live interval."""
+        assert manager._get_live_update_interval(0) == LIVE_INTERVAL
+
+    def test_live_games_use_live_interval(self, manager):
+        """A live game should keep polling at live_update_interval."""
+        data = {"events": [create_game("1", "in"), create_game("2", "post")]}
+        assert poll(manager, data) == LIVE_INTERVAL
+        assert [g["id"] for g in manager.live_games] == ["1"]
+
+    def test_pending_game_uses_no_data_interval(self, manager):
+        """No live games but a game still to start today: back off to no_data_interval."""
+        data = {"events": [create_game("1", "post"), create_game("2", "pre")]}
+        assert poll(manager, data) == NO_DATA_INTERVAL
+        assert manager.live_games == []
+
+    def test_finished_slate_uses_idle_interval(self, manager):
+        """Nothing live and nothing left to start today: back off to idle_update_interval."""
+        data = {"events": [create_game("1", "post"), create_game("2", "post")]}
+        assert poll(manager, data) == IDLE_INTERVAL
+
+    def test_empty_slate_uses_idle_interval(self, manager):
+        """A day without games should also use idle_update_interval."""
+        assert poll(manager, {"events": []}) == IDLE_INTERVAL
+
+    def test_failed_fetch_uses_no_data_interval(self, manager):
+        """A failed fetch should not keep the idle interval of an earlier finished slate."""
+        poll(manager, {"events": [create_game("1", "post")]})
+        assert poll(manager, None) == NO_DATA_INTERVAL
+
+    def test_idle_manager_is_not_due_before_idle_interval(self, manager):
+        """is_update_due should follow the idle interval once the slate is finished."""
+        poll(manager, {"events": [create_game("1", "post")]})
+        assert not manager.is_update_due(manager.last_update + NO_DATA_INTERVAL)
+        assert manager.is_update_due(manager.last_update + IDLE_INTERVAL)
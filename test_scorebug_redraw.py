@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for skipping unchanged scorebug redraws (SportsCore._is_scorebug_current).
+
+These tests verify that a scorebug is redrawn when:
+1. Any game field the layout draws (_SCOREBUG_FIELDS) changes
+2. The caller passes force_clear
+3. Another manager has replaced display_manager.image since our last frame
+and is pushed again unchanged otherwise.
+"""
+
+import sys
+import logging
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from PIL import Image
+
+# Add the plugin directory to Python path
+plugin_dir = Path(__file__).parent
+sys.path.insert(0, str(plugin_dir))
+
+# Add LEDMatrix src to path for imports
+ledmatrix_src = Path(__file__).parent.parent.parent / "LEDMatrix" / "src"
+sys.path.insert(0, str(ledmatrix_src))
+
+from nfl_managers import NFLLiveManager, NFLRecentManager, NFLUpcomingManager
+
+MANAGER_CLASSES = (NFLLiveManager, NFLRecentManager, NFLUpcomingManager)
+
+
+def create_game():
+    """Create a game with every drawn field set."""
+    return {
+        "id": "1", "home_abbr": "TB", "away_abbr": "DAL",
+        "home_score": "7", "away_score": "3", "period_text": "Q2", "clock": "10:00",
+        "status_text": "Final", "is_live": True, "is_halftime": False,
+        "is_period_break": False, "scoring_event": "", "down_distance_text": "1st & 10",
+        "down_distance_text_long": "1st & 10 at TB 25", "is_redzone": False,
+        "possession_indicator": "home", "away_timeouts": 3, "home_timeouts": 2,
+        "odds": None, "away_record": "3-4", "home_record": "5-2",
+        "game_date": "10/16", "game_time": "1:00PM",
+    }
+
+
+def create_manager(manager_class):
+    """
+    Create a manager with only the state the redraw check uses.
+
+    The constructor needs the LEDMatrix core (logo downloader, config), which
+    the redraw check does not touch.
+    """
+    manager = manager_class.__new__(manager_class)
+    manager.logger = logging.getLogger(__name__)
+    manager.show_records = True
+    manager.show_ranking = False
+    manager._team_rankings_cache = {}
+    manager._output_frame = None
+    manager._last_scorebug = None
+    manager.display_manager = Mock()
+    return manager
+
+
+def draw(manager, base_img, game):
+    """Record a drawn scorebug the way the layouts do, and show it."""
+    scorebug_state = manager._get_scorebug_state(game)
+    manager.display_manager.image = manager._compose_output_frame(base_img)
+    manager._last_scorebug = (base_img, scorebug_state)
+
+
+@pytest.fixture(params=MANAGER_CLASSES, ids=lambda cls: cls.__name__)
+def drawn(request):
+    """A manager whose last drawn frame is still on the display, with its base and game."""
+    manager = create_manager(request.param)
+    base_img = Image.new("RGB", (128, 32))
+    game = create_game()
+    draw(manager, base_img, game)
+    return manager, base_img, game
+
+
+class TestIsScorebugCurrent:
+    """Tests for SportsCore._is_scorebug_current."""
+
+    def test_nothing_drawn_yet(self):
+        """A manager that has not drawn anything must draw."""
+        manager = create_manager(NFLLiveManager)
+        state = manager._get_scorebug_state(create_game())
+        assert not manager._is_scorebug_current(Image.new("RGB", (128, 32)), state)
+
+    def test_unchanged_frame_is_current(self, drawn):
+        """Same base, same drawn fields, display untouched: push the last frame again."""
+        manager, base_img, game = drawn
+        state = manager._get_scorebug_state(dict(game))
+        assert manager._is_scorebug_current(base_img, state)
+
+    def test_every_drawn_field_forces_redraw(self, drawn):
+        """Changing any _SCOREBUG_FIELDS value must redraw."""
+        manager, base_img, game = drawn
+        assert manager._SCOREBUG_FIELDS
+        for field in manager._SCOREBUG_FIELDS:
+            changed = dict(game)
+            changed[field] = "changed"
+            state = manager._get_scorebug_state(changed)
+            assert not manager._is_scorebug_current(base_img, state), field
+
+    def test_undrawn_field_does_not_force_redraw(self, drawn):
+        """A field the layout does not draw should not cause a redraw."""
+        manager, base_img, game = drawn
+        changed = dict(game, unrelated_field="changed")
+        assert manager._is_scorebug_current(base_img, manager._get_scorebug_state(changed))
+
+    def test_force_clear_forces_redraw(self, drawn):
+        """force_clear must redraw even when nothing has changed."""
+        manager, base_img, game = drawn
+        state = manager._get_scorebug_state(game)
+        assert not manager._is_scorebug_current(base_img, state, force_clear=True)
+
+    def test_replaced_display_image_forces_redraw(self, drawn):
+        """Another manager drawing to the display must make us redraw."""
+        manager, base_img, game = drawn
+        manager.display_manager.image = Image.new("RGB", (128, 32))
+        assert not manager._is_scorebug_current(base_img, manager._get_scorebug_state(game))
+
+    def test_new_base_frame_forces_redraw(self, drawn):
+        """A different logo layer (new matchup or logo) must redraw."""
+        manager, _, game = drawn
+        state = manager._get_scorebug_state(game)
+        assert not manager._is_scorebug_current(Image.new("RGB", (128, 32)), state)
+
+    def test_composing_another_frame_forces_redraw(self, drawn):
+        """A placeholder composed into the output buffer invalidates the last scorebug."""
+        manager, base_img, game = drawn
+        manager.display_manager.image = manager._compose_output_frame(
+            Image.new("RGB", (128, 32))
+        )
+        assert not manager._is_scorebug_current(base_img, manager._get_scorebug_state(game))
+
+    def test_ranking_change_forces_redraw(self, drawn):
+        """A changed team ranking must redraw when rankings are shown."""
+        manager, base_img, game = drawn
+        manager.show_ranking = True
+        draw(manager, base_img, game)
+        manager._team_rankings_cache = {"TB": 5}
+        assert not manager._is_scorebug_current(base_img, manager._get_scorebug_state(game))